@@ -0,0 +1,351 @@
+# Local order book mirror fed by DSS MQTT price level topics
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import paho.mqtt.client as mqtt
+
+from econia_sdk.lib import EconiaViewer
+from econia_sdk.view.market import get_price_levels
+
+# Price levels per side published by the DSS MQTT publisher.
+DEFAULT_DEPTH = 10
+
+# Default port of the DSS MQTT broker when deployed with docker compose.
+DEFAULT_MQTT_PORT = 21883
+
+# Order event topics whose transaction versions show how far behind the
+# price level topics are.
+ORDER_EVENT_TOPICS = ("place_limit_order", "change_order_size", "cancel_order", "fill")
+
+# (price in ticks per lot, size in lots)
+Level = Tuple[int, int]
+
+_ASK_DIRECTIONS = ("ask", "sell")
+
+
+class _BookSide:
+    __slots__ = ("levels", "top", "version", "updated_at")
+
+    def __init__(self):
+        self.levels: Dict[int, Level] = {}  # Level number, from 1.
+        self.top: List[Level] = []  # Contiguous levels from 1.
+        self.version: Optional[int] = None
+        self.updated_at = 0.0
+
+    def set_levels(self, levels: List[Level]):
+        self.levels = {i + 1: level for i, level in enumerate(levels)}
+        self.top = levels
+        self.updated_at = time.monotonic()
+
+    def set_level(self, number: int, level: Level):
+        self.levels[number] = level
+        top: List[Level] = []
+        while len(top) + 1 in self.levels:
+            top.append(self.levels[len(top) + 1])
+        self.top = top
+        self.updated_at = time.monotonic()
+
+
+class OrderBookMirror:
+    """
+    Keeps the top `depth` price levels of each market in `market_ids`
+    in memory from the DSS MQTT publisher's `levels/MARKET_ID/#` topics,
+    so that best bid and ask are read locally instead of through a view
+    function call.
+
+    The DSS (with `MQTT_PRICE_LEVELS=yes`) republishes every level of
+    every market every 50 milliseconds, one message per level, tagged
+    with the last transaction version it has indexed. Each side of each
+    book tracks the version of its levels: a message for a newer version
+    starts a new snapshot of that side, messages for older versions are
+    dropped as stale, and a side not republished once newer versions
+    arrive for other books is taken to be empty. A gap, when a level
+    arrives before the ones above it in the same snapshot, triggers a
+    resnapshot of the market from `get_price_levels()`, as does the
+    order event feed running more than `max_lag` seconds ahead of the
+    price levels (for instance if level publishing is disabled).
+    Resnapshots are read at, and versioned like, the latest ledger
+    version, so they neither overwrite newer messages nor are taken over
+    by older ones. They run on a worker thread, and every book is
+    snapshotted on `connect()`.
+
+    `connect()` subscribes through its own `paho` client running on a
+    network thread; alternatively, feed messages from an existing client
+    to `on_message()`. Malformed messages are skipped and counted in
+    `undecodable`. Reads are lock-free: `get_bids()`, `get_asks()`,
+    `get_best_bid()` and `get_best_ask()` return `(price, size)` levels
+    from the last update.
+    """
+
+    viewer: EconiaViewer
+    market_ids: List[int]
+    depth: int
+    max_lag: float
+    stale_after: float
+    poll_interval: float
+    latest_version: Optional[int]
+    messages: int
+    stale_messages: int
+    undecodable: int
+    gaps: int
+    resnapshots: int
+    mqtt_client: Optional[mqtt.Client]
+    _books: Dict[int, Tuple[_BookSide, _BookSide]]
+    _event_versions: Dict[int, Tuple[int, float]]
+    _to_resnapshot: Set[int]
+    _lock: threading.Lock
+    _wake: threading.Event
+    _stop: threading.Event
+    _worker: Optional[threading.Thread]
+
+    def __init__(
+        self,
+        viewer: EconiaViewer,
+        market_ids: List[int],
+        depth: int = DEFAULT_DEPTH,
+        max_lag: float = 1.0,
+        stale_after: float = 0.5,
+        poll_interval: float = 0.1,
+    ):
+        self.viewer = viewer
+        self.market_ids = list(market_ids)
+        self.depth = depth
+        self.max_lag = max_lag
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.latest_version = None
+        self.messages = 0
+        self.stale_messages = 0
+        self.undecodable = 0
+        self.gaps = 0
+        self.resnapshots = 0
+        self.mqtt_client = None
+        self._books = {
+            market_id: (_BookSide(), _BookSide()) for market_id in self.market_ids
+        }
+        self._event_versions = {}
+        self._to_resnapshot = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def get_topics(self) -> List[str]:
+        topics = [f"levels/{market_id}/#" for market_id in self.market_ids]
+        for event_type in ORDER_EVENT_TOPICS:
+            topics += [f"{event_type}/{market_id}/#" for market_id in self.market_ids]
+        return topics
+
+    def connect(
+        self,
+        host: str,
+        port: int = DEFAULT_MQTT_PORT,
+        keepalive: int = 60,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        """
+        Snapshot every book, then subscribe to the DSS MQTT broker at
+        `host` on a network thread.
+        """
+        self.start()
+        client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        if username is not None:
+            client.username_pw_set(username, password)
+        client.on_connect = self._on_connect
+        client.on_message = lambda client, userdata, msg: self.on_message(
+            msg.topic, msg.payload
+        )
+        client.connect(host, port, keepalive)
+        client.loop_start()
+        self.mqtt_client = client
+
+    def start(self):
+        """
+        Start the resnapshot worker and snapshot every book, as done by
+        `connect()`. Only needed when feeding `on_message()` directly.
+        """
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        with self._lock:
+            self._to_resnapshot.update(self.market_ids)
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        self._wake.set()
+
+    def close(self):
+        if self.mqtt_client is not None:
+            self.mqtt_client.loop_stop()
+            self.mqtt_client.disconnect()
+            self.mqtt_client = None
+        if self._worker is not None:
+            self._stop.set()
+            self._wake.set()
+            self._worker.join()
+            self._worker = None
+
+    def _on_connect(self, client, userdata, flags, reason_code, properties):
+        client.subscribe([(topic, 1) for topic in self.get_topics()])
+        # Updates may have been missed while disconnected.
+        self.request_resnapshot(*self.market_ids)
+
+    def on_message(self, topic: str, payload: bytes):
+        """
+        Apply a price level or order event message.
+        """
+        parts = topic.split("/")
+        if len(parts) < 2:
+            return
+        try:
+            market_id = int(parts[1])
+        except ValueError:
+            return
+        if market_id not in self._books:
+            return
+        is_level = parts[0] == "levels" and len(parts) == 4
+        # Runs on the network thread, which an exception would stop.
+        try:
+            data = json.loads(payload)
+            txn_version = int(data["txn_version"])
+            if is_level:
+                number = int(parts[3])
+                level = (int(data["price"]), int(data["size"]))
+        except Exception:
+            with self._lock:
+                self.undecodable += 1
+            return
+        with self._lock:
+            self.messages += 1
+            if is_level:
+                self._on_level(market_id, parts[2], number, level, txn_version)
+            elif parts[0] in ORDER_EVENT_TOPICS:
+                self._on_event(market_id, txn_version)
+
+    def _on_level(
+        self, market_id: int, direction: str, number: int, level: Level, version: int
+    ):
+        if number > self.depth:
+            return
+        side = self._books[market_id][direction in _ASK_DIRECTIONS]
+        if side.version is not None and version < side.version:
+            self.stale_messages += 1
+            return
+        if side.version is None or version > side.version:
+            side.version = version
+            side.levels = {}
+        if self.latest_version is None or version > self.latest_version:
+            self.latest_version = version
+        side.set_level(number, level)
+        if len(side.top) < number:
+            self.gaps += 1
+            self._request_resnapshot(market_id)
+        lagging = self._event_versions.get(market_id)
+        if lagging is not None and lagging[0] <= version:
+            del self._event_versions[market_id]
+
+    def _on_event(self, market_id: int, version: int):
+        if self.latest_version is not None and version <= self.latest_version:
+            return
+        if market_id not in self._event_versions:
+            self._event_versions[market_id] = (version, time.monotonic())
+
+    def _request_resnapshot(self, market_id: int):
+        self._to_resnapshot.add(market_id)
+        self._wake.set()
+
+    def request_resnapshot(self, *market_ids: int):
+        """
+        Resnapshot the books of `market_ids` on the worker thread.
+        """
+        with self._lock:
+            for market_id in market_ids:
+                self._request_resnapshot(market_id)
+
+    def resnapshot(self, market_id: int):
+        """
+        Replace the book of `market_id` with price levels read from the
+        chain at its latest ledger version, until price level messages
+        for a later version arrive. A side that received messages for a
+        later version during the read keeps them instead.
+        """
+        ledger_version = int(self.viewer.aptos_client.info()["ledger_version"])
+        price_levels = get_price_levels(
+            self.viewer,
+            market_id,
+            self.depth,
+            self.depth,
+            ledger_version=ledger_version,
+        )
+        bids = [(level["price"], level["size"]) for level in price_levels["bids"]]
+        asks = [(level["price"], level["size"]) for level in price_levels["asks"]]
+        with self._lock:
+            for side, levels in zip(self._books[market_id], (bids, asks)):
+                if side.version is not None and side.version > ledger_version:
+                    continue
+                side.version = ledger_version
+                side.set_levels(levels)
+            self._event_versions.pop(market_id, None)
+            self.resnapshots += 1
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            now = time.monotonic()
+            with self._lock:
+                for market_id, (_, since) in self._event_versions.items():
+                    if now - since > self.max_lag:
+                        self._to_resnapshot.add(market_id)
+                market_ids = self._to_resnapshot
+                self._to_resnapshot = set()
+            for market_id in market_ids:
+                try:
+                    self.resnapshot(market_id)
+                except Exception:
+                    # Retried on the next pass.
+                    with self._lock:
+                        self._to_resnapshot.add(market_id)
+
+    def _get_side(self, market_id: int, is_ask: bool) -> List[Level]:
+        side = self._books[market_id][is_ask]
+        latest_version = self.latest_version
+        if (
+            side.version is not None
+            and latest_version is not None
+            and side.version < latest_version
+            and time.monotonic() - side.updated_at > self.stale_after
+        ):
+            return []
+        return side.top
+
+    def get_bids(self, market_id: int) -> List[Level]:
+        """
+        Bid levels of `market_id`, best first.
+        """
+        return self._get_side(market_id, False)
+
+    def get_asks(self, market_id: int) -> List[Level]:
+        """
+        Ask levels of `market_id`, best first.
+        """
+        return self._get_side(market_id, True)
+
+    def get_best_bid(self, market_id: int) -> Optional[Level]:
+        bids = self._get_side(market_id, False)
+        return bids[0] if len(bids) > 0 else None
+
+    def get_best_ask(self, market_id: int) -> Optional[Level]:
+        asks = self._get_side(market_id, True)
+        return asks[0] if len(asks) > 0 else None
+
+    def get_version(self, market_id: int) -> Optional[int]:
+        """
+        Transaction version of the newest price levels of `market_id`.
+        """
+        bid_side, ask_side = self._books[market_id]
+        versions = [v for v in (bid_side.version, ask_side.version) if v is not None]
+        return max(versions) if len(versions) > 0 else None
@@ -0,0 +1,227 @@
+# Cache of Econia's public constant getters
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
+
+PACKAGE_NAME = "Econia"
+
+# Every public constant getter exposed by the Econia Move modules.
+CONSTANT_GETTERS: List[Tuple[str, str]] = [
+    ("market", "get_ABORT"),
+    ("market", "get_ASK"),
+    ("market", "get_BID"),
+    ("market", "get_BUY"),
+    ("market", "get_CANCEL_BOTH"),
+    ("market", "get_CANCEL_MAKER"),
+    ("market", "get_CANCEL_TAKER"),
+    ("market", "get_FILL_OR_ABORT"),
+    ("market", "get_HI_PRICE"),
+    ("market", "get_IMMEDIATE_OR_CANCEL"),
+    ("market", "get_MAX_POSSIBLE"),
+    ("market", "get_NO_CUSTODIAN"),
+    ("market", "get_NO_RESTRICTION"),
+    ("market", "get_NO_UNDERWRITER"),
+    ("market", "get_POST_OR_ABORT"),
+    ("market", "get_PERCENT"),
+    ("market", "get_SELL"),
+    ("market", "get_TICKS"),
+    ("user", "get_ASK"),
+    ("user", "get_BID"),
+    ("user", "get_CANCEL_REASON_EVICTION"),
+    ("user", "get_CANCEL_REASON_IMMEDIATE_OR_CANCEL"),
+    ("user", "get_CANCEL_REASON_MANUAL_CANCEL"),
+    ("user", "get_CANCEL_REASON_MAX_QUOTE_TRADED"),
+    ("user", "get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY"),
+    ("user", "get_CANCEL_REASON_SELF_MATCH_MAKER"),
+    ("user", "get_CANCEL_REASON_SELF_MATCH_TAKER"),
+    ("user", "get_CANCEL_REASON_TOO_SMALL_TO_FILL_LOT"),
+    ("user", "get_CANCEL_REASON_VIOLATED_LIMIT_PRICE"),
+    ("user", "get_NO_CUSTODIAN"),
+    ("registry", "get_MAX_CHARACTERS_GENERIC"),
+    ("registry", "get_MIN_CHARACTERS_GENERIC"),
+    ("registry", "get_NO_CUSTODIAN"),
+    ("registry", "get_NO_UNDERWRITER"),
+]
+
+
+def _get_package_registry_request(view) -> str:
+    return f"{view.aptos_client.base_url}/accounts/{view.econia_address.hex()}/resource/0x1::code::PackageRegistry"
+
+
+def _convert_package_registry(value: dict) -> int:
+    for package in value["data"]["packages"]:
+        if package["name"] == PACKAGE_NAME:
+            return int(package["upgrade_number"])
+    raise Exception(f"No {PACKAGE_NAME} package published at Econia address")
+
+
+def get_upgrade_number(view: "EconiaViewer") -> int:
+    """
+    Return the on-chain upgrade number of the Econia package.
+    """
+    response = view.aptos_client.client.get(_get_package_registry_request(view))
+    if response.status_code >= 400:
+        raise Exception(response.text, response.status_code)
+    return _convert_package_registry(response.json())
+
+
+async def gen_get_upgrade_number(view: "AsyncEconiaViewer") -> int:
+    """
+    Async variant of `get_upgrade_number()`.
+    """
+    response = await view.aptos_client.client.get(_get_package_registry_request(view))
+    if response.status_code >= 400:
+        raise Exception(response.text, response.status_code)
+    return _convert_package_registry(response.json())
+
+
+class ConstantsRegistry:
+    """
+    Serves the returns of Econia's constant getters from memory.
+
+    The first lookup resolves every getter in `CONSTANT_GETTERS` with a
+    single batched warm-up, pinned to one ledger version, and records
+    the package upgrade number. Values are only dropped when a refresh
+    finds a different upgrade number, which is checked by `refresh()`
+    or, if `check_interval` is set, at most once per that many seconds
+    on lookup.
+
+    A registry can also be seeded from a `snapshot()` taken earlier,
+    keyed by Econia address and upgrade number, to skip the warm-up.
+    """
+
+    returns: Dict[Tuple[str, str], List]
+    upgrade_number: Optional[int]
+    check_interval: Optional[float]
+    _last_check: float
+    _lock: Optional[asyncio.Lock]
+
+    def __init__(self, check_interval: Optional[float] = None):
+        self.returns = {}
+        self.upgrade_number = None
+        self.check_interval = check_interval
+        self._last_check = 0.0
+        self._lock = None
+
+    def clear(self):
+        self.returns = {}
+        self.upgrade_number = None
+
+    def _check_due(self) -> bool:
+        return (
+            self.check_interval is not None
+            and time.monotonic() - self._last_check >= self.check_interval
+        )
+
+    def _update(self, upgrade_number: int, returns: List[List]):
+        self.returns = {}
+        for (module, function), value in zip(CONSTANT_GETTERS, returns):
+            self.returns[(module, function)] = value
+        self.upgrade_number = upgrade_number
+        self._last_check = time.monotonic()
+
+    def warm_up(self, view: "EconiaViewer"):
+        """
+        Resolve every constant getter with one batched request.
+        """
+        upgrade_number = get_upgrade_number(view)
+        returns = view.get_returns_batch(
+            [(module, function, [], []) for (module, function) in CONSTANT_GETTERS]
+        )
+        self._update(upgrade_number, returns)
+
+    async def gen_warm_up(self, view: "AsyncEconiaViewer"):
+        """
+        Async variant of `warm_up()`.
+        """
+        upgrade_number = await gen_get_upgrade_number(view)
+        returns = await view.get_returns_batch(
+            [(module, function, [], []) for (module, function) in CONSTANT_GETTERS]
+        )
+        self._update(upgrade_number, returns)
+
+    def refresh(self, view: "EconiaViewer") -> bool:
+        """
+        Re-read the package upgrade number and drop the cached values
+        if it changed. Returns `True` if the cache was invalidated.
+        """
+        upgrade_number = get_upgrade_number(view)
+        self._last_check = time.monotonic()
+        if upgrade_number == self.upgrade_number:
+            return False
+        self.clear()
+        return True
+
+    async def gen_refresh(self, view: "AsyncEconiaViewer") -> bool:
+        """
+        Async variant of `refresh()`.
+        """
+        upgrade_number = await gen_get_upgrade_number(view)
+        self._last_check = time.monotonic()
+        if upgrade_number == self.upgrade_number:
+            return False
+        self.clear()
+        return True
+
+    def get(self, view: "EconiaViewer", module: str, function: str) -> List:
+        """
+        Return the cached returns of constant getter `module::function`.
+        """
+        if self._check_due():
+            self.refresh(view)
+        key = (module, function)
+        if key not in self.returns:
+            self.warm_up(view)
+        if key not in self.returns:
+            self.returns[key] = view.get_returns(module, function)
+        return self.returns[key]
+
+    async def gen_get(
+        self, view: "AsyncEconiaViewer", module: str, function: str
+    ) -> List:
+        """
+        Async variant of `get()`.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        key = (module, function)
+        async with self._lock:
+            if self._check_due():
+                await self.gen_refresh(view)
+            if key not in self.returns:
+                await self.gen_warm_up(view)
+            if key not in self.returns:
+                self.returns[key] = await view.get_returns(module, function)
+        return self.returns[key]
+
+    def snapshot(self, econia_address: str) -> dict:
+        """
+        Return a JSON-serializable snapshot of the cached values.
+        """
+        return {
+            "econia_address": econia_address,
+            "upgrade_number": self.upgrade_number,
+            "returns": {
+                f"{module}::{function}": value
+                for (module, function), value in self.returns.items()
+            },
+        }
+
+    def load_snapshot(self, snapshot: dict, econia_address: str) -> bool:
+        """
+        Seed the cache from `snapshot()` output. Snapshots taken for a
+        different Econia address are ignored. Returns `True` if loaded.
+        """
+        if snapshot["econia_address"] != econia_address:
+            return False
+        self.returns = {}
+        for name, value in snapshot["returns"].items():
+            module, function = name.split("::")
+            self.returns[(module, function)] = value
+        self.upgrade_number = snapshot["upgrade_number"]
+        self._last_check = time.monotonic()
+        return True
@@ -0,0 +1,105 @@
+# Cache of market account event handle creation numbers
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+from aptos_sdk.account_address import AccountAddress
+
+# (user address, market ID, custodian ID)
+EventHandleKey = Tuple[str, int, int]
+
+
+class EventHandleCache:
+    """
+    Memoizes the event handle creation numbers of market accounts, as
+    returned by `econia_sdk.view.user.get_market_event_handle_creation_numbers()`.
+
+    Event handles never change once created, so entries are kept
+    indefinitely. Market accounts without event handles are not cached,
+    since their handles may be created later.
+
+    If `path` is set, the cache is read from that JSON file on
+    construction (when it exists and was written for the same Econia
+    address) and written back by `save()`, which requires
+    `econia_address`.
+    """
+
+    creation_numbers: Dict[EventHandleKey, dict]
+    path: Optional[str]
+    econia_address: Optional[AccountAddress]
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        econia_address: Optional[AccountAddress] = None,
+    ):
+        assert (
+            path is None or econia_address is not None
+        ), "No Econia address for event handle cache file!"
+        self.creation_numbers = {}
+        self.path = path
+        self.econia_address = econia_address
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def _get_key(
+        self, user: AccountAddress, market_id: int, custodian_id: int
+    ) -> EventHandleKey:
+        return (user.hex(), market_id, custodian_id)
+
+    def get(
+        self, user: AccountAddress, market_id: int, custodian_id: int
+    ) -> Optional[dict]:
+        return self.creation_numbers.get(self._get_key(user, market_id, custodian_id))
+
+    def put(
+        self,
+        user: AccountAddress,
+        market_id: int,
+        custodian_id: int,
+        creation_numbers: dict,
+    ):
+        key = self._get_key(user, market_id, custodian_id)
+        self.creation_numbers[key] = creation_numbers
+
+    def clear(self):
+        self.creation_numbers = {}
+
+    def save(self):
+        """
+        Write the cache to `self.path`.
+        """
+        assert self.path is not None, "No path to save event handle cache to!"
+        assert self.econia_address is not None, "No Econia address to save!"
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "econia_address": self.econia_address.hex(),
+                    "creation_numbers": [
+                        [user, market_id, custodian_id, creation_numbers]
+                        for (
+                            user,
+                            market_id,
+                            custodian_id,
+                        ), creation_numbers in self.creation_numbers.items()
+                    ],
+                },
+                f,
+            )
+
+    def load(self) -> bool:
+        """
+        Read the cache from `self.path`, ignoring files written for a
+        different Econia address. Returns `True` if loaded.
+        """
+        assert self.path is not None, "No path to load event handle cache from!"
+        assert self.econia_address is not None, "No Econia address to load!"
+        with open(self.path) as f:
+            data = json.load(f)
+        if data["econia_address"] != self.econia_address.hex():
+            return False
+        for user, market_id, custodian_id, creation_numbers in data["creation_numbers"]:
+            key = (user, int(market_id), int(custodian_id))
+            self.creation_numbers[key] = creation_numbers
+        return True
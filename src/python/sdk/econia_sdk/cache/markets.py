@@ -0,0 +1,338 @@
+# Cache of market parameters and coin decimals
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
+from econia_sdk.utils.decimals import get_price_integer, get_price_nominal
+from econia_sdk.view.registry import (
+    GetMarketInfoReturn,
+    _convert_market_info_value,
+    gen_get_coin_decimals,
+    gen_get_market_counts,
+    get_coin_decimals,
+    get_market_counts,
+)
+
+
+def _get_type_tag(type_info: dict) -> str:
+    address = type_info["package_address"].hex()
+    return f"{address}::{type_info['module_name']}::{type_info['type_name']}"
+
+
+class MarketInfoCache:
+    """
+    Memoizes `get_market_info()` and the decimals of each market's
+    coins for one viewer, so that price conversions only touch the
+    network on a cache miss.
+
+    `load_all()` resolves every registered market in one batched
+    request pinned to a single ledger version, then the decimals of
+    every distinct coin type concurrently. Market entries older than
+    `ttl` seconds are refetched on lookup, and the least recently used
+    entries are evicted beyond `max_size` markets. Coin decimals never
+    change, so they are kept for the lifetime of the cache. Entries are
+    converted once when cached, and price conversions keep the lot
+    size, tick size and decimals of each market they have used.
+
+    If `path` is set, the cache is read from that JSON file on
+    construction (when it exists and was written for the same Econia
+    address) and written back by `save()`.
+    """
+
+    view: Union[EconiaViewer, AsyncEconiaViewer]
+    ttl: Optional[float]
+    max_size: Optional[int]
+    path: Optional[str]
+    # (fetched_at, raw value, converted value)
+    markets: "OrderedDict[int, Tuple[float, dict, GetMarketInfoReturn]]"
+    decimals: Dict[str, int]  # keyed by coin type tag
+    # (lot_size, tick_size, base_decimals, quote_decimals) of cached markets
+    _price_params: Dict[int, Tuple[int, int, int, int]]
+
+    def __init__(
+        self,
+        view: Union[EconiaViewer, AsyncEconiaViewer],
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        path: Optional[str] = None,
+    ):
+        self.view = view
+        self.ttl = ttl
+        self.max_size = max_size
+        self.path = path
+        self.markets = OrderedDict()
+        self.decimals = {}
+        self._price_params = {}
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def clear(self):
+        self.markets = OrderedDict()
+        self.decimals = {}
+        self._price_params = {}
+
+    def save(self):
+        """
+        Write the cache to `self.path`.
+        """
+        assert self.path is not None, "No path to save market cache to!"
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "econia_address": self.view.econia_address.hex(),
+                    "markets": [
+                        [market_id, fetched_at, value]
+                        for market_id, (fetched_at, value, _) in self.markets.items()
+                    ],
+                    "decimals": self.decimals,
+                },
+                f,
+            )
+
+    def load(self) -> bool:
+        """
+        Read the cache from `self.path`, ignoring files written for a
+        different Econia address. Returns `True` if loaded.
+        """
+        assert self.path is not None, "No path to load market cache from!"
+        with open(self.path) as f:
+            data = json.load(f)
+        if data["econia_address"] != self.view.econia_address.hex():
+            return False
+        self.markets = OrderedDict()
+        self._price_params = {}
+        for market_id, fetched_at, value in data["markets"]:
+            self._put(int(market_id), value, fetched_at)
+        self.decimals.update(data["decimals"])
+        return True
+
+    def _put(
+        self, market_id: int, value: dict, fetched_at: Optional[float] = None
+    ) -> GetMarketInfoReturn:
+        if fetched_at is None:
+            fetched_at = time.time()
+        info = _convert_market_info_value(value)
+        self.markets[market_id] = (fetched_at, value, info)
+        self.markets.move_to_end(market_id)
+        self._price_params.pop(market_id, None)
+        if self.max_size is not None:
+            while len(self.markets) > self.max_size:
+                evicted_id, _ = self.markets.popitem(last=False)
+                self._price_params.pop(evicted_id, None)
+        return info
+
+    def _peek(self, market_id: int) -> Optional[GetMarketInfoReturn]:
+        entry = self.markets.get(market_id)
+        if entry is None:
+            return None
+        fetched_at, _, info = entry
+        if self.ttl is not None and time.time() - fetched_at >= self.ttl:
+            del self.markets[market_id]
+            self._price_params.pop(market_id, None)
+            return None
+        self.markets.move_to_end(market_id)
+        return info
+
+    def _get_missing_types(self, infos: List[GetMarketInfoReturn]) -> List[dict]:
+        missing: Dict[str, dict] = {}
+        for info in infos:
+            type_infos = [info["quote_type"]]
+            if info.is_coin_market(self.view):
+                type_infos.append(info["base_type"])
+            for type_info in type_infos:
+                type_tag = _get_type_tag(type_info)
+                if type_tag not in self.decimals:
+                    missing[type_tag] = type_info
+        return list(missing.values())
+
+    def _get_market_ids(self, n_markets: int) -> List[int]:
+        return list(range(1, n_markets + 1))
+
+    def load_all(self, max_workers: int = 10) -> int:
+        """
+        Resolve and cache every registered market and the decimals of
+        all their coins. Returns the number of markets loaded.
+        """
+        assert isinstance(self.view, EconiaViewer)
+        view = self.view
+        market_ids = self._get_market_ids(get_market_counts(view)["n_markets"])
+        returns = view.get_returns_batch(
+            [
+                ("registry", "get_market_info", [], [str(market_id)])
+                for market_id in market_ids
+            ],
+            max_workers=max_workers,
+        )
+        infos = [
+            self._put(market_id, value[0])
+            for market_id, value in zip(market_ids, returns)
+        ]
+        missing = self._get_missing_types(infos)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            decimals = list(
+                executor.map(
+                    lambda type_info: get_coin_decimals(view, type_info), missing
+                )
+            )
+        for type_info, n_decimals in zip(missing, decimals):
+            self.decimals[_get_type_tag(type_info)] = n_decimals
+        return len(market_ids)
+
+    async def gen_load_all(self) -> int:
+        """
+        Async variant of `load_all()`.
+        """
+        assert isinstance(self.view, AsyncEconiaViewer)
+        view = self.view
+        n_markets = (await gen_get_market_counts(view))["n_markets"]
+        market_ids = self._get_market_ids(n_markets)
+        returns = await view.get_returns_batch(
+            [
+                ("registry", "get_market_info", [], [str(market_id)])
+                for market_id in market_ids
+            ]
+        )
+        infos = [
+            self._put(market_id, value[0])
+            for market_id, value in zip(market_ids, returns)
+        ]
+        missing = self._get_missing_types(infos)
+        decimals = await asyncio.gather(
+            *[gen_get_coin_decimals(view, type_info) for type_info in missing]
+        )
+        for type_info, n_decimals in zip(missing, decimals):
+            self.decimals[_get_type_tag(type_info)] = n_decimals
+        return len(market_ids)
+
+    def get_market_info(self, market_id: int) -> GetMarketInfoReturn:
+        """
+        Cached variant of `econia_sdk.view.registry.get_market_info()`.
+        """
+        assert isinstance(self.view, EconiaViewer)
+        info = self._peek(market_id)
+        if info is None:
+            returns = self.view.get_returns(
+                "registry", "get_market_info", [], [str(market_id)]
+            )
+            info = self._put(market_id, returns[0])
+        return info
+
+    async def gen_get_market_info(self, market_id: int) -> GetMarketInfoReturn:
+        """
+        Async variant of `get_market_info()`.
+        """
+        assert isinstance(self.view, AsyncEconiaViewer)
+        info = self._peek(market_id)
+        if info is None:
+            returns = await self.view.get_returns(
+                "registry", "get_market_info", [], [str(market_id)]
+            )
+            info = self._put(market_id, returns[0])
+        return info
+
+    def get_decimals(self, market_id: int) -> Tuple[Optional[int], int]:
+        """
+        Return `(base_decimals, quote_decimals)` for a market, where
+        `base_decimals` is `None` for a generic market.
+        """
+        assert isinstance(self.view, EconiaViewer)
+        info = self.get_market_info(market_id)
+        base_decimals = None
+        if info.is_coin_market(self.view):
+            base_decimals = self._get_type_decimals(info["base_type"])
+        return (base_decimals, self._get_type_decimals(info["quote_type"]))
+
+    async def gen_get_decimals(self, market_id: int) -> Tuple[Optional[int], int]:
+        """
+        Async variant of `get_decimals()`.
+        """
+        assert isinstance(self.view, AsyncEconiaViewer)
+        info = await self.gen_get_market_info(market_id)
+        base_decimals = None
+        if info.is_coin_market(self.view):
+            base_decimals = await self._gen_get_type_decimals(info["base_type"])
+        quote_decimals = await self._gen_get_type_decimals(info["quote_type"])
+        return (base_decimals, quote_decimals)
+
+    def _get_type_decimals(self, type_info: dict) -> int:
+        assert isinstance(self.view, EconiaViewer)
+        type_tag = _get_type_tag(type_info)
+        if type_tag not in self.decimals:
+            self.decimals[type_tag] = get_coin_decimals(self.view, type_info)
+        return self.decimals[type_tag]
+
+    async def _gen_get_type_decimals(self, type_info: dict) -> int:
+        assert isinstance(self.view, AsyncEconiaViewer)
+        type_tag = _get_type_tag(type_info)
+        if type_tag not in self.decimals:
+            self.decimals[type_tag] = await gen_get_coin_decimals(self.view, type_info)
+        return self.decimals[type_tag]
+
+    def _get_price_params(self, market_id: int) -> Tuple[int, int, int, int]:
+        info = self.get_market_info(market_id)
+        params = self._price_params.get(market_id)
+        if params is None:
+            base_decimals, quote_decimals = self.get_decimals(market_id)
+            assert base_decimals is not None, "Generic market has no base decimals!"
+            params = (
+                info["lot_size"],
+                info["tick_size"],
+                base_decimals,
+                quote_decimals,
+            )
+            self._price_params[market_id] = params
+        return params
+
+    async def _gen_get_price_params(self, market_id: int) -> Tuple[int, int, int, int]:
+        info = await self.gen_get_market_info(market_id)
+        params = self._price_params.get(market_id)
+        if params is None:
+            base_decimals, quote_decimals = await self.gen_get_decimals(market_id)
+            assert base_decimals is not None, "Generic market has no base decimals!"
+            params = (
+                info["lot_size"],
+                info["tick_size"],
+                base_decimals,
+                quote_decimals,
+            )
+            self._price_params[market_id] = params
+        return params
+
+    def get_price_nominal(self, market_id: int, integer_price: int) -> Decimal:
+        """
+        `econia_sdk.utils.decimals.get_price_nominal()` with the market
+        parameters and decimals taken from the cache.
+        """
+        return get_price_nominal(integer_price, *self._get_price_params(market_id))
+
+    async def gen_get_price_nominal(
+        self, market_id: int, integer_price: int
+    ) -> Decimal:
+        """
+        Async variant of `get_price_nominal()`.
+        """
+        return get_price_nominal(
+            integer_price, *(await self._gen_get_price_params(market_id))
+        )
+
+    def get_price_integer(self, market_id: int, nominal_price: str) -> int:
+        """
+        `econia_sdk.utils.decimals.get_price_integer()` with the market
+        parameters and decimals taken from the cache.
+        """
+        return get_price_integer(nominal_price, *self._get_price_params(market_id))
+
+    async def gen_get_price_integer(self, market_id: int, nominal_price: str) -> int:
+        """
+        Async variant of `get_price_integer()`.
+        """
+        return get_price_integer(
+            nominal_price, *(await self._gen_get_price_params(market_id))
+        )
@@ -0,0 +1,156 @@
+# Columnar NumPy/Arrow decoding of view and event JSON
+
+from decimal import Decimal
+from typing import Iterable, List, Tuple
+
+from econia_sdk.utils.ids import HI_64
+from econia_sdk.utils.ids import join_u128 as join_u128_values
+
+# Structured array fields. `u128` order IDs and price level sizes are
+# split into high and low `uint64` halves, sides are `uint8` per
+# `econia_sdk.types.Side` (0 for bid, 1 for ask) and addresses are kept
+# as hex bytes.
+OPEN_ORDER_FIELDS: List[Tuple[str, str]] = [
+    ("market_id", "u8"),
+    ("order_id_hi", "u8"),
+    ("order_id_lo", "u8"),
+    ("price", "u8"),
+    ("side", "u1"),
+    ("remaining_size", "u8"),
+    ("custodian_id", "u8"),
+    ("user", "S66"),
+]
+
+PRICE_LEVEL_FIELDS: List[Tuple[str, str]] = [
+    ("price", "u8"),
+    ("size_hi", "u8"),
+    ("size_lo", "u8"),
+]
+
+FILL_EVENT_FIELDS: List[Tuple[str, str]] = [
+    ("version", "u8"),
+    ("sequence_number", "u8"),
+    ("market_id", "u8"),
+    ("price", "u8"),
+    ("size", "u8"),
+    ("maker_side", "u1"),
+    ("maker_order_id_hi", "u8"),
+    ("maker_order_id_lo", "u8"),
+    ("maker_custodian_id", "u8"),
+    ("taker_order_id_hi", "u8"),
+    ("taker_order_id_lo", "u8"),
+    ("taker_custodian_id", "u8"),
+    ("taker_quote_fees_paid", "u8"),
+    ("sequence_number_for_trade", "u8"),
+    ("maker", "S66"),
+    ("taker", "S66"),
+]
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for columnar output") from e
+    return numpy
+
+
+def open_orders_to_numpy(values: Iterable[dict]):
+    """
+    Decode open orders as returned by the `market` view functions into
+    a NumPy structured array with `OPEN_ORDER_FIELDS`.
+    """
+    np = _import_numpy()
+    rows = []
+    for value in values:
+        order_id = int(value["order_id"])
+        rows.append(
+            (
+                value["market_id"],
+                order_id >> 64,
+                order_id & HI_64,
+                value["price"],
+                value["side"],
+                value["remaining_size"],
+                value["custodian_id"],
+                value["user"],
+            )
+        )
+    return np.array(rows, dtype=OPEN_ORDER_FIELDS)
+
+
+def price_levels_to_numpy(values: Iterable[dict]):
+    """
+    Decode price levels as returned by the `market` view functions into
+    a NumPy structured array with `PRICE_LEVEL_FIELDS`.
+    """
+    np = _import_numpy()
+    rows = []
+    for value in values:
+        size = int(value["size"])
+        rows.append((value["price"], size >> 64, size & HI_64))
+    return np.array(rows, dtype=PRICE_LEVEL_FIELDS)
+
+
+def fill_events_to_numpy(events: Iterable[dict]):
+    """
+    Decode fill events as returned by the events API into a NumPy
+    structured array with `FILL_EVENT_FIELDS`.
+    """
+    np = _import_numpy()
+    rows = []
+    for event in events:
+        data = event["data"]
+        maker_order_id = int(data["maker_order_id"])
+        taker_order_id = int(data["taker_order_id"])
+        rows.append(
+            (
+                event["version"],
+                event["sequence_number"],
+                data["market_id"],
+                data["price"],
+                data["size"],
+                data["maker_side"],
+                maker_order_id >> 64,
+                maker_order_id & HI_64,
+                data["maker_custodian_id"],
+                taker_order_id >> 64,
+                taker_order_id & HI_64,
+                data["taker_custodian_id"],
+                data["taker_quote_fees_paid"],
+                data["sequence_number_for_trade"],
+                data["maker"],
+                data["taker"],
+            )
+        )
+    return np.array(rows, dtype=FILL_EVENT_FIELDS)
+
+
+def to_arrow(array, join_u128: bool = False):
+    """
+    Convert a structured array from this module into a
+    `pyarrow.RecordBatch` with one column per field, or if `join_u128`,
+    with each pair of `NAME_hi` and `NAME_lo` columns joined into one
+    `NAME` column of `decimal256(39, 0)`, since Arrow has no 128-bit
+    integer type. Requires `pyarrow` to be installed.
+    """
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Arrow output") from e
+    names = []
+    columns = []
+    for name in array.dtype.names:
+        if join_u128 and name.endswith("_hi"):
+            name = name[: -len("_hi")]
+            values = [
+                Decimal(value)
+                for value in join_u128_values(array[f"{name}_hi"], array[f"{name}_lo"])
+            ]
+            columns.append(pyarrow.array(values, type=pyarrow.decimal256(39, 0)))
+        elif join_u128 and name.endswith("_lo"):
+            continue
+        else:
+            columns.append(pyarrow.array(array[name]))
+        names.append(name)
+    return pyarrow.RecordBatch.from_arrays(columns, names=names)
@@ -0,0 +1,361 @@
+# Batched transaction confirmation tracking
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.async_client import RestClient as AsyncRestClient
+from aptos_sdk.client import RestClient
+
+# Most fullnodes cap transaction pages at 100 transactions.
+DEFAULT_PAGE_SIZE = 100
+
+
+def _get_sender(sender: Union[AccountAddress, str]) -> str:
+    return str(AccountAddress.from_hex(str(sender)))
+
+
+class _ConfirmationTrackerBase:
+    """
+    Poller state shared by `ConfirmationTracker` and
+    `AsyncConfirmationTracker`: pending hashes with their futures and
+    deadlines, the sender and sequence number of each, and the adaptive
+    poll interval.
+    """
+
+    min_interval: float
+    max_interval: float
+    interval: float
+    timeout: float
+    page_size: int
+    polls: int
+    requests: int
+    _pending: Dict[str, Tuple[Any, float]]
+    # Hashes whose sender or sequence number is not known yet.
+    _unchecked: Set[str]
+    # Pending hashes by sender and sequence number.
+    _accounts: Dict[str, Dict[int, str]]
+    _keys: Dict[str, Tuple[str, int]]
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        max_interval: float = 2.0,
+        timeout: float = 20,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.timeout = timeout
+        self.page_size = page_size
+        self.polls = 0
+        self.requests = 0
+        self._pending = {}
+        self._unchecked = set()
+        self._accounts = {}
+        self._keys = {}
+
+    def _remove(self, txn_hash: str) -> Any:
+        future, _ = self._pending.pop(txn_hash)
+        self._unchecked.discard(txn_hash)
+        key = self._keys.pop(txn_hash, None)
+        if key is not None:
+            sender, sequence_number = key
+            pending = self._accounts[sender]
+            del pending[sequence_number]
+            if len(pending) == 0:
+                del self._accounts[sender]
+        return future
+
+    def _resolve(self, txn_hash: str, txn: dict):
+        future = self._remove(txn_hash)
+        if future.done():  # Cancelled by the caller.
+            return
+        if txn.get("success"):
+            future.set_result(txn)
+        else:
+            future.set_exception(Exception(f"{txn.get('vm_status')} - {txn_hash}"))
+
+    def _set_key(self, txn_hash: str, sender: str, sequence_number: int):
+        self._unchecked.discard(txn_hash)
+        self._keys[txn_hash] = (sender, sequence_number)
+        self._accounts.setdefault(sender, {})[sequence_number] = txn_hash
+
+    def _add(
+        self,
+        txn_hash: str,
+        future: Any,
+        sender: Optional[Union[AccountAddress, str]],
+        sequence_number: Optional[int],
+    ) -> Any:
+        # Return the future of `txn_hash`, `future` unless already tracked.
+        if txn_hash in self._pending:
+            return self._pending[txn_hash][0]
+        self._pending[txn_hash] = (future, time.monotonic() + self.timeout)
+        if sender is None or sequence_number is None:
+            # Looked up by hash on the next poll.
+            self._unchecked.add(txn_hash)
+        else:
+            self._set_key(txn_hash, _get_sender(sender), sequence_number)
+        return future
+
+    def _on_lookup(self, txn_hash: str, txn: dict):
+        # A transaction looked up by hash, pending or committed.
+        if txn_hash not in self._pending:
+            return
+        if txn["type"] == "pending_transaction":
+            self._set_key(
+                txn_hash, _get_sender(txn["sender"]), int(txn["sequence_number"])
+            )
+        else:
+            self._resolve(txn_hash, txn)
+
+    def _on_account_transactions(self, sender: str, txns: List[dict]):
+        # Committed transactions of `sender`, by sequence number.
+        for txn in txns:
+            pending = self._accounts.get(sender)
+            if pending is None:
+                return
+            txn_hash = pending.get(int(txn["sequence_number"]))
+            if txn_hash is None:
+                continue
+            if txn["hash"] == txn_hash:
+                self._resolve(txn_hash, txn)
+                continue
+            future = self._remove(txn_hash)
+            if not future.done():
+                future.set_exception(
+                    Exception(
+                        f"sequence number {txn['sequence_number']} of {sender} "
+                        f"committed by {txn['hash']} - {txn_hash}"
+                    )
+                )
+
+    def _get_account_request(self, sender: str) -> Tuple[str, int]:
+        # Path listing committed transactions of `sender` from its lowest
+        # pending sequence number, and the highest pending one.
+        sequence_numbers = self._accounts[sender]
+        start = min(sequence_numbers)
+        path = f"/accounts/{sender}/transactions?start={start}&limit={self.page_size}"
+        return path, max(sequence_numbers)
+
+    def _expire(self):
+        now = time.monotonic()
+        for txn_hash, (future, deadline) in list(self._pending.items()):
+            if future.done():
+                self._remove(txn_hash)
+            elif now > deadline:
+                self._remove(txn_hash)
+                future.set_exception(TimeoutError(f"transaction {txn_hash} timed out"))
+
+    def _finish_poll(self, n_pending: int):
+        if len(self._pending) < n_pending:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        self.polls += 1
+        self._expire()
+
+
+class ConfirmationTracker(_ConfirmationTrackerBase):
+    """
+    Waits for many submitted transactions at once with a single poller
+    thread, instead of polling each hash as `wait_for_transaction()`
+    does.
+
+    Pending transactions are grouped by sender. Each poll lists the
+    committed transactions of each sender from its lowest pending
+    sequence number, in pages of `page_size`, resolving the future
+    returned by `track()` for every pending transaction found: one
+    request per sender per poll, regardless of how many transactions
+    are pending or how busy the network is. A transaction tracked
+    without its sender and sequence number is looked up by hash once to
+    learn them. The poll interval doubles from `min_interval` up to
+    `max_interval` while no pending transaction commits, and futures
+    fail after `timeout` seconds, if the transaction was committed but
+    failed, or if another transaction took its sequence number. The
+    poller stops when no transactions are pending.
+    """
+
+    client: RestClient
+    _lock: threading.Lock
+    _thread: Optional[threading.Thread]
+
+    def __init__(self, client: RestClient, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def track(
+        self,
+        txn_hash: str,
+        sender: Optional[Union[AccountAddress, str]] = None,
+        sequence_number: Optional[int] = None,
+    ) -> Future:
+        """
+        Return a future resolved with the committed transaction. Pass its
+        `sender` and `sequence_number`, if known, to save a lookup by
+        hash.
+        """
+        future: Future = Future()
+        with self._lock:
+            future = self._add(txn_hash, future, sender, sequence_number)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return future
+
+    def wait(
+        self,
+        txn_hash: str,
+        sender: Optional[Union[AccountAddress, str]] = None,
+        sequence_number: Optional[int] = None,
+    ) -> dict:
+        return self.track(txn_hash, sender, sequence_number).result()
+
+    def _get(self, path: str) -> Any:
+        self.requests += 1
+        return self.client.client.get(f"{self.client.base_url}{path}")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if len(self._pending) == 0:
+                    self._thread = None
+                    return
+            try:
+                self._poll()
+            except Exception:
+                # Transient node errors are retried on the next poll.
+                with self._lock:
+                    self.interval = min(self.interval * 2, self.max_interval)
+                    self._expire()
+            time.sleep(self.interval)
+
+    def _poll(self):
+        with self._lock:
+            n_pending = len(self._pending)
+            lookups = list(self._unchecked)
+            senders = list(self._accounts)
+        for txn_hash in lookups:
+            response = self._get(f"/transactions/by_hash/{txn_hash}")
+            if response.status_code == 200:
+                with self._lock:
+                    self._on_lookup(txn_hash, response.json())
+        for sender in senders:
+            while True:
+                with self._lock:
+                    if sender not in self._accounts:
+                        break
+                    path, last = self._get_account_request(sender)
+                response = self._get(path)
+                if response.status_code >= 400:
+                    raise Exception(response.text, response.status_code)
+                txns = response.json()
+                with self._lock:
+                    self._on_account_transactions(sender, txns)
+                if (
+                    len(txns) < self.page_size
+                    or int(txns[-1]["sequence_number"]) >= last
+                ):
+                    break
+        with self._lock:
+            self._finish_poll(n_pending)
+
+
+class AsyncConfirmationTracker(_ConfirmationTrackerBase):
+    """
+    Async variant of `ConfirmationTracker`, polling in a single task and
+    resolving `asyncio` futures.
+    """
+
+    client: AsyncRestClient
+    _task: Optional[asyncio.Task]
+
+    def __init__(self, client: AsyncRestClient, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self._task = None
+
+    def track(
+        self,
+        txn_hash: str,
+        sender: Optional[Union[AccountAddress, str]] = None,
+        sequence_number: Optional[int] = None,
+    ) -> asyncio.Future:
+        """
+        Return a future resolved with the committed transaction.
+        """
+        future = asyncio.get_event_loop().create_future()
+        future = self._add(txn_hash, future, sender, sequence_number)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def wait(
+        self,
+        txn_hash: str,
+        sender: Optional[Union[AccountAddress, str]] = None,
+        sequence_number: Optional[int] = None,
+    ) -> dict:
+        return await self.track(txn_hash, sender, sequence_number)
+
+    async def close(self):
+        """
+        Stop the poller task and cancel all pending futures, before the
+        client is closed.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for future, _ in self._pending.values():
+            future.cancel()
+        self._pending = {}
+        self._unchecked = set()
+        self._accounts = {}
+        self._keys = {}
+
+    async def _get(self, path: str) -> Any:
+        self.requests += 1
+        return await self.client.client.get(f"{self.client.base_url}{path}")
+
+    async def _run(self):
+        while len(self._pending) > 0:
+            try:
+                await self._poll()
+            except Exception:
+                self.interval = min(self.interval * 2, self.max_interval)
+                self._expire()
+            await asyncio.sleep(self.interval)
+
+    async def _poll_account(self, sender: str):
+        while sender in self._accounts:
+            path, last = self._get_account_request(sender)
+            response = await self._get(path)
+            if response.status_code >= 400:
+                raise Exception(response.text, response.status_code)
+            txns = response.json()
+            self._on_account_transactions(sender, txns)
+            if len(txns) < self.page_size or int(txns[-1]["sequence_number"]) >= last:
+                return
+
+    async def _poll(self):
+        n_pending = len(self._pending)
+        lookups = list(self._unchecked)
+        responses = await asyncio.gather(
+            *[self._get(f"/transactions/by_hash/{txn_hash}") for txn_hash in lookups]
+        )
+        for txn_hash, response in zip(lookups, responses):
+            if response.status_code == 200:
+                self._on_lookup(txn_hash, response.json())
+        await asyncio.gather(*[self._poll_account(s) for s in list(self._accounts)])
+        self._finish_poll(n_pending)
@@ -0,0 +1,363 @@
+# Incrementally refreshed cache of DSS candlesticks
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from econia_sdk.dss.client import AsyncDssClient, DssClient
+
+# Candlestick values are kept as returned by the DSS, in `data`, since
+# volumes can exceed SQLite integers. Start times are Unix seconds.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candlesticks (
+    market_id INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    start_time INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (market_id, resolution, start_time)
+);
+CREATE TABLE IF NOT EXISTS refreshes (
+    market_id INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    txn_version INTEGER NOT NULL,
+    PRIMARY KEY (market_id, resolution)
+);
+"""
+
+
+def get_timestamp(time: str) -> int:
+    """
+    Unix seconds of an ISO 8601 timestamp as returned by the DSS.
+    """
+    return int(datetime.fromisoformat(time.replace("Z", "+00:00")).timestamp())
+
+
+def get_time(timestamp: int) -> str:
+    """
+    ISO 8601 timestamp of Unix seconds, in the DSS's format.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def derive_candlesticks(candlesticks: Iterable[dict], resolution: int) -> List[dict]:
+    """
+    Aggregate `candlesticks`, oldest first, into candlesticks of
+    `resolution` seconds, which must be a multiple of theirs. Like the
+    DSS's, periods start at multiples of the resolution since the Unix
+    epoch, and periods without fills have no candlestick, so the result
+    is what the DSS would return at `resolution`.
+    """
+    derived: List[dict] = []
+    for candlestick in candlesticks:
+        start_time = get_timestamp(candlestick["start_time"])
+        start_time -= start_time % resolution
+        if len(derived) == 0 or derived[-1]["_start_time"] != start_time:
+            derived.append(
+                {
+                    "market_id": candlestick["market_id"],
+                    "resolution": resolution,
+                    "start_time": get_time(start_time),
+                    "open": candlestick["open"],
+                    "high": candlestick["high"],
+                    "low": candlestick["low"],
+                    "close": candlestick["close"],
+                    "volume": candlestick["volume"],
+                    "_start_time": start_time,
+                }
+            )
+            continue
+        last = derived[-1]
+        if last["open"] is None:
+            last["open"] = candlestick["open"]
+        if candlestick["high"] is not None:
+            last["high"] = (
+                candlestick["high"]
+                if last["high"] is None
+                else max(last["high"], candlestick["high"])
+            )
+        if candlestick["low"] is not None:
+            last["low"] = (
+                candlestick["low"]
+                if last["low"] is None
+                else min(last["low"], candlestick["low"])
+            )
+        if candlestick["close"] is not None:
+            last["close"] = candlestick["close"]
+        last["volume"] += candlestick["volume"]
+    for candlestick in derived:
+        del candlestick["_start_time"]
+    return derived
+
+
+class CandlestickCache:
+    """
+    Local copy of DSS candlesticks in a SQLite database at `path` (in
+    memory by default), refreshed incrementally.
+
+    The DSS only ever updates the latest candlestick of each market and
+    resolution, since fills are aggregated in transaction order, so
+    every earlier one is closed and kept as is. A refresh first reads
+    `/candlesticks_last_indexed_txn`, shared by every market, and for a
+    market and resolution whose last indexed transaction has not moved
+    since the previous refresh, makes no further request. Otherwise it
+    fetches only the open candlestick and any newer ones.
+
+    `get_candlesticks()` serves resolutions the DSS does not aggregate
+    by deriving them from the largest one that divides them, per
+    `derive_candlesticks()`. Use `gen_refresh()`, `gen_refresh_all()`
+    and `gen_get_candlesticks()` with an `AsyncDssClient`.
+    """
+
+    client: Union[DssClient, AsyncDssClient]
+    connection: sqlite3.Connection
+    path: str
+    resolutions: Optional[List[int]]
+
+    def __init__(
+        self, client: Union[DssClient, AsyncDssClient], path: str = ":memory:"
+    ):
+        self.client = client
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        self.resolutions = None
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _get_refreshed_version(self, market_id: int, resolution: int) -> Optional[int]:
+        row = self.connection.execute(
+            "SELECT txn_version FROM refreshes WHERE market_id = ? AND resolution = ?",
+            (market_id, resolution),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _get_open_time(self, market_id: int, resolution: int) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT MAX(start_time) FROM candlesticks "
+            "WHERE market_id = ? AND resolution = ?",
+            (market_id, resolution),
+        ).fetchone()
+        return None if row[0] is None else get_time(row[0])
+
+    def _is_current(
+        self, market_id: int, resolution: int, last_indexed: Dict[int, int]
+    ) -> bool:
+        txn_version = last_indexed.get(resolution)
+        return txn_version is not None and txn_version == self._get_refreshed_version(
+            market_id, resolution
+        )
+
+    def _save(
+        self,
+        market_id: int,
+        resolution: int,
+        candlesticks: List[dict],
+        txn_version: Optional[int],
+    ):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO candlesticks VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        market_id,
+                        resolution,
+                        get_timestamp(candlestick["start_time"]),
+                        json.dumps(candlestick),
+                    )
+                    for candlestick in candlesticks
+                ],
+            )
+            if txn_version is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO refreshes VALUES (?, ?, ?)",
+                    (market_id, resolution, txn_version),
+                )
+
+    def refresh(
+        self,
+        market_id: int,
+        resolution: int,
+        last_indexed: Optional[Dict[int, int]] = None,
+    ) -> int:
+        """
+        Fetch candlesticks of `market_id` at `resolution` that may have
+        changed since the last refresh, returning how many. Pass the
+        return of `get_candlesticks_last_indexed_txn()` as
+        `last_indexed` to share it between refreshes.
+        """
+        assert isinstance(self.client, DssClient)
+        if last_indexed is None:
+            last_indexed = self.client.get_candlesticks_last_indexed_txn()
+        if self._is_current(market_id, resolution, last_indexed):
+            return 0
+        candlesticks = self.client.get_candlesticks(
+            market_id, resolution, self._get_open_time(market_id, resolution)
+        )
+        self._save(market_id, resolution, candlesticks, last_indexed.get(resolution))
+        return len(candlesticks)
+
+    async def gen_refresh(
+        self,
+        market_id: int,
+        resolution: int,
+        last_indexed: Optional[Dict[int, int]] = None,
+    ) -> int:
+        """
+        Async variant of `refresh()`.
+        """
+        assert isinstance(self.client, AsyncDssClient)
+        if last_indexed is None:
+            last_indexed = await self.client.get_candlesticks_last_indexed_txn()
+        if self._is_current(market_id, resolution, last_indexed):
+            return 0
+        candlesticks = await self.client.get_candlesticks(
+            market_id, resolution, self._get_open_time(market_id, resolution)
+        )
+        self._save(market_id, resolution, candlesticks, last_indexed.get(resolution))
+        return len(candlesticks)
+
+    def get_resolutions(self) -> List[int]:
+        """
+        Resolutions aggregated by the DSS, fetched once.
+        """
+        assert isinstance(self.client, DssClient)
+        if self.resolutions is None:
+            self.resolutions = self.client.get_candlestick_resolutions()
+        return self.resolutions
+
+    async def gen_get_resolutions(self) -> List[int]:
+        assert isinstance(self.client, AsyncDssClient)
+        if self.resolutions is None:
+            self.resolutions = await self.client.get_candlestick_resolutions()
+        return self.resolutions
+
+    def refresh_all(
+        self, market_ids: List[int], resolutions: Optional[List[int]] = None
+    ) -> int:
+        """
+        Refresh every resolution aggregated by the DSS (or those in
+        `resolutions`) of every market in `market_ids`, returning the
+        number of candlesticks fetched.
+        """
+        assert isinstance(self.client, DssClient)
+        if resolutions is None:
+            resolutions = self.get_resolutions()
+        last_indexed = self.client.get_candlesticks_last_indexed_txn()
+        return sum(
+            self.refresh(market_id, resolution, last_indexed)
+            for market_id in market_ids
+            for resolution in resolutions
+        )
+
+    async def gen_refresh_all(
+        self, market_ids: List[int], resolutions: Optional[List[int]] = None
+    ) -> int:
+        """
+        Async variant of `refresh_all()`.
+        """
+        assert isinstance(self.client, AsyncDssClient)
+        if resolutions is None:
+            resolutions = await self.gen_get_resolutions()
+        last_indexed = await self.client.get_candlesticks_last_indexed_txn()
+        n_fetched = 0
+        for market_id in market_ids:
+            for resolution in resolutions:
+                n_fetched += await self.gen_refresh(market_id, resolution, last_indexed)
+        return n_fetched
+
+    def get_cached(
+        self,
+        market_id: int,
+        resolution: int,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Cached candlesticks of `market_id` at `resolution`, oldest
+        first, starting from `start_time` and before `end_time` (Unix
+        seconds) if given, without refreshing.
+        """
+        start_time = 0 if start_time is None else start_time
+        end_time = 2**63 - 1 if end_time is None else end_time
+        rows = self.connection.execute(
+            "SELECT data FROM candlesticks WHERE market_id = ? AND resolution = ? "
+            "AND start_time >= ? AND start_time < ? ORDER BY start_time",
+            (market_id, resolution, start_time, end_time),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _get_base_resolution(
+        self, resolution: int, resolutions: List[int]
+    ) -> Tuple[int, bool]:
+        # The resolution to read, and whether to derive from it.
+        if resolution in resolutions:
+            return resolution, False
+        divisors = [r for r in resolutions if resolution % r == 0]
+        if len(divisors) == 0:
+            raise ValueError(f"No DSS resolution divides {resolution} seconds")
+        return max(divisors), True
+
+    def _get_derived(
+        self,
+        market_id: int,
+        resolution: int,
+        base: int,
+        start_time: Optional[int],
+        end_time: Optional[int],
+    ) -> List[dict]:
+        # Widen the range to whole derived periods.
+        if start_time is not None:
+            start_time -= start_time % resolution
+        if end_time is not None and end_time % resolution != 0:
+            end_time += resolution - end_time % resolution
+        return derive_candlesticks(
+            self.get_cached(market_id, base, start_time, end_time), resolution
+        )
+
+    def get_candlesticks(
+        self,
+        market_id: int,
+        resolution: int,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        refresh: bool = True,
+    ) -> List[dict]:
+        """
+        Candlesticks of `market_id` at `resolution` seconds as per
+        `get_cached()`, refreshed first if `refresh`, and derived from a
+        lower resolution if the DSS does not aggregate this one.
+        """
+        base, derive = self._get_base_resolution(resolution, self.get_resolutions())
+        if refresh:
+            self.refresh(market_id, base)
+        if derive:
+            return self._get_derived(market_id, resolution, base, start_time, end_time)
+        return self.get_cached(market_id, resolution, start_time, end_time)
+
+    async def gen_get_candlesticks(
+        self,
+        market_id: int,
+        resolution: int,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        refresh: bool = True,
+    ) -> List[dict]:
+        """
+        Async variant of `get_candlesticks()`.
+        """
+        base, derive = self._get_base_resolution(
+            resolution, await self.gen_get_resolutions()
+        )
+        if refresh:
+            await self.gen_refresh(market_id, base)
+        if derive:
+            return self._get_derived(market_id, resolution, base, start_time, end_time)
+        return self.get_cached(market_id, resolution, start_time, end_time)
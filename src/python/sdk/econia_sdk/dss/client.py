@@ -0,0 +1,545 @@
+# Client for the DSS REST API
+
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+# Rows per page when paginating. Should not exceed the `max-rows`
+# setting of the DSS PostgREST server, since a shorter page is taken to
+# be the last one.
+DEFAULT_PAGE_SIZE = 1000
+
+# Key of `fill_events`, `historical_trades` and the other event views.
+EVENT_KEYSET = ("txn_version", "event_idx")
+
+_RESERVED = set(',.:()" ')
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _format_list_value(value: Any) -> str:
+    # Values inside `in.(...)`, `or=(...)` and the like are quoted when
+    # they contain PostgREST delimiters.
+    text = _format_value(value)
+    if any(char in _RESERVED for char in text):
+        escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return text
+
+
+class Query:
+    """
+    A PostgREST query on the DSS REST API `path` (for instance
+    `"/fill_events"`), built by chaining filter, `select()`, `order()`
+    and `limit()` calls, each of which returns a new query:
+
+    ```python
+    Query("/fill_events").eq("market_id", 1).gte("price", 100).select(
+        "txn_version", "price", "size"
+    ).order("txn_version", descending=True).limit(10)
+    ```
+    """
+
+    path: str
+    filters: Tuple[Tuple[str, str], ...]
+    columns: Optional[Tuple[str, ...]]
+    ordering: Tuple[str, ...]
+    limit_rows: Optional[int]
+    offset_rows: Optional[int]
+    cursor: Tuple[Tuple[str, str], ...]
+
+    def __init__(
+        self,
+        path: str,
+        filters: Tuple[Tuple[str, str], ...] = (),
+        columns: Optional[Tuple[str, ...]] = None,
+        ordering: Tuple[str, ...] = (),
+        limit_rows: Optional[int] = None,
+        offset_rows: Optional[int] = None,
+        cursor: Tuple[Tuple[str, str], ...] = (),
+    ):
+        self.path = path if path.startswith("/") else f"/{path}"
+        self.filters = filters
+        self.columns = columns
+        self.ordering = ordering
+        self.limit_rows = limit_rows
+        self.offset_rows = offset_rows
+        self.cursor = cursor
+
+    def _replace(self, **kwargs) -> "Query":
+        fields: Dict[str, Any] = {
+            "path": self.path,
+            "filters": self.filters,
+            "columns": self.columns,
+            "ordering": self.ordering,
+            "limit_rows": self.limit_rows,
+            "offset_rows": self.offset_rows,
+            "cursor": self.cursor,
+        }
+        fields.update(kwargs)
+        return Query(**fields)
+
+    def filter(self, column: str, operator: str, value: Any) -> "Query":
+        """
+        Add the filter `column=operator.value`, for any PostgREST
+        operator.
+        """
+        return self._replace(
+            filters=self.filters + ((column, f"{operator}.{_format_value(value)}"),)
+        )
+
+    def eq(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "Query":
+        return self.filter(column, "lte", value)
+
+    def like(self, column: str, pattern: str) -> "Query":
+        return self.filter(column, "like", pattern)
+
+    def ilike(self, column: str, pattern: str) -> "Query":
+        return self.filter(column, "ilike", pattern)
+
+    def is_(self, column: str, value: Optional[bool]) -> "Query":
+        return self.filter(column, "is", value)
+
+    def in_(self, column: str, values: Sequence[Any]) -> "Query":
+        listed = ",".join(_format_list_value(value) for value in values)
+        return self._replace(filters=self.filters + ((column, f"in.({listed})"),))
+
+    def select(self, *columns: str) -> "Query":
+        return self._replace(columns=columns)
+
+    def order(self, column: str, descending: bool = False) -> "Query":
+        """
+        Order by `column`, after any columns already ordered by.
+        """
+        direction = "desc" if descending else "asc"
+        return self._replace(ordering=self.ordering + (f"{column}.{direction}",))
+
+    def limit(self, n_rows: int) -> "Query":
+        return self._replace(limit_rows=n_rows)
+
+    def offset(self, n_rows: int) -> "Query":
+        return self._replace(offset_rows=n_rows)
+
+    def after(
+        self, keyset: Sequence[str], row: Dict[str, Any], descending: bool = False
+    ) -> "Query":
+        """
+        Restrict to rows after `row` in the order of the `keyset`
+        columns, as for keyset pagination: rows whose keyset tuple is
+        greater (or smaller, if `descending`) than that of `row`.
+        Replaces the restriction of any earlier call.
+        """
+        operator = "lt" if descending else "gt"
+        first = keyset[0]
+        if len(keyset) == 1:
+            return self._replace(
+                cursor=((first, f"{operator}.{_format_value(row[first])}"),)
+            )
+        values = [_format_list_value(row[column]) for column in keyset]
+        terms = []
+        for i in range(len(keyset)):
+            conditions = [f"{keyset[j]}.eq.{values[j]}" for j in range(i)]
+            conditions.append(f"{keyset[i]}.{operator}.{values[i]}")
+            if len(conditions) == 1:
+                terms.append(conditions[0])
+            else:
+                terms.append(f"and({','.join(conditions)})")
+        # The range filter on the first column lets the planner use an
+        # index scan, which the disjunction alone may not.
+        return self._replace(
+            cursor=(
+                (first, f"{operator}e.{_format_value(row[first])}"),
+                ("or", f"({','.join(terms)})"),
+            )
+        )
+
+    def get_params(self) -> Tuple[Tuple[str, str], ...]:
+        params = list(self.filters + self.cursor)
+        if self.columns is not None:
+            params.append(("select", ",".join(self.columns)))
+        if len(self.ordering) > 0:
+            params.append(("order", ",".join(self.ordering)))
+        if self.limit_rows is not None:
+            params.append(("limit", str(self.limit_rows)))
+        if self.offset_rows is not None:
+            params.append(("offset", str(self.offset_rows)))
+        return tuple(params)
+
+
+def _get_range_headers(start: int, page_size: int) -> Dict[str, str]:
+    return {"Range-Unit": "items", "Range": f"{start}-{start + page_size - 1}"}
+
+
+def _check(response: httpx.Response) -> Any:
+    if response.status_code >= 400:
+        raise Exception(response.text, response.status_code)
+    return response.json()
+
+
+def _get_keyset_query(
+    query: Query, keyset: Sequence[str], descending: bool, page_size: int
+) -> Query:
+    for column in keyset:
+        query = query.order(column, descending)
+    return query.limit(page_size)
+
+
+def _get_market_query(path: str, market_id: Optional[int]) -> Query:
+    query = Query(path)
+    return query if market_id is None else query.eq("market_id", market_id)
+
+
+class DssClient:
+    """
+    Reads the DSS REST API at `base_url` (for instance
+    `http://localhost:3000`) through one pooled `httpx.Client`, keeping
+    connections alive across requests.
+
+    `get()` runs a `Query` and `rpc()` calls a function under `/rpc`.
+    For large tables, `iter_pages()` pages through a query with the
+    `Range` header, and `iter_rows()` yields its rows lazily, by keyset
+    pagination if given `keyset` columns: each page is requested as
+    the rows after the last one of the previous page, in key order, so
+    that deep pages cost the same as the first, unlike offsets.
+
+    Pass a `client` to configure pooling, or to run against a mock
+    server through an `httpx.MockTransport`.
+    """
+
+    base_url: str
+    client: httpx.Client
+    page_size: int
+
+    def __init__(
+        self,
+        base_url: str,
+        client: Optional[httpx.Client] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.client = httpx.Client(timeout=timeout) if client is None else client
+        self.page_size = page_size
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self) -> "DssClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get(self, query: Query, headers: Optional[Dict[str, str]] = None) -> list:
+        response = self.client.get(
+            f"{self.base_url}{query.path}", params=query.get_params(), headers=headers
+        )
+        return _check(response)
+
+    def rpc(self, function: str, **arguments: Any) -> Any:
+        """
+        Call the DSS SQL function `function` with named `arguments`.
+        """
+        response = self.client.post(f"{self.base_url}/rpc/{function}", json=arguments)
+        return _check(response)
+
+    def iter_pages(
+        self, query: Query, page_size: Optional[int] = None
+    ) -> Iterator[list]:
+        """
+        Yield pages of `query` rows, requested by `Range` header.
+        """
+        if page_size is None:
+            page_size = self.page_size
+        start = 0
+        while True:
+            rows = self.get(query, _get_range_headers(start, page_size))
+            if len(rows) > 0:
+                yield rows
+            if len(rows) < page_size:
+                return
+            start += len(rows)
+
+    def iter_keyset_pages(
+        self,
+        query: Query,
+        keyset: Sequence[str],
+        descending: bool = False,
+        page_size: Optional[int] = None,
+    ) -> Iterator[list]:
+        """
+        Yield pages of `query` rows by keyset pagination over the
+        `keyset` columns (which must be selected, and unique together),
+        in ascending order unless `descending`.
+        """
+        if page_size is None:
+            page_size = self.page_size
+        page = _get_keyset_query(query, keyset, descending, page_size)
+        while True:
+            rows = self.get(page)
+            if len(rows) > 0:
+                yield rows
+            if len(rows) < page_size:
+                return
+            page = _get_keyset_query(
+                query.after(keyset, rows[-1], descending), keyset, descending, page_size
+            )
+
+    def iter_rows(
+        self,
+        query: Query,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False,
+        page_size: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """
+        Yield the rows of `query`, by keyset pagination as per
+        `iter_keyset_pages()` if given `keyset` columns, or else by
+        `Range`.
+        """
+        if keyset is None:
+            pages = self.iter_pages(query, page_size)
+        else:
+            pages = self.iter_keyset_pages(query, keyset, descending, page_size)
+        for rows in pages:
+            yield from rows
+
+    def get_markets(self) -> list:
+        return self.get(Query("/markets").order("market_id"))
+
+    def get_fill_events(
+        self, market_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list:
+        """
+        Most recent fill events, of one market if `market_id`. See
+        `iter_rows()` to page through all of them.
+        """
+        query = _get_market_query("/fill_events", market_id)
+        query = query.order("txn_version", True).order("event_idx", True)
+        return self.get(query if limit is None else query.limit(limit))
+
+    def get_orders(
+        self,
+        market_id: Optional[int] = None,
+        user: Optional[str] = None,
+        order_status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        query = _get_market_query("/orders", market_id)
+        if user is not None:
+            query = query.eq("user", user)
+        if order_status is not None:
+            query = query.eq("order_status", order_status)
+        return self.get(query if limit is None else query.limit(limit))
+
+    def get_price_levels(self, market_id: int) -> list:
+        return self.get(_get_market_query("/price_levels", market_id))
+
+    def get_candlestick_resolutions(self) -> List[int]:
+        rows = self.get(Query("/candlestick_resolutions"))
+        return [int(row["resolution"]) for row in rows]
+
+    def get_candlesticks_last_indexed_txn(self) -> Dict[int, int]:
+        """
+        Last transaction version aggregated into candlesticks, keyed by
+        resolution.
+        """
+        rows = self.get(Query("/candlesticks_last_indexed_txn"))
+        return {int(row["resolution"]): int(row["txn_version"]) for row in rows}
+
+    def get_candlesticks(
+        self,
+        market_id: int,
+        resolution: int,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> list:
+        """
+        Candlesticks of `market_id` at `resolution` seconds, oldest
+        first, starting from `start_time` and before `end_time` (ISO
+        8601 timestamps) if given.
+        """
+        query = _get_market_query("/candlesticks", market_id)
+        query = query.eq("resolution", resolution).order("start_time")
+        if start_time is not None:
+            query = query.gte("start_time", start_time)
+        if end_time is not None:
+            query = query.lt("start_time", end_time)
+        return [row for rows in self.iter_pages(query) for row in rows]
+
+    def get_orderbook(self, market_id: int, depth: int) -> Any:
+        return self.rpc("orderbook", market_id=market_id, depth=depth)
+
+    def get_market_aggregated_info(self, market_id: int, seconds: int) -> Any:
+        return self.rpc("market_aggregated_info", market=market_id, seconds=seconds)
+
+
+class AsyncDssClient:
+    """
+    Async variant of `DssClient`, over one pooled `httpx.AsyncClient`.
+    `iter_pages()` and `iter_rows()` are async generators.
+    """
+
+    base_url: str
+    client: httpx.AsyncClient
+    page_size: int
+
+    def __init__(
+        self,
+        base_url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.client = httpx.AsyncClient(timeout=timeout) if client is None else client
+        self.page_size = page_size
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncDssClient":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def get(self, query: Query, headers: Optional[Dict[str, str]] = None) -> list:
+        response = await self.client.get(
+            f"{self.base_url}{query.path}", params=query.get_params(), headers=headers
+        )
+        return _check(response)
+
+    async def rpc(self, function: str, **arguments: Any) -> Any:
+        response = await self.client.post(
+            f"{self.base_url}/rpc/{function}", json=arguments
+        )
+        return _check(response)
+
+    async def iter_pages(
+        self, query: Query, page_size: Optional[int] = None
+    ) -> AsyncIterator[list]:
+        if page_size is None:
+            page_size = self.page_size
+        start = 0
+        while True:
+            rows = await self.get(query, _get_range_headers(start, page_size))
+            if len(rows) > 0:
+                yield rows
+            if len(rows) < page_size:
+                return
+            start += len(rows)
+
+    async def iter_keyset_pages(
+        self,
+        query: Query,
+        keyset: Sequence[str],
+        descending: bool = False,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[list]:
+        if page_size is None:
+            page_size = self.page_size
+        page = _get_keyset_query(query, keyset, descending, page_size)
+        while True:
+            rows = await self.get(page)
+            if len(rows) > 0:
+                yield rows
+            if len(rows) < page_size:
+                return
+            page = _get_keyset_query(
+                query.after(keyset, rows[-1], descending), keyset, descending, page_size
+            )
+
+    async def iter_rows(
+        self,
+        query: Query,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        if keyset is None:
+            pages = self.iter_pages(query, page_size)
+        else:
+            pages = self.iter_keyset_pages(query, keyset, descending, page_size)
+        async for rows in pages:
+            for row in rows:
+                yield row
+
+    async def get_markets(self) -> list:
+        return await self.get(Query("/markets").order("market_id"))
+
+    async def get_fill_events(
+        self, market_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list:
+        query = _get_market_query("/fill_events", market_id)
+        query = query.order("txn_version", True).order("event_idx", True)
+        return await self.get(query if limit is None else query.limit(limit))
+
+    async def get_orders(
+        self,
+        market_id: Optional[int] = None,
+        user: Optional[str] = None,
+        order_status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        query = _get_market_query("/orders", market_id)
+        if user is not None:
+            query = query.eq("user", user)
+        if order_status is not None:
+            query = query.eq("order_status", order_status)
+        return await self.get(query if limit is None else query.limit(limit))
+
+    async def get_price_levels(self, market_id: int) -> list:
+        return await self.get(_get_market_query("/price_levels", market_id))
+
+    async def get_candlestick_resolutions(self) -> List[int]:
+        rows = await self.get(Query("/candlestick_resolutions"))
+        return [int(row["resolution"]) for row in rows]
+
+    async def get_candlesticks_last_indexed_txn(self) -> Dict[int, int]:
+        rows = await self.get(Query("/candlesticks_last_indexed_txn"))
+        return {int(row["resolution"]): int(row["txn_version"]) for row in rows}
+
+    async def get_candlesticks(
+        self,
+        market_id: int,
+        resolution: int,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> list:
+        query = _get_market_query("/candlesticks", market_id)
+        query = query.eq("resolution", resolution).order("start_time")
+        if start_time is not None:
+            query = query.gte("start_time", start_time)
+        if end_time is not None:
+            query = query.lt("start_time", end_time)
+        return [row async for rows in self.iter_pages(query) for row in rows]
+
+    async def get_orderbook(self, market_id: int, depth: int) -> Any:
+        return await self.rpc("orderbook", market_id=market_id, depth=depth)
+
+    async def get_market_aggregated_info(self, market_id: int, seconds: int) -> Any:
+        return await self.rpc(
+            "market_aggregated_info", market=market_id, seconds=seconds
+        )
@@ -0,0 +1,341 @@
+# Keyset-paginated export of DSS event views to partitioned files
+
+import json
+import os
+import queue
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from econia_sdk.dss.client import EVENT_KEYSET, DssClient, Query
+
+# Columns holding `u128` order IDs, which overflow Arrow's integer
+# types and are written as strings.
+DEFAULT_STRING_COLUMNS = ("maker_order_id", "taker_order_id", "order_id")
+
+FORMATS = ("parquet", "arrow")
+
+# Part files are named after the keys of their first and last rows.
+_PART = re.compile(r"part-(\d+)_(\d+)-(\d+)_(\d+)\.(parquet|arrow)$")
+
+CHECKPOINT_NAME = "_checkpoint.json"
+
+# (txn_version, event_idx)
+EventKey = Tuple[int, int]
+
+# Partition of rows: (market ID, UTC date as "YYYY-MM-DD").
+Partition = Tuple[int, str]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as e:
+        raise ImportError("pyarrow is required for Parquet/Arrow export") from e
+    return pyarrow
+
+
+def _get_key(row: dict) -> EventKey:
+    return (int(row["txn_version"]), int(row["event_idx"]))
+
+
+class ExportStats(dict):
+    """
+    Summary of a `DssExporter.export()` run, with keys `rows`, `pages`,
+    `files`, `partitions` (the `(market_id, date)` partitions written
+    to), `resumed_after` (the `(txn_version, event_idx)` key of the
+    last row previously exported, or `None`) and `buffered` (rows read
+    but not yet written).
+    """
+
+
+class DssExporter:
+    """
+    Exports the rows of a DSS event view, `/fill_events` by default (or
+    `/historical_trades`), to Parquet (or Arrow IPC, per `format`) files
+    under `root`, partitioned by market and UTC day:
+
+    `root/fill_events/market_id=1/date=2024-01-31/part-V0_I0-V1_I1.parquet`
+
+    As usual for Hive partitioning, the `market_id` column is only
+    stored in the path, from which dataset readers such as
+    `pyarrow.dataset.dataset(..., partitioning="hive")` restore it.
+
+    Rows are read in `(txn_version, event_idx)` order by keyset
+    pagination, so every page costs the same however deep the export,
+    on a thread that stays at most `max_queued_pages` pages ahead of
+    the writer. Buffered rows are written out as one part file per
+    partition, named after the keys of its first and last rows, when
+    their day is over, when `rows_per_file` rows are buffered, and at
+    the end of the export. After each such round, the key of the last
+    row written is saved to a checkpoint file, from which an interrupted
+    or repeated export resumes, first deleting any part files written
+    after the checkpoint. Checkpoints are kept per `market_id` passed to
+    `export()` (or for all markets), so exports of one view should
+    either always or never be restricted to a market, which `export()`
+    enforces. Only part files past a checkpoint are ever deleted.
+
+    Columns in `string_columns` are written as strings, and `schema`,
+    a `pyarrow.Schema`, may fix the type of every column.
+    """
+
+    client: DssClient
+    root: str
+    path: str
+    format: str
+    page_size: Optional[int]
+    max_queued_pages: int
+    rows_per_file: int
+    string_columns: Sequence[str]
+    schema: Any
+
+    def __init__(
+        self,
+        client: DssClient,
+        root: str,
+        path: str = "/fill_events",
+        format: str = "parquet",
+        page_size: Optional[int] = None,
+        max_queued_pages: int = 4,
+        rows_per_file: int = 1_000_000,
+        string_columns: Sequence[str] = DEFAULT_STRING_COLUMNS,
+        schema: Any = None,
+    ):
+        assert format in FORMATS, f"Format must be one of {FORMATS}!"
+        self.client = client
+        self.root = root
+        self.path = path
+        self.format = format
+        self.page_size = page_size
+        self.max_queued_pages = max_queued_pages
+        self.rows_per_file = rows_per_file
+        self.string_columns = string_columns
+        self.schema = schema
+
+    def get_directory(self, market_id: Optional[int] = None) -> str:
+        directory = os.path.join(self.root, self.path.strip("/"))
+        if market_id is None:
+            return directory
+        return os.path.join(directory, f"market_id={market_id}")
+
+    def _get_checkpoint_path(self, market_id: Optional[int]) -> str:
+        return os.path.join(self.get_directory(market_id), CHECKPOINT_NAME)
+
+    def get_last_key(self, market_id: Optional[int] = None) -> Optional[EventKey]:
+        """
+        Key of the last row exported, per the checkpoint.
+        """
+        try:
+            with open(self._get_checkpoint_path(market_id)) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return None
+        return (int(checkpoint["txn_version"]), int(checkpoint["event_idx"]))
+
+    def _save_checkpoint(self, market_id: Optional[int], key: EventKey):
+        path = self._get_checkpoint_path(market_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump({"txn_version": key[0], "event_idx": key[1]}, f)
+        os.replace(f"{path}.tmp", path)
+
+    def _get_parts(self, market_id: Optional[int]) -> List[Tuple[str, EventKey]]:
+        # Paths of part files under the directory of `market_id` (or of
+        # every market), with the keys of their last rows.
+        parts = []
+        for directory, _, files in os.walk(self.get_directory(market_id)):
+            for name in files:
+                match = _PART.match(name)
+                if match is not None:
+                    key = (int(match.group(3)), int(match.group(4)))
+                    parts.append((os.path.join(directory, name), key))
+        return parts
+
+    def _check_target(self, market_id: Optional[int], resume: bool):
+        # Refuse to export into a directory holding part files that are
+        # not covered by this export's checkpoint, since they would
+        # either be deleted or overlap the rows written.
+        if market_id is None:
+            directory = self.get_directory()
+            names = os.listdir(directory) if os.path.isdir(directory) else []
+            if any(
+                os.path.exists(os.path.join(directory, name, CHECKPOINT_NAME))
+                for name in names
+            ):
+                raise FileExistsError(
+                    f"{directory} holds exports of single markets, so cannot "
+                    "export all markets"
+                )
+        elif os.path.exists(self._get_checkpoint_path(None)):
+            raise FileExistsError(
+                f"{self.get_directory()} holds an export of all markets, so "
+                "cannot export a single market"
+            )
+        if len(self._get_parts(market_id)) == 0:
+            return
+        if not resume:
+            raise FileExistsError(
+                f"{self.get_directory(market_id)} is not empty, pass resume=True "
+                "to continue the export there"
+            )
+        if self.get_last_key(market_id) is None:
+            raise FileExistsError(
+                f"{self.get_directory(market_id)} holds part files but no "
+                f"{CHECKPOINT_NAME}"
+            )
+
+    def _remove_uncheckpointed(self, market_id: Optional[int], last_key: EventKey):
+        # Part files past the checkpoint are from an interrupted round,
+        # whose rows are exported again.
+        for path, key in self._get_parts(market_id):
+            if key > last_key:
+                os.remove(path)
+
+    def export(
+        self,
+        market_id: Optional[int] = None,
+        start_version: Optional[int] = None,
+        end_version: Optional[int] = None,
+        resume: bool = True,
+    ) -> ExportStats:
+        """
+        Export rows of `market_id` (or all markets) with transaction
+        versions from `start_version` up to `end_version`, if given,
+        after the last row already exported if `resume`. Raises
+        `FileExistsError` rather than write rows that may already be
+        exported, or delete part files not covered by the checkpoint:
+        if not `resume` and part files exist, or if they exist without
+        a checkpoint.
+        """
+        _import_pyarrow()
+        query = Query(self.path)
+        if market_id is not None:
+            query = query.eq("market_id", market_id)
+        if start_version is not None:
+            query = query.gte("txn_version", start_version)
+        if end_version is not None:
+            query = query.lte("txn_version", end_version)
+        self._check_target(market_id, resume)
+        last_key = self.get_last_key(market_id) if resume else None
+        if last_key is not None:
+            self._remove_uncheckpointed(market_id, last_key)
+            query = query.after(EVENT_KEYSET, dict(zip(EVENT_KEYSET, last_key)))
+        stats = ExportStats(
+            rows=0,
+            pages=0,
+            files=0,
+            partitions=set(),
+            resumed_after=last_key,
+            buffered=0,
+        )
+        pages: "queue.Queue[Any]" = queue.Queue(self.max_queued_pages)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._read, args=(query, pages, stop), daemon=True
+        )
+        reader.start()
+        buffers: Dict[Partition, List[dict]] = {}
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                stats["pages"] += 1
+                stats["rows"] += len(page)
+                self._on_page(page, buffers, market_id, stats)
+            self._flush(buffers, None, market_id, stats)
+        finally:
+            stop.set()
+            # Unblock the reader if it is waiting on a full queue.
+            while reader.is_alive():
+                try:
+                    pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+        return stats
+
+    def _read(self, query: Query, pages: "queue.Queue[Any]", stop: threading.Event):
+        try:
+            for page in self.client.iter_keyset_pages(
+                query, EVENT_KEYSET, page_size=self.page_size
+            ):
+                if stop.is_set():
+                    return
+                pages.put(page)
+            pages.put(None)
+        except Exception as e:
+            pages.put(e)
+
+    def _on_page(
+        self,
+        page: List[dict],
+        buffers: Dict[Partition, List[dict]],
+        market_id: Optional[int],
+        stats: ExportStats,
+    ):
+        for row in page:
+            # Timestamps are ISO 8601, in UTC.
+            partition = (int(row["market_id"]), row["time"][:10])
+            rows = buffers.get(partition)
+            if rows is None:
+                # Rows come in time order, so days before this one are
+                # over, and their rows precede every buffered row.
+                if any(date < partition[1] for _, date in buffers):
+                    self._flush(buffers, partition[1], market_id, stats)
+                rows = buffers[partition] = []
+            rows.append(row)
+            stats["buffered"] += 1
+            if stats["buffered"] >= self.rows_per_file:
+                self._flush(buffers, None, market_id, stats)
+
+    def _flush(
+        self,
+        buffers: Dict[Partition, List[dict]],
+        before: Optional[str],
+        market_id: Optional[int],
+        stats: ExportStats,
+    ):
+        # Write the partitions of days before `before` (or all), after
+        # which every row up to the last one written has been written.
+        last_key: Optional[EventKey] = None
+        for partition in list(buffers):
+            if before is None or partition[1] < before:
+                rows = buffers.pop(partition)
+                stats["buffered"] -= len(rows)
+                self._write(partition, rows, stats)
+                key = _get_key(rows[-1])
+                if last_key is None or key > last_key:
+                    last_key = key
+        if last_key is not None:
+            self._save_checkpoint(market_id, last_key)
+
+    def _write(self, partition: Partition, rows: List[dict], stats: ExportStats):
+        pyarrow = _import_pyarrow()
+        for column in self.string_columns:
+            if column in rows[0]:
+                for row in rows:
+                    if row[column] is not None:
+                        row[column] = str(row[column])
+        # The market ID is stored in the partition path, as readers of
+        # Hive partitioned datasets expect.
+        table = pyarrow.Table.from_pylist(rows, schema=self.schema).drop(["market_id"])
+        market_id, date = partition
+        directory = os.path.join(self.get_directory(market_id), f"date={date}")
+        os.makedirs(directory, exist_ok=True)
+        first, last = _get_key(rows[0]), _get_key(rows[-1])
+        name = f"part-{first[0]}_{first[1]}-{last[0]}_{last[1]}.{self.format}"
+        path = os.path.join(directory, name)
+        temporary_path = f"{path}.tmp"
+        if self.format == "parquet":
+            import pyarrow.parquet  # type: ignore
+
+            pyarrow.parquet.write_table(table, temporary_path)
+        else:
+            import pyarrow.feather  # type: ignore
+
+            pyarrow.feather.write_feather(table, temporary_path)
+        os.replace(temporary_path, path)
+        stats["files"] += 1
+        stats["partitions"].add(partition)
@@ -1,5 +1,7 @@
 # Market entry functions
 
+from typing import Iterable, List, Tuple
+
 from aptos_sdk.account_address import AccountAddress
 from aptos_sdk.bcs import Serializer, encoder
 from aptos_sdk.transactions import EntryFunction, ModuleId
@@ -270,3 +272,58 @@ def place_market_order_user_entry(
             encoder(self_match_behavior, Serializer.u8),
         ],
     )
+
+
+def place_limit_orders_user_entry(
+    econia_address: AccountAddress,
+    base: TypeTag,
+    quote: TypeTag,
+    market_id: int,
+    integrator: AccountAddress,
+    orders: Iterable[Tuple[Side, int, int]],
+    restriction: Restriction,
+    self_match_behavior: SelfMatchBehavior,
+) -> List[EntryFunction]:
+    """
+    Create one `EntryFunction` for [place_limit_order_user_entry](https://github.com/econia-labs/econia/blob/main/src/move/econia/doc/market.md#0xc0deb00c_market_place_limit_order_user_entry)
+    per order of a ladder, to be submitted with `EconiaClient.submit_txs()`.
+
+    Arguments:
+    * `orders`: `(side, size, price)` of each order, with size in lots and
+      price in ticks per lot.
+    * Others as per `place_limit_order_user_entry()`.
+    """
+    return [
+        place_limit_order_user_entry(
+            econia_address,
+            base,
+            quote,
+            market_id,
+            integrator,
+            side,
+            size,
+            price,
+            restriction,
+            self_match_behavior,
+        )
+        for side, size, price in orders
+    ]
+
+
+def cancel_orders_user(
+    econia_address: AccountAddress,
+    market_id: int,
+    orders: Iterable[Tuple[Side, int]],
+) -> List[EntryFunction]:
+    """
+    Create one `EntryFunction` for [cancel_order_user](https://github.com/econia-labs/econia/blob/main/src/move/econia/doc/market.md#0xc0deb00c_market_cancel_order_user)
+    per order, to be submitted with `EconiaClient.submit_txs()`.
+
+    Arguments:
+    * `orders`: `(side, market_order_id)` of each order to cancel.
+    * Others as per `cancel_order_user()`.
+    """
+    return [
+        cancel_order_user(econia_address, market_id, side, market_order_id)
+        for side, market_order_id in orders
+    ]
@@ -0,0 +1,202 @@
+# Precompiled per-market order entry functions
+
+import struct
+from typing import Iterable, List, Tuple
+
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.bcs import Serializer
+from aptos_sdk.transactions import EntryFunction, ModuleId
+from aptos_sdk.type_tag import TypeTag
+
+from econia_sdk.entry.market import get_module_id
+from econia_sdk.types import Restriction, SelfMatchBehavior, Side
+
+_pack_u64 = struct.Struct("<Q").pack
+
+_SIDES = {Side.BID: b"\x00", Side.ASK: b"\x01"}
+
+
+def _pack_u128(value: int) -> bytes:
+    return value.to_bytes(16, "little")
+
+
+class PrecompiledEntryFunction(EntryFunction):
+    """
+    An `EntryFunction` whose module ID, function name and type
+    arguments are serialized once up front, by the template that creates
+    it, so that serializing it for signing only writes its arguments.
+    """
+
+    _prefix: bytes
+
+    def __init__(
+        self,
+        module: ModuleId,
+        function: str,
+        ty_args: List[TypeTag],
+        args: List[bytes],
+        prefix: bytes,
+    ):
+        super().__init__(module, function, ty_args, args)
+        self._prefix = prefix
+
+    def serialize(self, serializer: Serializer):
+        # There are fewer than 128 arguments, each shorter than 128
+        # bytes, so all ULEB128 lengths are a single byte.
+        parts = [self._prefix, bytes((len(self.args),))]
+        for arg in self.args:
+            parts.append(bytes((len(arg),)))
+            parts.append(arg)
+        serializer.fixed_bytes(b"".join(parts))
+
+
+def _get_prefix(module: ModuleId, function: str, ty_args: List[TypeTag]) -> bytes:
+    serializer = Serializer()
+    module.serialize(serializer)
+    serializer.str(function)
+    serializer.sequence(ty_args, Serializer.struct)
+    return serializer.output()
+
+
+class OrderTemplates:
+    """
+    Builds the order entry functions of one market, equivalent to those
+    from `econia_sdk.entry.market`, but with the module ID, type
+    arguments and constant arguments (market ID, integrator, restriction
+    and self match behavior) encoded once on construction. Building an
+    order then only encodes its side, size, price or order ID.
+
+    `base` and `quote` are only needed for `place_limit_order()`.
+    """
+
+    econia_address: AccountAddress
+    market_id: int
+    module: ModuleId
+    ty_args: List[TypeTag]
+
+    def __init__(
+        self,
+        econia_address: AccountAddress,
+        market_id: int,
+        base: TypeTag,
+        quote: TypeTag,
+        integrator: AccountAddress,
+        restriction: Restriction = Restriction.NoRestriction,
+        self_match_behavior: SelfMatchBehavior = SelfMatchBehavior.CancelMaker,
+    ):
+        self.econia_address = econia_address
+        self.market_id = market_id
+        self.module = get_module_id(econia_address)
+        self.ty_args = [base, quote]
+        self._market_id = _pack_u64(market_id)
+        self._integrator = integrator.address
+        self._restriction = bytes((restriction,))
+        self._self_match_behavior = bytes((self_match_behavior,))
+        self._place_limit_order_prefix = _get_prefix(
+            self.module, "place_limit_order_user_entry", self.ty_args
+        )
+        self._cancel_order_prefix = _get_prefix(self.module, "cancel_order_user", [])
+        self._change_order_size_prefix = _get_prefix(
+            self.module, "change_order_size_user", []
+        )
+        self._cancel_all_orders_prefix = _get_prefix(
+            self.module, "cancel_all_orders_user", []
+        )
+
+    def place_limit_order(
+        self, side: Side, size: int, price: int
+    ) -> PrecompiledEntryFunction:
+        """
+        As per `econia_sdk.entry.market.place_limit_order_user_entry()`.
+        """
+        return PrecompiledEntryFunction(
+            self.module,
+            "place_limit_order_user_entry",
+            self.ty_args,
+            [
+                self._market_id,
+                self._integrator,
+                _SIDES[side],
+                _pack_u64(size),
+                _pack_u64(price),
+                self._restriction,
+                self._self_match_behavior,
+            ],
+            self._place_limit_order_prefix,
+        )
+
+    def cancel_order(
+        self, side: Side, market_order_id: int
+    ) -> PrecompiledEntryFunction:
+        """
+        As per `econia_sdk.entry.market.cancel_order_user()`.
+        """
+        return PrecompiledEntryFunction(
+            self.module,
+            "cancel_order_user",
+            [],
+            [self._market_id, _SIDES[side], _pack_u128(market_order_id)],
+            self._cancel_order_prefix,
+        )
+
+    def change_order_size(
+        self, side: Side, market_order_id: int, new_size: int
+    ) -> PrecompiledEntryFunction:
+        """
+        As per `econia_sdk.entry.market.change_order_size_user()`.
+        """
+        return PrecompiledEntryFunction(
+            self.module,
+            "change_order_size_user",
+            [],
+            [
+                self._market_id,
+                _SIDES[side],
+                _pack_u128(market_order_id),
+                _pack_u64(new_size),
+            ],
+            self._change_order_size_prefix,
+        )
+
+    def cancel_all_orders(self, side: Side) -> PrecompiledEntryFunction:
+        """
+        As per `econia_sdk.entry.market.cancel_all_orders_user()`.
+        """
+        return PrecompiledEntryFunction(
+            self.module,
+            "cancel_all_orders_user",
+            [],
+            [self._market_id, _SIDES[side]],
+            self._cancel_all_orders_prefix,
+        )
+
+    def place_limit_orders(
+        self, orders: Iterable[Tuple[Side, int, int]]
+    ) -> List[PrecompiledEntryFunction]:
+        """
+        Build one limit order per `(side, size, price)` of a ladder.
+        """
+        return [
+            self.place_limit_order(side, size, price) for side, size, price in orders
+        ]
+
+    def cancel_orders(
+        self, orders: Iterable[Tuple[Side, int]]
+    ) -> List[PrecompiledEntryFunction]:
+        """
+        Build one cancellation per `(side, market_order_id)`.
+        """
+        return [
+            self.cancel_order(side, market_order_id) for side, market_order_id in orders
+        ]
+
+    def change_order_sizes(
+        self, orders: Iterable[Tuple[Side, int, int]]
+    ) -> List[PrecompiledEntryFunction]:
+        """
+        Build one size change per `(side, market_order_id, new_size)`.
+        """
+        return [
+            self.change_order_size(side, market_order_id, new_size)
+            for side, market_order_id, new_size in orders
+        ]
@@ -0,0 +1,173 @@
+# Iterators over full event streams
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, List, Optional
+
+# Most fullnodes cap event pages at 100 events.
+DEFAULT_PAGE_SIZE = 100
+
+
+class EventIterator:
+    """
+    Iterates over an event stream from sequence number `start` until
+    the latest event, requesting `page_size` events at a time via
+    `get_page(start, limit)`, and yielding each event passed through
+    `convert()` only as it is consumed.
+
+    If `prefetch`, the next page is requested in a background thread
+    while the current one is being consumed.
+
+    `cursor` is the sequence number of the next event to be yielded:
+    persist it as a checkpoint and pass it as `start` to resume later
+    without downloading the same events again. Once exhausted, the
+    iterator can also be iterated again to pick up events emitted since.
+
+    Since nodes may return fewer than `page_size` events per page,
+    iteration only ends on an empty page, which costs one request more
+    than necessary when `page_size` is within the node's cap.
+    """
+
+    cursor: int
+    page_size: int
+
+    def __init__(
+        self,
+        get_page: Callable[[int, int], List[dict]],
+        convert: Callable[[dict], Any],
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ):
+        self.cursor = start
+        self.page_size = page_size
+        self._get_page = get_page
+        self._convert = convert
+        self._prefetch = prefetch
+        self._events: Deque[dict] = deque()
+        self._next_start = start
+        self._done = False
+        self._future: Optional[Future] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __iter__(self):
+        self._done = False
+        return self
+
+    def __next__(self):
+        if len(self._events) == 0:
+            if self._done:
+                raise StopIteration
+            self._load_page()
+            if len(self._events) == 0:
+                raise StopIteration
+        event = self._events.popleft()
+        self.cursor = int(event["sequence_number"]) + 1
+        return self._convert(event)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request_page(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future = self._executor.submit(
+            self._get_page, self._next_start, self.page_size
+        )
+
+    def _load_page(self):
+        if self._future is not None:
+            events = self._future.result()
+            self._future = None
+        else:
+            events = self._get_page(self._next_start, self.page_size)
+        # Nodes may return fewer events than requested (most cap pages
+        # at 100), so only an empty page ends the stream.
+        if len(events) == 0:
+            self._done = True
+            self.close()
+        else:
+            self._next_start = int(events[-1]["sequence_number"]) + 1
+            if self._prefetch:
+                self._request_page()
+        self._events.extend(events)
+
+    def close(self):
+        """
+        Release the prefetch thread, if any.
+        """
+        self._future = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class AsyncEventIterator:
+    """
+    Async variant of `EventIterator`, where `get_page(start, limit)` is
+    a coroutine function and prefetching is done in a task.
+    """
+
+    cursor: int
+    page_size: int
+
+    def __init__(
+        self,
+        get_page: Callable[[int, int], Awaitable[List[dict]]],
+        convert: Callable[[dict], Any],
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ):
+        self.cursor = start
+        self.page_size = page_size
+        self._get_page = get_page
+        self._convert = convert
+        self._prefetch = prefetch
+        self._events: Deque[dict] = deque()
+        self._next_start = start
+        self._done = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __aiter__(self):
+        self._done = False
+        return self
+
+    async def __anext__(self):
+        if len(self._events) == 0:
+            if self._done:
+                raise StopAsyncIteration
+            await self._load_page()
+            if len(self._events) == 0:
+                raise StopAsyncIteration
+        event = self._events.popleft()
+        self.cursor = int(event["sequence_number"]) + 1
+        return self._convert(event)
+
+    async def _load_page(self):
+        if self._task is not None:
+            events = await self._task
+            self._task = None
+        else:
+            events = await self._get_page(self._next_start, self.page_size)
+        if len(events) == 0:
+            self._done = True
+        else:
+            self._next_start = int(events[-1]["sequence_number"]) + 1
+            if self._prefetch:
+                self._task = asyncio.create_task(
+                    self._get_page(self._next_start, self.page_size)
+                )
+        self._events.extend(events)
+
+    def close(self):
+        """
+        Cancel the prefetch task, if any.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
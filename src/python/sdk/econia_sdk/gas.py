@@ -0,0 +1,108 @@
+# Cached gas estimates from sampled simulations
+
+import math
+import random
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from aptos_sdk.transactions import EntryFunction
+
+# (module, function, type arguments, BCS length of each argument)
+GasEstimateKey = Tuple[str, str, Tuple[str, ...], Tuple[int, ...]]
+
+
+def get_gas_estimate_key(entry: EntryFunction) -> GasEstimateKey:
+    """
+    Key entry functions by name, type arguments and argument shape: the
+    serialized length of each argument, which reflects vector lengths
+    (and so the work done) but not values.
+    """
+    return (
+        str(entry.module),
+        entry.function,
+        tuple(str(ty_arg) for ty_arg in entry.ty_args),
+        tuple(len(arg) for arg in entry.args),
+    )
+
+
+class GasEstimateCache:
+    """
+    Gas used by simulations of each kind of entry function, so that a
+    tight `max_gas_amount` can be set without simulating every
+    transaction.
+
+    `EconiaClient` simulates a transaction when its kind has no estimate
+    yet, and otherwise with probability `sample_rate`, recording the gas
+    used with `record()`. The estimate returned by `get()` is the
+    highest gas used among the last `max_samples` simulations of that
+    kind, scaled by `margin`, since the gas used by matching orders
+    varies with the state of the order book.
+
+    A failed simulation is reported with `record_failure()` instead, and
+    that kind is not simulated again for `failure_backoff` seconds,
+    doubling with each consecutive failure up to `max_failure_backoff`,
+    so that transactions which keep failing simulation do not pay for
+    one on every submission.
+    """
+
+    sample_rate: float
+    margin: float
+    max_samples: int
+    failure_backoff: float
+    max_failure_backoff: float
+    samples: Dict[GasEstimateKey, Deque[int]]
+    # Consecutive failed simulations of each kind, and when to retry.
+    failures: Dict[GasEstimateKey, Tuple[int, float]]
+
+    def __init__(
+        self,
+        sample_rate: float = 0.05,
+        margin: float = 1.5,
+        max_samples: int = 20,
+        failure_backoff: float = 10,
+        max_failure_backoff: float = 600,
+    ):
+        self.sample_rate = sample_rate
+        self.margin = margin
+        self.max_samples = max_samples
+        self.failure_backoff = failure_backoff
+        self.max_failure_backoff = max_failure_backoff
+        self.samples = {}
+        self.failures = {}
+
+    def should_simulate(self, entry: EntryFunction) -> bool:
+        key = get_gas_estimate_key(entry)
+        failure = self.failures.get(key)
+        if failure is not None and time.monotonic() < failure[1]:
+            return False
+        return key not in self.samples or random.random() < self.sample_rate
+
+    def record(self, entry: EntryFunction, gas_used: int):
+        key = get_gas_estimate_key(entry)
+        self.failures.pop(key, None)
+        if key not in self.samples:
+            self.samples[key] = deque(maxlen=self.max_samples)
+        self.samples[key].append(gas_used)
+
+    def record_failure(self, entry: EntryFunction):
+        key = get_gas_estimate_key(entry)
+        n_failures = self.failures.get(key, (0, 0.0))[0] + 1
+        backoff = min(
+            self.failure_backoff * 2 ** min(n_failures - 1, 16),
+            self.max_failure_backoff,
+        )
+        self.failures[key] = (n_failures, time.monotonic() + backoff)
+
+    def get(self, entry: EntryFunction) -> Optional[int]:
+        """
+        Return the `max_gas_amount` to use for `entry`, if estimated.
+        """
+        samples = self.samples.get(get_gas_estimate_key(entry))
+        if samples is None:
+            return None
+        return math.ceil(max(samples) * self.margin)
+
+    def clear(self):
+        self.samples = {}
+        self.failures = {}
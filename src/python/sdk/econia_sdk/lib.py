@@ -1,4 +1,6 @@
-from typing import Any, List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from aptos_sdk.account import Account
 from aptos_sdk.account_address import AccountAddress
@@ -6,69 +8,422 @@ from aptos_sdk.client import RestClient
 from aptos_sdk.async_client import RestClient as AsyncRestClient
 from aptos_sdk.transactions import EntryFunction, TransactionPayload
 
+from econia_sdk.cache.constants import ConstantsRegistry
+from econia_sdk.cache.event_handles import EventHandleCache
+from econia_sdk.confirmations import AsyncConfirmationTracker, ConfirmationTracker
+from econia_sdk.gas import GasEstimateCache
+from econia_sdk.sequence import SequenceNumberManager
+from econia_sdk.signing import SigningContext
+
+# (module, function, type_arguments, arguments), as taken by `get_returns()`.
+ViewCall = Tuple[str, str, List[str], List]
+
 
 class EconiaClient:
+    """
+    Signs and submits Econia entry function transactions for `account`.
+
+    By default each transaction is signed with the account's sequence
+    number as read from the node. Pass a `SequenceNumberManager` as
+    `sequence_numbers` to allocate them locally instead, so that many
+    transactions can be submitted back-to-back without waiting for the
+    previous ones to commit.
+
+    Chain ID and gas parameters are kept in `signing_context`, fetched
+    once rather than per transaction.
+
+    If given a `ConfirmationTracker` (or `AsyncConfirmationTracker` for
+    an async client) as `confirmations`, `submit_tx_wait` waits through
+    it rather than polling each transaction. Share one tracker between
+    all clients using the same node.
+
+    `simulate_tx` runs a transaction without submitting it. If given a
+    `GasEstimateCache` as `gas_estimates`, transactions are submitted
+    with a `max_gas_amount` estimated from sampled simulations.
+    """
+
     econia_address: AccountAddress
     aptos_client: RestClient
     aptos_client_async: AsyncRestClient
     user_account: Account
+    sequence_numbers: Optional[SequenceNumberManager]
+    signing_context: SigningContext
+    confirmations: Optional[Union[ConfirmationTracker, AsyncConfirmationTracker]]
+    gas_estimates: Optional[GasEstimateCache]
 
     def __init__(
-            self,
-            node_url: str,
-            econia: AccountAddress,
-            account: Account,
-            rest_client: Optional[RestClient] = None,
-            rest_client_async: Optional[AsyncRestClient] = None,
-            node_api_key: Optional[str] = None
-        ):
+        self,
+        node_url: str,
+        econia: AccountAddress,
+        account: Account,
+        rest_client: Optional[RestClient] = None,
+        rest_client_async: Optional[AsyncRestClient] = None,
+        node_api_key: Optional[str] = None,
+        sequence_numbers: Optional[SequenceNumberManager] = None,
+        signing_context: Optional[SigningContext] = None,
+        confirmations: Optional[
+            Union[ConfirmationTracker, AsyncConfirmationTracker]
+        ] = None,
+        gas_estimates: Optional[GasEstimateCache] = None,
+    ):
         self.econia_address = econia
         if rest_client == None and rest_client_async == None:
             self.aptos_client = RestClient(node_url)
             if node_api_key != None:
-                self.aptos_client.client.headers["Authorization"] = f"Bearer {node_api_key}"
+                self.aptos_client.client.headers[
+                    "Authorization"
+                ] = f"Bearer {node_api_key}"
         elif rest_client != None:
             if node_api_key != None:
                 rest_client.client.headers["Authorization"] = f"Bearer {node_api_key}"
             self.aptos_client = rest_client
         elif rest_client_async != None:
             if node_api_key != None:
-                rest_client_async.client.headers["Authorization"] = f"Bearer {node_api_key}"
+                rest_client_async.client.headers[
+                    "Authorization"
+                ] = f"Bearer {node_api_key}"
             self.aptos_client_async = rest_client_async
         self.user_account = account
+        self.sequence_numbers = sequence_numbers
+        self.signing_context = (
+            SigningContext() if signing_context is None else signing_context
+        )
+        self.confirmations = confirmations
+        self.gas_estimates = gas_estimates
+
+    def _record_gas_used(self, entry: EntryFunction, txn: dict):
+        if self.gas_estimates is None:
+            return
+        if txn["success"]:
+            self.gas_estimates.record(entry, int(txn["gas_used"]))
+        else:
+            self.gas_estimates.record_failure(entry)
+
+    def simulate_tx(
+        self, entry: EntryFunction, sequence_number: Optional[int] = None
+    ) -> dict:
+        """
+        Simulate `entry` without submitting it, returning the simulated
+        transaction, with `success`, `vm_status` and `gas_used`. The
+        account's sequence number is read from the node unless given.
+        """
+        if sequence_number is None:
+            sequence_number = self.aptos_client.account_sequence_number(
+                self.user_account.address()
+            )
+        raw_tx = self.signing_context.get_raw_transaction(
+            self.aptos_client,
+            self.user_account,
+            TransactionPayload(entry),
+            sequence_number,
+        )
+        txn = self.aptos_client.simulate_transaction(raw_tx, self.user_account)[0]
+        self._record_gas_used(entry, txn)
+        return txn
+
+    async def gen_simulate_tx(
+        self, entry: EntryFunction, sequence_number: Optional[int] = None
+    ) -> dict:
+        """
+        Async variant of `simulate_tx()`.
+        """
+        if sequence_number is None:
+            sequence_number = await self.aptos_client_async.account_sequence_number(
+                self.user_account.address()
+            )
+        raw_tx = await self.signing_context.gen_get_raw_transaction(
+            self.aptos_client_async,
+            self.user_account,
+            TransactionPayload(entry),
+            sequence_number,
+        )
+        txn = (
+            await self.aptos_client_async.simulate_transaction(
+                raw_tx, self.user_account
+            )
+        )[0]
+        self._record_gas_used(entry, txn)
+        return txn
+
+    def _get_max_gas_amount(
+        self, entry: EntryFunction, sequence_number: int
+    ) -> Optional[int]:
+        # Simulating with the sequence number the transaction will be
+        # signed with saves reading it again. A simulation that cannot
+        # be made only costs the estimate: the submission that follows
+        # reports the error if there is one.
+        if self.gas_estimates is None:
+            return None
+        if self.gas_estimates.should_simulate(entry):
+            try:
+                self.simulate_tx(entry, sequence_number)
+            except Exception:
+                self.gas_estimates.record_failure(entry)
+        return self.gas_estimates.get(entry)
+
+    async def _gen_get_max_gas_amount(
+        self, entry: EntryFunction, sequence_number: int
+    ) -> Optional[int]:
+        if self.gas_estimates is None:
+            return None
+        if self.gas_estimates.should_simulate(entry):
+            try:
+                await self.gen_simulate_tx(entry, sequence_number)
+            except Exception:
+                self.gas_estimates.record_failure(entry)
+        return self.gas_estimates.get(entry)
 
     def submit_tx(self, entry: EntryFunction) -> str:
         payload = TransactionPayload(entry)
-        signed_tx = self.aptos_client.create_bcs_signed_transaction(
-            self.user_account, payload
+        if self.sequence_numbers is None:
+            sequence_number = self.aptos_client.account_sequence_number(
+                self.user_account.address()
+            )
+            signed_tx = self.signing_context.sign(
+                self.aptos_client,
+                self.user_account,
+                payload,
+                sequence_number,
+                self._get_max_gas_amount(entry, sequence_number),
+            )
+            return self.aptos_client.submit_bcs_transaction(signed_tx)
+        sequence_number = self.sequence_numbers.allocate(self.aptos_client)
+        return self._submit_allocated(
+            payload, sequence_number, self._get_max_gas_amount(entry, sequence_number)
         )
-        return self.aptos_client.submit_bcs_transaction(signed_tx)
-    
+
+    def _submit_allocated(
+        self,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int],
+    ) -> str:
+        assert self.sequence_numbers is not None
+        try:
+            signed_tx = self.signing_context.sign(
+                self.aptos_client,
+                self.user_account,
+                payload,
+                sequence_number,
+                max_gas_amount,
+            )
+        except Exception:
+            self.sequence_numbers.release(sequence_number)
+            raise
+        try:
+            txn_hash = self.aptos_client.submit_bcs_transaction(signed_tx)
+        except Exception as e:
+            self.sequence_numbers.failed(sequence_number, e)
+            raise
+        self.sequence_numbers.submitted(sequence_number, txn_hash)
+        return txn_hash
+
     async def gen_submit_tx(self, entry: EntryFunction) -> str:
         payload = TransactionPayload(entry)
-        signed_tx = await self.aptos_client_async.create_bcs_signed_transaction(
-            self.user_account, payload
+        if self.sequence_numbers is None:
+            sequence_number = await self.aptos_client_async.account_sequence_number(
+                self.user_account.address()
+            )
+            signed_tx = await self.signing_context.gen_sign(
+                self.aptos_client_async,
+                self.user_account,
+                payload,
+                sequence_number,
+                await self._gen_get_max_gas_amount(entry, sequence_number),
+            )
+            return await self.aptos_client_async.submit_bcs_transaction(signed_tx)
+        sequence_number = await self.sequence_numbers.gen_allocate(
+            self.aptos_client_async
+        )
+        return await self._gen_submit_allocated(
+            payload,
+            sequence_number,
+            await self._gen_get_max_gas_amount(entry, sequence_number),
         )
-        return await self.aptos_client_async.submit_bcs_transaction(signed_tx)
+
+    async def _gen_submit_allocated(
+        self,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int],
+    ) -> str:
+        assert self.sequence_numbers is not None
+        try:
+            signed_tx = await self.signing_context.gen_sign(
+                self.aptos_client_async,
+                self.user_account,
+                payload,
+                sequence_number,
+                max_gas_amount,
+            )
+        except Exception:
+            self.sequence_numbers.release(sequence_number)
+            raise
+        try:
+            txn_hash = await self.aptos_client_async.submit_bcs_transaction(signed_tx)
+        except Exception as e:
+            self.sequence_numbers.failed(sequence_number, e)
+            raise
+        self.sequence_numbers.submitted(sequence_number, txn_hash)
+        return txn_hash
+
+    def submit_txs(
+        self, entries: List[EntryFunction], max_workers: int = 8
+    ) -> List[str]:
+        """
+        Submit `entries` (for instance a ladder of orders from
+        `place_limit_orders_user_entry()`) with consecutive sequence
+        numbers, in order, returning their hashes. Each transaction is
+        posted as soon as its sequence number is allocated, up to
+        `max_workers` at a time, instead of waiting on the previous
+        submission.
+
+        A `SequenceNumberManager` is created for the client if it has
+        none. If any submission fails the first error is raised once all
+        others are done; sequence numbers of failed submissions are
+        reused by the next ones.
+        """
+        if self.sequence_numbers is None:
+            self.sequence_numbers = SequenceNumberManager(self.user_account.address())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for entry in entries:
+                sequence_number = self.sequence_numbers.allocate(self.aptos_client)
+                max_gas_amount = self._get_max_gas_amount(entry, sequence_number)
+                futures.append(
+                    executor.submit(
+                        self._submit_allocated,
+                        TransactionPayload(entry),
+                        sequence_number,
+                        max_gas_amount,
+                    )
+                )
+        return [future.result() for future in futures]
+
+    async def gen_submit_txs(self, entries: List[EntryFunction]) -> List[str]:
+        """
+        Async variant of `submit_txs()`, posting all transactions
+        concurrently.
+        """
+        if self.sequence_numbers is None:
+            self.sequence_numbers = SequenceNumberManager(self.user_account.address())
+        tasks = []
+        for entry in entries:
+            sequence_number = await self.sequence_numbers.gen_allocate(
+                self.aptos_client_async
+            )
+            max_gas_amount = await self._gen_get_max_gas_amount(entry, sequence_number)
+            tasks.append(
+                asyncio.ensure_future(
+                    self._gen_submit_allocated(
+                        TransactionPayload(entry), sequence_number, max_gas_amount
+                    )
+                )
+            )
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
 
     def submit_tx_wait(self, entry: EntryFunction) -> str:
         txn_hash = self.submit_tx(entry)
-        self.aptos_client.wait_for_transaction(txn_hash)
+        if isinstance(self.confirmations, ConfirmationTracker):
+            self.confirmations.wait(txn_hash, self.user_account.address())
+        else:
+            self.aptos_client.wait_for_transaction(txn_hash)
         return txn_hash
-    
+
     async def gen_submit_tx_wait(self, entry: EntryFunction) -> str:
         txn_hash = await self.gen_submit_tx(entry)
-        await self.aptos_client_async.wait_for_transaction(txn_hash)
+        if isinstance(self.confirmations, AsyncConfirmationTracker):
+            await self.confirmations.wait(txn_hash, self.user_account.address())
+        else:
+            await self.aptos_client_async.wait_for_transaction(txn_hash)
         return txn_hash
 
 
+def _get_view_request(base_url: str, ledger_version: int) -> str:
+    if ledger_version < 0:
+        return f"{base_url}/view"
+    return f"{base_url}/view?ledger_version={ledger_version}"
+
+
+def _get_view_payload(
+    econia_address: AccountAddress,
+    module: str,
+    function: str,
+    type_arguments: List[str],
+    arguments: List,
+) -> Dict[str, Any]:
+    return {
+        "function": f"{econia_address}::{module}::{function}",
+        "type_arguments": type_arguments,
+        "arguments": arguments,
+    }
+
+
+def _get_events_by_handle_request(
+    base_url: str,
+    econia_address: AccountAddress,
+    struct_type: str,
+    field_name: str,
+    limit: Optional[int],
+    start: Optional[int] = None,
+) -> str:
+    request = (
+        f"{base_url}/accounts/{econia_address.hex()}/events/{struct_type}/{field_name}"
+    )
+    if limit is not None and start is not None:
+        request = f"{request}?limit={limit}&start={start}"
+    elif limit is not None:
+        request = f"{request}?limit={limit}"
+    elif start is not None:
+        request = f"{request}?start={start}"
+    return request
+
+
+def _get_events_by_creation_number_request(
+    base_url: str,
+    emission_address: AccountAddress,
+    creation_number: int,
+    limit: Optional[int],
+    start: Optional[int],
+) -> str:
+    request = f"{base_url}/accounts/{emission_address.hex()}/events/{creation_number}"
+    if limit is not None and start is not None:
+        request = f"{request}?limit={limit}&start={start}"
+    elif limit is not None:
+        request = f"{request}?limit={limit}"
+    elif start is not None:
+        request = f"{request}?start={start}"
+    return request
+
+
 class EconiaViewer:
     econia_address: AccountAddress
     aptos_client: RestClient
+    constants: ConstantsRegistry
+    event_handles: EventHandleCache
 
-    def __init__(self, node_url: str, econia: AccountAddress, node_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        node_url: str,
+        econia: AccountAddress,
+        node_api_key: Optional[str] = None,
+        constants: Optional[ConstantsRegistry] = None,
+        event_handles: Optional[EventHandleCache] = None,
+    ):
         self.econia_address = econia
         self.aptos_client = RestClient(node_url)
+        if constants is None:
+            self.constants = ConstantsRegistry()
+        else:
+            self.constants = constants
+        if event_handles is None:
+            self.event_handles = EventHandleCache()
+        else:
+            self.event_handles = event_handles
         if node_api_key != None:
             self.aptos_client.client.headers["Authorization"] = f"Bearer {node_api_key}"
 
@@ -80,35 +435,69 @@ class EconiaViewer:
         arguments: List = [],  # string encoded args i.e "12345" or "0xabcdef" or "abracadabra"
         ledger_version: int = -1,
     ) -> List:
-        if ledger_version < 0:
-            request = f"{self.aptos_client.base_url}/view"
-        else:
-            request = (
-                f"{self.aptos_client.base_url}/view?ledger_version={ledger_version}"
-            )
-
         response = self.aptos_client.client.post(
-            request,
-            json={
-                "function": f"{self.econia_address}::{module}::{function}",
-                "type_arguments": type_arguments,
-                "arguments": arguments,
-            },
+            _get_view_request(self.aptos_client.base_url, ledger_version),
+            json=_get_view_payload(
+                self.econia_address, module, function, type_arguments, arguments
+            ),
         )
 
         if response.status_code >= 400:
             raise Exception(response.text, response.status_code)
         return response.json()
 
+    def get_returns_batch(
+        self,
+        calls: List[ViewCall],
+        ledger_version: int = -1,
+        max_workers: int = 10,
+    ) -> List[List]:
+        """
+        Execute many view functions concurrently against one ledger
+        version, returning their results in the same order as `calls`.
+
+        If `ledger_version` is negative the latest ledger version is
+        read once up front and every call is pinned to it, so that all
+        results describe the same on-chain state.
+        """
+        if ledger_version < 0:
+            ledger_version = int(self.aptos_client.info()["ledger_version"])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.get_returns,
+                    module,
+                    function,
+                    type_arguments,
+                    arguments,
+                    ledger_version,
+                )
+                for (module, function, type_arguments, arguments) in calls
+            ]
+            return [future.result() for future in futures]
+
+    def get_constant(self, module: str, function: str) -> List:
+        """
+        Return the returns of constant getter `module::function` from
+        `self.constants`, fetching all constants on first use.
+        """
+        return self.constants.get(self, module, function)
+
     def get_events_by_handle(
         self,
         struct_type: str,  # i.e 0x1::account::Account
         field_name: str,
         limit: Optional[int] = None,
+        start: Optional[int] = None,  # sequence number to start from
     ) -> Any:
-        request = f"{self.aptos_client.base_url}/accounts/{self.econia_address.hex()}/events/{struct_type}/{field_name}"
-        if limit is not None:
-            request = f"{request}?limit={limit}"
+        request = _get_events_by_handle_request(
+            self.aptos_client.base_url,
+            self.econia_address,
+            struct_type,
+            field_name,
+            limit,
+            start,
+        )
 
         response = self.aptos_client.client.get(request)
         if response.status_code >= 400:
@@ -122,15 +511,144 @@ class EconiaViewer:
         limit: Optional[int] = None,
         start: Optional[int] = None,  # sequence number to start from
     ) -> Any:
-        request = f"{self.aptos_client.base_url}/accounts/{emission_address.hex()}/events/{creation_number}"
-        if limit is not None and start is not None:
-            request = f"{request}?limit={limit}&start={start}"
-        elif limit is not None:
-            request = f"{request}?limit={limit}"
-        elif start is not None:
-            request = f"{request}?start={start}"
+        request = _get_events_by_creation_number_request(
+            self.aptos_client.base_url, emission_address, creation_number, limit, start
+        )
 
         response = self.aptos_client.client.get(request)
         if response.status_code >= 400:
             raise Exception(response.text, response.status_code)
         return response.json()
+
+
+class AsyncEconiaViewer:
+    """
+    Non-blocking counterpart of `EconiaViewer`, accepted by the `gen_*`
+    helpers in `econia_sdk.view`.
+
+    All requests go through the `httpx.AsyncClient` owned by the Aptos
+    async `RestClient`, a single keep-alive connection pool, so many
+    view calls can be in flight at once via `asyncio.gather()`. Pass
+    `rest_client_async` to share the pool with an `EconiaClient`.
+    """
+
+    econia_address: AccountAddress
+    aptos_client: AsyncRestClient
+    constants: ConstantsRegistry
+    event_handles: EventHandleCache
+
+    def __init__(
+        self,
+        node_url: str,
+        econia: AccountAddress,
+        node_api_key: Optional[str] = None,
+        rest_client_async: Optional[AsyncRestClient] = None,
+        constants: Optional[ConstantsRegistry] = None,
+        event_handles: Optional[EventHandleCache] = None,
+    ):
+        self.econia_address = econia
+        if rest_client_async == None:
+            self.aptos_client = AsyncRestClient(node_url)
+        else:
+            self.aptos_client = rest_client_async
+        if constants is None:
+            self.constants = ConstantsRegistry()
+        else:
+            self.constants = constants
+        if event_handles is None:
+            self.event_handles = EventHandleCache()
+        else:
+            self.event_handles = event_handles
+        if node_api_key != None:
+            self.aptos_client.client.headers["Authorization"] = f"Bearer {node_api_key}"
+
+    async def close(self):
+        """
+        Close the underlying connection pool.
+        """
+        await self.aptos_client.close()
+
+    async def get_returns(
+        self,
+        module: str,
+        function: str,
+        type_arguments: List[str] = [],
+        arguments: List = [],  # string encoded args i.e "12345" or "0xabcdef" or "abracadabra"
+        ledger_version: int = -1,
+    ) -> List:
+        response = await self.aptos_client.client.post(
+            _get_view_request(self.aptos_client.base_url, ledger_version),
+            json=_get_view_payload(
+                self.econia_address, module, function, type_arguments, arguments
+            ),
+        )
+
+        if response.status_code >= 400:
+            raise Exception(response.text, response.status_code)
+        return response.json()
+
+    async def get_returns_batch(
+        self,
+        calls: List[ViewCall],
+        ledger_version: int = -1,
+    ) -> List[List]:
+        """
+        Async variant of `EconiaViewer.get_returns_batch()`, with all
+        calls in flight at once on the shared connection pool.
+        """
+        if ledger_version < 0:
+            info = await self.aptos_client.info()
+            ledger_version = int(info["ledger_version"])
+        return list(
+            await asyncio.gather(
+                *[
+                    self.get_returns(
+                        module, function, type_arguments, arguments, ledger_version
+                    )
+                    for (module, function, type_arguments, arguments) in calls
+                ]
+            )
+        )
+
+    async def get_constant(self, module: str, function: str) -> List:
+        """
+        Async variant of `EconiaViewer.get_constant()`.
+        """
+        return await self.constants.gen_get(self, module, function)
+
+    async def get_events_by_handle(
+        self,
+        struct_type: str,  # i.e 0x1::account::Account
+        field_name: str,
+        limit: Optional[int] = None,
+        start: Optional[int] = None,  # sequence number to start from
+    ) -> Any:
+        request = _get_events_by_handle_request(
+            self.aptos_client.base_url,
+            self.econia_address,
+            struct_type,
+            field_name,
+            limit,
+            start,
+        )
+
+        response = await self.aptos_client.client.get(request)
+        if response.status_code >= 400:
+            raise Exception(response.text, response.status_code)
+        return response.json()
+
+    async def get_events_by_creation_number(
+        self,
+        emission_address: AccountAddress,
+        creation_number: int,
+        limit: Optional[int] = None,
+        start: Optional[int] = None,  # sequence number to start from
+    ) -> Any:
+        request = _get_events_by_creation_number_request(
+            self.aptos_client.base_url, emission_address, creation_number, limit, start
+        )
+
+        response = await self.aptos_client.client.get(request)
+        if response.status_code >= 400:
+            raise Exception(response.text, response.status_code)
+        return response.json()
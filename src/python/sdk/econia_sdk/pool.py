@@ -0,0 +1,220 @@
+# Pool of signing accounts sharing one connection pool
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from aptos_sdk.account import Account
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.async_client import RestClient as AsyncRestClient
+from aptos_sdk.transactions import EntryFunction
+
+from econia_sdk.confirmations import AsyncConfirmationTracker
+from econia_sdk.lib import EconiaClient
+from econia_sdk.sequence import DEFAULT_MAX_IN_FLIGHT, SequenceNumberManager
+from econia_sdk.signing import SigningContext
+
+# Latency samples kept for percentiles.
+MAX_SAMPLES = 10000
+
+
+def _get_percentile(samples: Deque[float], percentile: float) -> float:
+    if len(samples) == 0:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * percentile), len(ordered) - 1)]
+
+
+class PoolStats(dict):
+    """
+    Counters for an `EconiaClientPool`, with keys `submitted`,
+    `confirmed`, `failed` (rejected on submission), `aborted` (failed
+    or timed out after submission), `pending`, `elapsed` (seconds since
+    the pool was created), `submitted_per_second`,
+    `confirmed_per_second`, `submit_latency_p50`/`_p99` and
+    `confirm_latency_p50`/`_p99` (seconds, from submission start), and
+    `accounts`, the number of transactions submitted per account.
+    """
+
+
+class EconiaClientPool:
+    """
+    Submits entry functions from many signing `accounts` (for instance
+    several hot wallets) through one shared async connection pool.
+
+    Each account gets an `EconiaClient` with its own
+    `SequenceNumberManager`, so transactions are pipelined per account,
+    while a shared `SigningContext` and `AsyncConfirmationTracker` keep
+    chain parameters and confirmation polling common to all of them.
+    `submit()` sends each transaction from the account with the fewest
+    unconfirmed transactions, spreading load so that no account's
+    sequence numbers become a bottleneck, unless an `account_index` is
+    given (for instance to cancel an order from the account that placed
+    it). Throughput and latency are reported by `stats()`.
+    """
+
+    clients: List[EconiaClient]
+    aptos_client_async: AsyncRestClient
+    confirmations: AsyncConfirmationTracker
+    signing_context: SigningContext
+    _pending: List[int]
+    _submitted: List[int]
+    _next: int
+    _counts: dict
+    _submit_latencies: Deque[float]
+    _confirm_latencies: Deque[float]
+    _start: float
+    _owns_client: bool
+    _owns_confirmations: bool
+
+    def __init__(
+        self,
+        node_url: str,
+        econia: AccountAddress,
+        accounts: List[Account],
+        rest_client_async: Optional[AsyncRestClient] = None,
+        node_api_key: Optional[str] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        signing_context: Optional[SigningContext] = None,
+        confirmations: Optional[AsyncConfirmationTracker] = None,
+    ):
+        assert len(accounts) > 0, "Pool needs at least one account!"
+        self._owns_client = rest_client_async is None
+        if rest_client_async is None:
+            rest_client_async = AsyncRestClient(node_url)
+        if node_api_key is not None:
+            rest_client_async.client.headers["Authorization"] = f"Bearer {node_api_key}"
+        self.aptos_client_async = rest_client_async
+        self.signing_context = (
+            SigningContext() if signing_context is None else signing_context
+        )
+        self._owns_confirmations = confirmations is None
+        self.confirmations = (
+            AsyncConfirmationTracker(rest_client_async)
+            if confirmations is None
+            else confirmations
+        )
+        self.clients = [
+            EconiaClient(
+                node_url,
+                econia,
+                account,
+                None,
+                rest_client_async,
+                sequence_numbers=SequenceNumberManager(
+                    account.address(), max_in_flight
+                ),
+                signing_context=self.signing_context,
+                confirmations=self.confirmations,
+            )
+            for account in accounts
+        ]
+        self._pending = [0] * len(accounts)
+        self._submitted = [0] * len(accounts)
+        self._next = 0
+        self._counts = {"confirmed": 0, "failed": 0, "aborted": 0}
+        self._submit_latencies = deque(maxlen=MAX_SAMPLES)
+        self._confirm_latencies = deque(maxlen=MAX_SAMPLES)
+        self._start = time.perf_counter()
+
+    async def close(self):
+        """
+        Stop the confirmation tracker and close the connection pool, if
+        created by the pool.
+        """
+        if self._owns_confirmations:
+            await self.confirmations.close()
+        if self._owns_client:
+            await self.aptos_client_async.close()
+
+    def _pick(self) -> int:
+        # Least loaded account, round robin among ties.
+        n_accounts = len(self.clients)
+        index = min(
+            range(n_accounts),
+            key=lambda i: (self._pending[i], (i - self._next) % n_accounts),
+        )
+        self._next = (index + 1) % n_accounts
+        return index
+
+    def _on_confirmed(self, index: int, start: float, future: asyncio.Future):
+        self._pending[index] -= 1
+        if future.cancelled() or future.exception() is not None:
+            self._counts["aborted"] += 1
+        else:
+            self._counts["confirmed"] += 1
+            self._confirm_latencies.append(time.perf_counter() - start)
+
+    async def _submit(
+        self, entry: EntryFunction, account_index: Optional[int]
+    ) -> Tuple[str, asyncio.Future]:
+        index = self._pick() if account_index is None else account_index
+        self._pending[index] += 1
+        start = time.perf_counter()
+        try:
+            txn_hash = await self.clients[index].gen_submit_tx(entry)
+        except Exception:
+            self._pending[index] -= 1
+            self._counts["failed"] += 1
+            raise
+        self._submitted[index] += 1
+        self._submit_latencies.append(time.perf_counter() - start)
+        future = self.confirmations.track(
+            txn_hash, self.clients[index].user_account.address()
+        )
+        future.add_done_callback(
+            lambda future: self._on_confirmed(index, start, future)
+        )
+        return txn_hash, future
+
+    async def submit(
+        self, entry: EntryFunction, account_index: Optional[int] = None
+    ) -> str:
+        """
+        Submit `entry` without waiting for it to commit, returning the
+        transaction hash.
+        """
+        # Confirmation is still tracked, for `stats()`.
+        txn_hash, _ = await self._submit(entry, account_index)
+        return txn_hash
+
+    async def submit_wait(
+        self, entry: EntryFunction, account_index: Optional[int] = None
+    ) -> dict:
+        """
+        Submit `entry` and return the committed transaction.
+        """
+        _, future = await self._submit(entry, account_index)
+        return await future
+
+    async def submit_many(
+        self, entries: List[EntryFunction], wait: bool = False
+    ) -> list:
+        """
+        Submit `entries` concurrently across accounts, returning their
+        hashes, or committed transactions if `wait`.
+        """
+        submit = self.submit_wait if wait else self.submit
+        return await asyncio.gather(*[submit(entry) for entry in entries])
+
+    def stats(self) -> PoolStats:
+        elapsed = time.perf_counter() - self._start
+        submitted = sum(self._submitted)
+        return PoolStats(
+            submitted=submitted,
+            confirmed=self._counts["confirmed"],
+            failed=self._counts["failed"],
+            aborted=self._counts["aborted"],
+            pending=sum(self._pending),
+            elapsed=elapsed,
+            submitted_per_second=submitted / elapsed if elapsed > 0 else 0.0,
+            confirmed_per_second=(
+                self._counts["confirmed"] / elapsed if elapsed > 0 else 0.0
+            ),
+            submit_latency_p50=_get_percentile(self._submit_latencies, 0.5),
+            submit_latency_p99=_get_percentile(self._submit_latencies, 0.99),
+            confirm_latency_p50=_get_percentile(self._confirm_latencies, 0.5),
+            confirm_latency_p99=_get_percentile(self._confirm_latencies, 0.99),
+            accounts=list(self._submitted),
+        )
@@ -0,0 +1,523 @@
+# Compact record types for open orders, price levels, events and DSS
+# notifications
+
+from typing import Tuple
+
+from aptos_sdk.account_address import AccountAddress
+
+from econia_sdk.types import CancelReason, Restriction, SelfMatchBehavior, Side
+
+
+class _LazyAddress:
+    """
+    Attribute holding an `AccountAddress`, kept as the hex string it
+    was decoded from until first accessed.
+    """
+
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, str):
+            value = AccountAddress.from_hex(value)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+class Record:
+    """
+    Base class for records: fixed fields stored in `__slots__` instead
+    of a per-instance dict, listed in `_fields`.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, field) == getattr(other, field) for field in self._fields
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._fields
+        )
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self._fields}
+
+
+class OpenOrder(Record):
+    __slots__ = (
+        "custodian_id",
+        "market_id",
+        "order_id",
+        "price",
+        "side",
+        "remaining_size",
+        "_user",
+    )
+    _fields = (
+        "custodian_id",
+        "market_id",
+        "order_id",
+        "price",
+        "side",
+        "remaining_size",
+        "user",
+    )
+    user = _LazyAddress()
+
+    def __init__(self, value: dict):
+        self.custodian_id = int(value["custodian_id"])
+        self.market_id = int(value["market_id"])
+        self.order_id = int(value["order_id"])
+        self.price = int(value["price"])  # ticks per lot
+        self.side = Side.ASK if value["side"] else Side.BID
+        self.remaining_size = int(value["remaining_size"])  # lots of base
+        self._user = value["user"]
+
+
+class PriceLevel(Record):
+    __slots__ = ("price", "size")
+    _fields = ("price", "size")
+
+    def __init__(self, value: dict):
+        self.price = int(value["price"])  # ticks per lot
+        self.size = int(value["size"])  # lots of base
+
+
+class Event(Record):
+    """
+    Fields common to all events fetched by event handle: the event GUID
+    is flattened into `creation_number` and `account_address`, and the
+    remaining fields hold the event `data`, listed in `_data_fields`.
+    """
+
+    __slots__ = (
+        "version",
+        "creation_number",
+        "_account_address",
+        "sequence_number",
+        "type",
+    )
+    _event_fields = (
+        "version",
+        "creation_number",
+        "account_address",
+        "sequence_number",
+        "type",
+    )
+    _fields = _event_fields
+    _data_fields: Tuple[str, ...] = ()
+    account_address = _LazyAddress()
+
+    def __init__(self, event: dict):
+        self.version = int(event["version"])
+        self.creation_number = int(event["guid"]["creation_number"])
+        self._account_address = event["guid"]["account_address"]
+        self.sequence_number = int(event["sequence_number"])
+        self.type = event["type"]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._event_fields + cls._data_fields
+
+    def to_dict(self) -> dict:
+        """
+        Return the event in the nested format of the dict converters.
+        """
+        return {
+            "version": self.version,
+            "guid": {
+                "creation_number": self.creation_number,
+                "account_address": self.account_address,
+            },
+            "sequence_number": self.sequence_number,
+            "type": self.type,
+            "data": {field: getattr(self, field) for field in self._data_fields},
+        }
+
+
+class ChangeOrderSizeEvent(Event):
+    __slots__ = ("custodian_id", "market_id", "new_size", "order_id", "side", "_user")
+    _data_fields = ("custodian_id", "market_id", "new_size", "order_id", "side", "user")
+    user = _LazyAddress()
+
+    def __init__(self, event: dict):
+        super().__init__(event)
+        data = event["data"]
+        self.custodian_id = int(data["custodian_id"])
+        self.market_id = int(data["market_id"])
+        self.new_size = int(data["new_size"])
+        self.order_id = int(data["order_id"])
+        self.side = Side.ASK if data["side"] else Side.BID
+        self._user = data["user"]
+
+
+class CancelOrderEvent(Event):
+    __slots__ = ("custodian_id", "market_id", "order_id", "reason", "_user")
+    _data_fields = ("custodian_id", "market_id", "order_id", "reason", "user")
+    user = _LazyAddress()
+
+    def __init__(self, event: dict):
+        super().__init__(event)
+        data = event["data"]
+        self.custodian_id = int(data["custodian_id"])
+        self.market_id = int(data["market_id"])
+        self.order_id = int(data["order_id"])
+        self.reason = CancelReason(int(data["reason"]))
+        self._user = data["user"]
+
+
+class FillEvent(Event):
+    __slots__ = (
+        "_maker",
+        "maker_custodian_id",
+        "maker_order_id",
+        "maker_side",
+        "market_id",
+        "price",
+        "sequence_number_for_trade",
+        "size",
+        "_taker",
+        "taker_custodian_id",
+        "taker_order_id",
+        "taker_quote_fees_paid",
+    )
+    _data_fields = (
+        "maker",
+        "maker_custodian_id",
+        "maker_order_id",
+        "maker_side",
+        "market_id",
+        "price",
+        "sequence_number_for_trade",
+        "size",
+        "taker",
+        "taker_custodian_id",
+        "taker_order_id",
+        "taker_quote_fees_paid",
+    )
+    maker = _LazyAddress()
+    taker = _LazyAddress()
+
+    def __init__(self, event: dict):
+        super().__init__(event)
+        data = event["data"]
+        self._maker = data["maker"]
+        self.maker_custodian_id = int(data["maker_custodian_id"])
+        self.maker_order_id = int(data["maker_order_id"])
+        self.maker_side = Side.ASK if data["maker_side"] else Side.BID
+        self.market_id = int(data["market_id"])
+        self.price = int(data["price"])
+        self.sequence_number_for_trade = int(data["sequence_number_for_trade"])
+        self.size = int(data["size"])
+        self._taker = data["taker"]
+        self.taker_custodian_id = int(data["taker_custodian_id"])
+        self.taker_order_id = int(data["taker_order_id"])
+        self.taker_quote_fees_paid = int(data["taker_quote_fees_paid"])
+
+
+class PlaceMarketOrderEvent(Event):
+    __slots__ = (
+        "custodian_id",
+        "direction",
+        "_integrator",
+        "market_id",
+        "order_id",
+        "self_match_behavior",
+        "size",
+        "_user",
+    )
+    _data_fields = (
+        "custodian_id",
+        "direction",
+        "integrator",
+        "market_id",
+        "order_id",
+        "self_match_behavior",
+        "size",
+        "user",
+    )
+    integrator = _LazyAddress()
+    user = _LazyAddress()
+
+    def __init__(self, event: dict):
+        super().__init__(event)
+        data = event["data"]
+        self.custodian_id = int(data["custodian_id"])
+        self.direction = Side.ASK if data["direction"] else Side.BID
+        self._integrator = data["integrator"]
+        self.market_id = int(data["market_id"])
+        self.order_id = int(data["order_id"])
+        self.self_match_behavior = SelfMatchBehavior(int(data["self_match_behavior"]))
+        self.size = int(data["size"])
+        self._user = data["user"]
+
+
+class PlaceLimitOrderEvent(Event):
+    __slots__ = (
+        "custodian_id",
+        "_integrator",
+        "market_id",
+        "order_id",
+        "price",
+        "remaining_size",
+        "restriction",
+        "self_match_behavior",
+        "side",
+        "size",
+        "_user",
+    )
+    _data_fields = (
+        "custodian_id",
+        "integrator",
+        "market_id",
+        "order_id",
+        "price",
+        "remaining_size",
+        "restriction",
+        "self_match_behavior",
+        "side",
+        "size",
+        "user",
+    )
+    integrator = _LazyAddress()
+    user = _LazyAddress()
+
+    def __init__(self, event: dict):
+        super().__init__(event)
+        data = event["data"]
+        self.custodian_id = int(data["custodian_id"])
+        self._integrator = data["integrator"]
+        self.market_id = int(data["market_id"])
+        self.order_id = int(data["order_id"])
+        self.price = int(data["price"])
+        self.remaining_size = int(data["remaining_size"])
+        self.restriction = Restriction(int(data["restriction"]))
+        self.self_match_behavior = SelfMatchBehavior(int(data["self_match_behavior"]))
+        self.side = Side.ASK if data["side"] else Side.BID
+        self.size = int(data["size"])
+        self._user = data["user"]
+
+
+class Notification(Record):
+    """
+    Fields common to all events published by the DSS over MQTT, which
+    are identified by transaction version and index within the
+    transaction rather than by event handle. `time` is the transaction
+    timestamp, kept as the ISO 8601 string it was published as.
+    """
+
+    __slots__ = ("txn_version", "event_idx", "time", "market_id")
+    _notification_fields = ("txn_version", "event_idx", "time", "market_id")
+    _fields = _notification_fields
+    _data_fields: Tuple[str, ...] = ()
+
+    def __init__(self, data: dict):
+        self.txn_version = int(data["txn_version"])
+        self.event_idx = int(data["event_idx"])
+        self.time = data["time"]
+        self.market_id = int(data["market_id"])
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._notification_fields + cls._data_fields
+
+
+class PlaceLimitOrderNotification(Notification):
+    __slots__ = (
+        "_user",
+        "custodian_id",
+        "order_id",
+        "side",
+        "_integrator",
+        "initial_size",
+        "price",
+        "restriction",
+        "self_match_behavior",
+        "size",
+    )
+    _data_fields = (
+        "user",
+        "custodian_id",
+        "order_id",
+        "side",
+        "integrator",
+        "initial_size",
+        "price",
+        "restriction",
+        "self_match_behavior",
+        "size",
+    )
+    user = _LazyAddress()
+    integrator = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self._user = data["user"]
+        self.custodian_id = int(data["custodian_id"])
+        self.order_id = int(data["order_id"])
+        self.side = Side.ASK if data["side"] else Side.BID
+        self._integrator = data["integrator"]
+        self.initial_size = int(data["initial_size"])
+        self.price = int(data["price"])
+        self.restriction = Restriction(int(data["restriction"]))
+        self.self_match_behavior = SelfMatchBehavior(int(data["self_match_behavior"]))
+        self.size = int(data["size"])
+
+
+class PlaceMarketOrderNotification(Notification):
+    __slots__ = (
+        "_user",
+        "custodian_id",
+        "order_id",
+        "direction",
+        "_integrator",
+        "self_match_behavior",
+        "size",
+    )
+    _data_fields = (
+        "user",
+        "custodian_id",
+        "order_id",
+        "direction",
+        "integrator",
+        "self_match_behavior",
+        "size",
+    )
+    user = _LazyAddress()
+    integrator = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self._user = data["user"]
+        self.custodian_id = int(data["custodian_id"])
+        self.order_id = int(data["order_id"])
+        self.direction = Side.ASK if data["direction"] else Side.BID
+        self._integrator = data["integrator"]
+        self.self_match_behavior = SelfMatchBehavior(int(data["self_match_behavior"]))
+        self.size = int(data["size"])
+
+
+class PlaceSwapOrderNotification(Notification):
+    __slots__ = (
+        "order_id",
+        "direction",
+        "_signing_account",
+        "_integrator",
+        "min_base",
+        "max_base",
+        "min_quote",
+        "max_quote",
+        "limit_price",
+    )
+    _data_fields = (
+        "order_id",
+        "direction",
+        "signing_account",
+        "integrator",
+        "min_base",
+        "max_base",
+        "min_quote",
+        "max_quote",
+        "limit_price",
+    )
+    signing_account = _LazyAddress()
+    integrator = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self.order_id = int(data["order_id"])
+        self.direction = Side.ASK if data["direction"] else Side.BID
+        self._signing_account = data["signing_account"]
+        self._integrator = data["integrator"]
+        self.min_base = int(data["min_base"])
+        self.max_base = int(data["max_base"])
+        self.min_quote = int(data["min_quote"])
+        self.max_quote = int(data["max_quote"])
+        self.limit_price = int(data["limit_price"])
+
+
+class ChangeOrderSizeNotification(Notification):
+    __slots__ = ("_user", "custodian_id", "order_id", "side", "new_size")
+    _data_fields = ("user", "custodian_id", "order_id", "side", "new_size")
+    user = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self._user = data["user"]
+        self.custodian_id = int(data["custodian_id"])
+        self.order_id = int(data["order_id"])
+        self.side = Side.ASK if data["side"] else Side.BID
+        self.new_size = int(data["new_size"])
+
+
+class CancelOrderNotification(Notification):
+    __slots__ = ("_user", "custodian_id", "order_id", "reason")
+    _data_fields = ("user", "custodian_id", "order_id", "reason")
+    user = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self._user = data["user"]
+        self.custodian_id = int(data["custodian_id"])
+        self.order_id = int(data["order_id"])
+        self.reason = CancelReason(int(data["reason"]))
+
+
+class FillNotification(Notification):
+    __slots__ = (
+        "_emit_address",
+        "_maker_address",
+        "maker_custodian_id",
+        "maker_order_id",
+        "maker_side",
+        "price",
+        "sequence_number_for_trade",
+        "size",
+        "_taker_address",
+        "taker_custodian_id",
+        "taker_order_id",
+        "taker_quote_fees_paid",
+    )
+    _data_fields = (
+        "emit_address",
+        "maker_address",
+        "maker_custodian_id",
+        "maker_order_id",
+        "maker_side",
+        "price",
+        "sequence_number_for_trade",
+        "size",
+        "taker_address",
+        "taker_custodian_id",
+        "taker_order_id",
+        "taker_quote_fees_paid",
+    )
+    emit_address = _LazyAddress()
+    maker_address = _LazyAddress()
+    taker_address = _LazyAddress()
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self._emit_address = data["emit_address"]
+        self._maker_address = data["maker_address"]
+        self.maker_custodian_id = int(data["maker_custodian_id"])
+        self.maker_order_id = int(data["maker_order_id"])
+        self.maker_side = Side.ASK if data["maker_side"] else Side.BID
+        self.price = int(data["price"])
+        self.sequence_number_for_trade = int(data["sequence_number_for_trade"])
+        self.size = int(data["size"])
+        self._taker_address = data["taker_address"]
+        self.taker_custodian_id = int(data["taker_custodian_id"])
+        self.taker_order_id = int(data["taker_order_id"])
+        self.taker_quote_fees_paid = int(data["taker_quote_fees_paid"])
@@ -0,0 +1,292 @@
+# Local sequence number allocation for pipelined transaction submission
+
+import asyncio
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional
+
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.async_client import RestClient as AsyncRestClient
+from aptos_sdk.client import RestClient
+
+# Mempool accepts at most 100 transactions per account.
+DEFAULT_MAX_IN_FLIGHT = 100
+
+# Validation errors returned on submission when the sequence number of a
+# transaction is no longer (or not yet) valid for the account.
+SEQUENCE_NUMBER_ERRORS = ("SEQUENCE_NUMBER_TOO_OLD", "SEQUENCE_NUMBER_TOO_NEW")
+
+
+def is_sequence_number_error(error: Exception) -> bool:
+    return any(code in str(error) for code in SEQUENCE_NUMBER_ERRORS)
+
+
+def is_rejection(error: Exception) -> bool:
+    """
+    Whether submission failed with a validation error from the VM, as
+    opposed to a transport or server error, after which the transaction
+    may still have reached mempool.
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code is None and len(error.args) > 1:
+        status_code = error.args[1]
+    return (
+        isinstance(status_code, int)
+        and 400 <= status_code < 500
+        and "vm_error" in str(error)
+    )
+
+
+class SequenceNumberManager:
+    """
+    Hands out sequence numbers for one account locally, so transactions
+    can be signed and submitted back-to-back without fetching the
+    account's sequence number from the node each time, nor waiting for
+    the previous transaction to commit.
+
+    Sequence numbers are allocated with `allocate()` (or `gen_allocate()`
+    for an async client), then reported with `submitted()` once the node
+    accepts the transaction, `failed()` if submission raised, or
+    `release()` if the transaction was never submitted. `in_flight`
+    maps each allocated, uncommitted sequence number to its transaction
+    hash (`None` until submitted).
+
+    The on-chain sequence number is only read on first use, when
+    `max_in_flight` transactions are pending (in which case allocation
+    blocks until some of them commit, and raises `TimeoutError` after
+    `max_wait` seconds rather than reuse their sequence numbers), and
+    after a `SEQUENCE_NUMBER_TOO_OLD`/`SEQUENCE_NUMBER_TOO_NEW` error,
+    which means the account was used elsewhere or local state drifted.
+    Sequence numbers of transactions rejected by the VM for other
+    reasons are reused first, so that a failed submission does not leave
+    a gap that stalls every later transaction in mempool. After a
+    timeout, connection or server error, the transaction may have been
+    accepted regardless, so its sequence number is held rather than
+    reused: it is released only if the account is still waiting on it
+    `hold_time` seconds later, when the on-chain sequence number is next
+    read.
+
+    The account should not submit transactions through other means
+    while managed. `allocate()` is thread-safe and `gen_allocate()` is
+    safe across tasks, but a manager should not be shared between both.
+    """
+
+    address: AccountAddress
+    max_in_flight: int
+    max_wait: float
+    poll_interval: float
+    hold_time: float
+    next_sequence_number: Optional[int]
+    committed_sequence_number: Optional[int]
+    in_flight: Dict[int, Optional[str]]
+    _free: List[int]
+    # Sequence numbers of submissions with an unknown outcome, and when
+    # to stop holding them.
+    _held: Dict[int, float]
+    _stale: bool
+    _lock: threading.Lock
+    _allocate_lock: threading.Lock
+    _async_lock: Optional[asyncio.Lock]
+
+    def __init__(
+        self,
+        address: AccountAddress,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_wait: float = 30,
+        poll_interval: float = 0.1,
+        hold_time: float = 10,
+    ):
+        self.address = address
+        self.max_in_flight = max_in_flight
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.hold_time = hold_time
+        self.next_sequence_number = None
+        self.committed_sequence_number = None
+        self.in_flight = {}
+        self._free = []
+        self._held = {}
+        self._stale = True
+        self._lock = threading.Lock()
+        self._allocate_lock = threading.Lock()
+        self._async_lock = None
+
+    def _update(self, committed_sequence_number: int):
+        # Apply the on-chain sequence number: everything below it has
+        # been committed.
+        self.committed_sequence_number = committed_sequence_number
+        for sequence_number in list(self.in_flight):
+            if sequence_number < committed_sequence_number:
+                del self.in_flight[sequence_number]
+                self._held.pop(sequence_number, None)
+        # The account still waits on a held sequence number, so the
+        # transaction never reached mempool: resync to reuse it.
+        deadline = self._held.get(committed_sequence_number)
+        if deadline is not None and time.monotonic() > deadline:
+            del self._held[committed_sequence_number]
+            del self.in_flight[committed_sequence_number]
+            self._stale = True
+        while len(self._free) > 0 and self._free[0] < committed_sequence_number:
+            heapq.heappop(self._free)
+        if (
+            self._stale
+            or self.next_sequence_number is None
+            or self.next_sequence_number < committed_sequence_number
+        ):
+            self.next_sequence_number = committed_sequence_number
+            self._free = []
+            self._stale = False
+
+    def _is_full(self) -> bool:
+        return len(self._free) == 0 and len(self.in_flight) >= self.max_in_flight
+
+    def _take(self) -> int:
+        if len(self._free) > 0:
+            sequence_number = heapq.heappop(self._free)
+        else:
+            assert self.next_sequence_number is not None
+            # Skip numbers still pending from before a resync.
+            while self.next_sequence_number in self.in_flight:
+                self.next_sequence_number += 1
+            sequence_number = self.next_sequence_number
+            self.next_sequence_number += 1
+        self.in_flight[sequence_number] = None
+        return sequence_number
+
+    def _check_deadline(self, deadline: float):
+        if time.monotonic() > deadline:
+            # Pending transactions hold their sequence numbers in mempool
+            # until they commit or expire, so none can be handed out
+            # again without risking two transactions sharing one.
+            raise TimeoutError(
+                f"{len(self.in_flight)} transactions still pending after "
+                f"{self.max_wait} seconds"
+            )
+
+    def allocate(self, client: RestClient) -> int:
+        """
+        Return the sequence number to sign the next transaction with.
+        Raises `TimeoutError` if `max_in_flight` transactions are still
+        pending after `max_wait` seconds.
+        """
+        # Only one allocation at a time, but node calls and sleeps are
+        # made without `_lock`, so that `submitted()` and `failed()` from
+        # other threads are not blocked meanwhile.
+        with self._allocate_lock:
+            deadline = None
+            while True:
+                wait = False
+                with self._lock:
+                    if not self._stale and self.next_sequence_number is not None:
+                        if not self._is_full():
+                            return self._take()
+                        if deadline is None:
+                            deadline = time.monotonic() + self.max_wait
+                        else:
+                            self._check_deadline(deadline)
+                            wait = True
+                if wait:
+                    time.sleep(self.poll_interval)
+                committed_sequence_number = client.account_sequence_number(self.address)
+                with self._lock:
+                    self._update(committed_sequence_number)
+
+    async def gen_allocate(self, client: AsyncRestClient) -> int:
+        """
+        Async variant of `allocate()`.
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            deadline = None
+            while True:
+                wait = False
+                if not self._stale and self.next_sequence_number is not None:
+                    if not self._is_full():
+                        return self._take()
+                    if deadline is None:
+                        deadline = time.monotonic() + self.max_wait
+                    else:
+                        self._check_deadline(deadline)
+                        wait = True
+                if wait:
+                    await asyncio.sleep(self.poll_interval)
+                self._update(await client.account_sequence_number(self.address))
+
+    def submitted(self, sequence_number: int, txn_hash: str):
+        """
+        Record that the transaction with `sequence_number` was accepted.
+        """
+        with self._lock:
+            if sequence_number in self.in_flight:
+                self.in_flight[sequence_number] = txn_hash
+
+    def _release(self, sequence_number: int):
+        del self.in_flight[sequence_number]
+        if (
+            self.committed_sequence_number is None
+            or sequence_number >= self.committed_sequence_number
+        ):
+            heapq.heappush(self._free, sequence_number)
+
+    def release(self, sequence_number: int):
+        """
+        Return `sequence_number` for reuse, if its transaction was never
+        submitted.
+        """
+        with self._lock:
+            if sequence_number in self.in_flight:
+                self._release(sequence_number)
+
+    def failed(self, sequence_number: int, error: Exception):
+        """
+        Record that submitting the transaction with `sequence_number`
+        raised `error`. The sequence number is reused if the VM rejected
+        the transaction, the manager resynced with the node on a
+        sequence number error, and otherwise the sequence number is held
+        and the manager resynced.
+        """
+        with self._lock:
+            if sequence_number not in self.in_flight:
+                return
+            if not is_rejection(error):
+                self._held[sequence_number] = time.monotonic() + self.hold_time
+                self._stale = True
+            elif is_sequence_number_error(error):
+                del self.in_flight[sequence_number]
+                self._stale = True
+            else:
+                self._release(sequence_number)
+
+    def resync(self):
+        """
+        Re-read the on-chain sequence number on the next allocation.
+        """
+        with self._lock:
+            self._stale = True
+
+    def wait_for_in_flight(self, client: RestClient):
+        """
+        Block until all submitted transactions have committed, or
+        `max_wait` seconds elapse.
+        """
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline:
+            committed_sequence_number = client.account_sequence_number(self.address)
+            with self._lock:
+                self._update(committed_sequence_number)
+                if len(self.in_flight) == 0:
+                    return
+            time.sleep(self.poll_interval)
+
+    async def gen_wait_for_in_flight(self, client: AsyncRestClient):
+        """
+        Async variant of `wait_for_in_flight()`.
+        """
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline:
+            self._update(await client.account_sequence_number(self.address))
+            if len(self.in_flight) == 0:
+                return
+            await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,195 @@
+# Cached chain and gas parameters for transaction signing
+
+import time
+from typing import Optional
+
+from aptos_sdk.account import Account
+from aptos_sdk.async_client import RestClient as AsyncRestClient
+from aptos_sdk.authenticator import Authenticator, Ed25519Authenticator
+from aptos_sdk.client import RestClient
+from aptos_sdk.transactions import RawTransaction, SignedTransaction, TransactionPayload
+
+
+class SigningContext:
+    """
+    Everything besides the sequence number and payload needed to sign a
+    transaction, so that `EconiaClient.submit_tx()` does not read the
+    node before each transaction.
+
+    The chain ID is fetched once and kept. By default the gas unit
+    price, max gas amount and expiration TTL come from the client's
+    `ClientConfig`, and can be overridden here. If `estimate_gas_price`,
+    the gas unit price is instead read from the node's gas price
+    estimate (the prioritized one if `prioritized`), and re-read when
+    older than `refresh_interval` seconds. Call `refresh()` (or
+    `gen_refresh()`) to do so ahead of time rather than on submission.
+    """
+
+    chain_id: Optional[int]
+    gas_unit_price: Optional[int]
+    max_gas_amount: Optional[int]
+    expiration_ttl: Optional[int]
+    estimate_gas_price: bool
+    prioritized: bool
+    refresh_interval: float
+    refreshed_at: Optional[float]
+
+    def __init__(
+        self,
+        gas_unit_price: Optional[int] = None,
+        max_gas_amount: Optional[int] = None,
+        expiration_ttl: Optional[int] = None,
+        estimate_gas_price: bool = False,
+        prioritized: bool = False,
+        refresh_interval: float = 60,
+    ):
+        self.chain_id = None
+        self.gas_unit_price = gas_unit_price
+        self.max_gas_amount = max_gas_amount
+        self.expiration_ttl = expiration_ttl
+        self.estimate_gas_price = estimate_gas_price
+        self.prioritized = prioritized
+        self.refresh_interval = refresh_interval
+        self.refreshed_at = None
+
+    def _is_stale(self) -> bool:
+        return self.estimate_gas_price and (
+            self.refreshed_at is None
+            or time.monotonic() - self.refreshed_at > self.refresh_interval
+        )
+
+    def _set_gas_estimate(self, estimate: dict):
+        key = "prioritized_gas_estimate" if self.prioritized else "gas_estimate"
+        self.gas_unit_price = int(estimate.get(key, estimate["gas_estimate"]))
+        self.refreshed_at = time.monotonic()
+
+    def refresh(self, client: RestClient):
+        """
+        Fetch the chain ID if unknown, and the gas price estimate if
+        `estimate_gas_price`.
+        """
+        if self.chain_id is None:
+            self.chain_id = client.chain_id
+        if self.estimate_gas_price:
+            response = client.client.get(f"{client.base_url}/estimate_gas_price")
+            if response.status_code >= 400:
+                raise Exception(response.text, response.status_code)
+            self._set_gas_estimate(response.json())
+
+    async def gen_refresh(self, client: AsyncRestClient):
+        """
+        Async variant of `refresh()`.
+        """
+        if self.chain_id is None:
+            self.chain_id = await client.chain_id()
+        if self.estimate_gas_price:
+            response = await client.client.get(f"{client.base_url}/estimate_gas_price")
+            if response.status_code >= 400:
+                raise Exception(response.text, response.status_code)
+            self._set_gas_estimate(response.json())
+
+    def get_raw_transaction(
+        self,
+        client: RestClient,
+        account: Account,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int] = None,
+    ) -> RawTransaction:
+        """
+        Build an unsigned transaction, refreshing cached parameters only
+        if missing or stale. `max_gas_amount` overrides the context's.
+        """
+        if self.chain_id is None or self._is_stale():
+            self.refresh(client)
+        return self._get_raw_transaction(
+            client, account, payload, sequence_number, max_gas_amount
+        )
+
+    async def gen_get_raw_transaction(
+        self,
+        client: AsyncRestClient,
+        account: Account,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int] = None,
+    ) -> RawTransaction:
+        """
+        Async variant of `get_raw_transaction()`.
+        """
+        if self.chain_id is None or self._is_stale():
+            await self.gen_refresh(client)
+        return self._get_raw_transaction(
+            client, account, payload, sequence_number, max_gas_amount
+        )
+
+    def sign(
+        self,
+        client: RestClient,
+        account: Account,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int] = None,
+    ) -> SignedTransaction:
+        """
+        Sign `payload` for `account`, as per `get_raw_transaction()`.
+        """
+        return _sign(
+            account,
+            self.get_raw_transaction(
+                client, account, payload, sequence_number, max_gas_amount
+            ),
+        )
+
+    async def gen_sign(
+        self,
+        client: AsyncRestClient,
+        account: Account,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int] = None,
+    ) -> SignedTransaction:
+        """
+        Async variant of `sign()`.
+        """
+        return _sign(
+            account,
+            await self.gen_get_raw_transaction(
+                client, account, payload, sequence_number, max_gas_amount
+            ),
+        )
+
+    def _get_raw_transaction(
+        self,
+        client,
+        account: Account,
+        payload: TransactionPayload,
+        sequence_number: int,
+        max_gas_amount: Optional[int],
+    ) -> RawTransaction:
+        config = client.client_config
+        if max_gas_amount is None:
+            max_gas_amount = self.max_gas_amount
+        if max_gas_amount is None:
+            max_gas_amount = config.max_gas_amount
+        gas_unit_price = self.gas_unit_price
+        if gas_unit_price is None:
+            gas_unit_price = config.gas_unit_price
+        expiration_ttl = self.expiration_ttl
+        if expiration_ttl is None:
+            expiration_ttl = config.expiration_ttl
+        return RawTransaction(
+            account.address(),
+            sequence_number,
+            payload,
+            max_gas_amount,
+            gas_unit_price,
+            int(time.time()) + expiration_ttl,
+            self.chain_id,
+        )
+
+
+def _sign(account: Account, raw_transaction: RawTransaction) -> SignedTransaction:
+    signature = account.sign(raw_transaction.keyed())
+    authenticator = Authenticator(Ed25519Authenticator(account.public_key(), signature))
+    return SignedTransaction(raw_transaction, authenticator)
@@ -0,0 +1,334 @@
+# Local SQLite store of market account events
+
+import json
+import sqlite3
+from typing import Any, Callable, Iterable, List, Optional
+
+from aptos_sdk.account_address import AccountAddress
+
+from econia_sdk.events import DEFAULT_PAGE_SIZE, AsyncEventIterator, EventIterator
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
+from econia_sdk.view.user import (
+    gen_get_market_event_handle_creation_numbers,
+    get_market_event_handle_creation_numbers,
+)
+
+# Market account event handles, as keyed in the return of
+# `get_market_event_handle_creation_numbers()`.
+MARKET_ACCOUNT_HANDLES = [
+    "cancel_order_events_handle_creation_num",
+    "change_order_size_events_handle_creation_num",
+    "fill_events_handle_creation_num",
+    "place_limit_order_events_handle_creation_num",
+    "place_market_order_events_handle_creation_num",
+]
+
+# Order IDs are `u128`, wider than SQLite integers, so they are stored
+# as the decimal strings returned by the node. Fills reference two
+# orders: the maker order ID goes in `order_id` and the taker one in
+# `taker_order_id`, which is `NULL` for all other events.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    account_address TEXT NOT NULL,
+    creation_number INTEGER NOT NULL,
+    sequence_number INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    market_id INTEGER,
+    order_id TEXT,
+    taker_order_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (account_address, creation_number, sequence_number)
+);
+CREATE INDEX IF NOT EXISTS events_market_id ON events (market_id, version);
+CREATE INDEX IF NOT EXISTS events_order_id ON events (order_id);
+CREATE INDEX IF NOT EXISTS events_taker_order_id ON events (taker_order_id);
+CREATE INDEX IF NOT EXISTS events_version ON events (version);
+CREATE TABLE IF NOT EXISTS handles (
+    account_address TEXT NOT NULL,
+    creation_number INTEGER NOT NULL,
+    next_sequence_number INTEGER NOT NULL,
+    PRIMARY KEY (account_address, creation_number)
+);
+"""
+
+
+def _get_row(event: dict) -> tuple:
+    data = event["data"]
+    if "maker_order_id" in data:
+        order_id = data["maker_order_id"]
+        taker_order_id = data["taker_order_id"]
+    else:
+        order_id = data.get("order_id")
+        taker_order_id = None
+    return (
+        AccountAddress.from_hex(event["guid"]["account_address"]).hex(),
+        int(event["guid"]["creation_number"]),
+        int(event["sequence_number"]),
+        int(event["version"]),
+        event["type"],
+        int(data["market_id"]) if "market_id" in data else None,
+        None if order_id is None else str(order_id),
+        None if taker_order_id is None else str(taker_order_id),
+        json.dumps(data),
+    )
+
+
+def _get_event(row: tuple) -> dict:
+    # Rebuild the event as returned by the node.
+    account_address, creation_number, sequence_number, version, type, data = row
+    return {
+        "version": str(version),
+        "guid": {
+            "creation_number": str(creation_number),
+            "account_address": account_address,
+        },
+        "sequence_number": str(sequence_number),
+        "type": type,
+        "data": json.loads(data),
+    }
+
+
+class EventStore:
+    """
+    Local copy of event streams in a SQLite database at `path` (in
+    memory by default), synced incrementally: each handle records the
+    next sequence number to fetch, so a sync only downloads events
+    emitted since the last one.
+
+    Events are stored as returned by the node, indexed by market ID,
+    order ID (maker and taker order IDs for fills) and transaction
+    version, and are returned by `get_events()` in the same raw format,
+    ready for the `econia_sdk.records` classes or the `get_*_events`
+    converters. `connection` is exposed for arbitrary SQL queries.
+    """
+
+    connection: sqlite3.Connection
+    path: str
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get_next_sequence_number(
+        self, account_address: AccountAddress, creation_number: int
+    ) -> int:
+        """
+        Return the sequence number of the next event to fetch for a
+        handle, 0 if it has never been synced.
+        """
+        row = self.connection.execute(
+            "SELECT next_sequence_number FROM handles "
+            "WHERE account_address = ? AND creation_number = ?",
+            (account_address.hex(), creation_number),
+        ).fetchone()
+        return 0 if row is None else row[0]
+
+    def insert_events(
+        self,
+        account_address: AccountAddress,
+        creation_number: int,
+        events: List[dict],
+    ):
+        """
+        Store a page of consecutive events from one handle and advance
+        its next sequence number past them, in one transaction.
+        """
+        if len(events) == 0:
+            return
+        next_sequence_number = int(events[-1]["sequence_number"]) + 1
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [_get_row(event) for event in events],
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO handles VALUES (?, ?, ?)",
+                (account_address.hex(), creation_number, next_sequence_number),
+            )
+
+    def _sync_batches(
+        self,
+        account_address: AccountAddress,
+        creation_number: int,
+        events: Iterable[dict],
+        page_size: int,
+    ) -> int:
+        count = 0
+        batch: List[dict] = []
+        for event in events:
+            batch.append(event)
+            if len(batch) == page_size:
+                self.insert_events(account_address, creation_number, batch)
+                count += len(batch)
+                batch = []
+        self.insert_events(account_address, creation_number, batch)
+        return count + len(batch)
+
+    def sync_handle(
+        self,
+        view: EconiaViewer,
+        account_address: AccountAddress,
+        creation_number: int,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> int:
+        """
+        Fetch and store the events of a handle emitted since the last
+        sync, one page per transaction (so an interrupted sync resumes
+        from the last stored page). Returns the number of new events.
+        """
+
+        def get_page(start: int, limit: int) -> List[dict]:
+            return view.get_events_by_creation_number(
+                account_address, creation_number, limit, start
+            )
+
+        start = self.get_next_sequence_number(account_address, creation_number)
+        with EventIterator(get_page, _identity, start, page_size) as events:
+            return self._sync_batches(
+                account_address, creation_number, events, page_size
+            )
+
+    async def gen_sync_handle(
+        self,
+        view: AsyncEconiaViewer,
+        account_address: AccountAddress,
+        creation_number: int,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> int:
+        """
+        Async variant of `sync_handle()`.
+        """
+
+        async def get_page(start: int, limit: int) -> List[dict]:
+            return await view.get_events_by_creation_number(
+                account_address, creation_number, limit, start
+            )
+
+        start = self.get_next_sequence_number(account_address, creation_number)
+        events = AsyncEventIterator(get_page, _identity, start, page_size)
+        count = 0
+        batch: List[dict] = []
+        try:
+            async for event in events:
+                batch.append(event)
+                if len(batch) == page_size:
+                    self.insert_events(account_address, creation_number, batch)
+                    count += len(batch)
+                    batch = []
+        finally:
+            events.close()
+        self.insert_events(account_address, creation_number, batch)
+        return count + len(batch)
+
+    def sync_market_account(
+        self,
+        view: EconiaViewer,
+        user: AccountAddress,
+        market_id: int,
+        custodian_id: int,
+        handles: List[str] = MARKET_ACCOUNT_HANDLES,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> int:
+        """
+        Sync the given event handles of a market account, all of them
+        by default. Returns the number of new events.
+        """
+        creation_numbers = get_market_event_handle_creation_numbers(
+            view, user, market_id, custodian_id
+        )
+        if creation_numbers is None:
+            return 0
+        return sum(
+            self.sync_handle(view, user, creation_numbers[handle], page_size)
+            for handle in handles
+        )
+
+    async def gen_sync_market_account(
+        self,
+        view: AsyncEconiaViewer,
+        user: AccountAddress,
+        market_id: int,
+        custodian_id: int,
+        handles: List[str] = MARKET_ACCOUNT_HANDLES,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> int:
+        """
+        Async variant of `sync_market_account()`.
+        """
+        creation_numbers = await gen_get_market_event_handle_creation_numbers(
+            view, user, market_id, custodian_id
+        )
+        if creation_numbers is None:
+            return 0
+        count = 0
+        for handle in handles:
+            count += await self.gen_sync_handle(
+                view, user, creation_numbers[handle], page_size
+            )
+        return count
+
+    def get_events(
+        self,
+        account_address: Optional[AccountAddress] = None,
+        creation_number: Optional[int] = None,
+        market_id: Optional[int] = None,
+        order_id: Optional[int] = None,
+        min_version: Optional[int] = None,
+        max_version: Optional[int] = None,
+        event_type: Optional[str] = None,  # i.e. FillEvent
+        convert: Optional[Callable[[dict], Any]] = None,
+    ) -> list:
+        """
+        Return the stored events matching all of the given filters in
+        version order, passed through `convert` if given. `order_id`
+        matches either side of a fill.
+        """
+        clauses = []
+        params: List[Any] = []
+        if account_address is not None:
+            clauses.append("account_address = ?")
+            params.append(account_address.hex())
+        if creation_number is not None:
+            clauses.append("creation_number = ?")
+            params.append(creation_number)
+        if market_id is not None:
+            clauses.append("market_id = ?")
+            params.append(market_id)
+        if order_id is not None:
+            clauses.append("(order_id = ? OR taker_order_id = ?)")
+            params.extend([str(order_id), str(order_id)])
+        if min_version is not None:
+            clauses.append("version >= ?")
+            params.append(min_version)
+        if max_version is not None:
+            clauses.append("version <= ?")
+            params.append(max_version)
+        if event_type is not None:
+            clauses.append("type LIKE ?")
+            params.append(f"%::{event_type}")
+        query = (
+            "SELECT account_address, creation_number, sequence_number, version, "
+            "type, data FROM events"
+        )
+        if len(clauses) > 0:
+            query = f"{query} WHERE {' AND '.join(clauses)}"
+        query = f"{query} ORDER BY version, creation_number, sequence_number"
+        events = [_get_event(row) for row in self.connection.execute(query, params)]
+        if convert is not None:
+            return [convert(event) for event in events]
+        return events
+
+
+def _identity(event: dict) -> dict:
+    return event
@@ -0,0 +1,315 @@
+# Buffered consumer of DSS MQTT event topics
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Hashable, Iterator, List, Optional, Tuple, Type
+
+import paho.mqtt.client as mqtt
+
+from econia_sdk.book import DEFAULT_MQTT_PORT
+from econia_sdk.records import (
+    CancelOrderNotification,
+    ChangeOrderSizeNotification,
+    FillNotification,
+    Notification,
+    PlaceLimitOrderNotification,
+    PlaceMarketOrderNotification,
+    PlaceSwapOrderNotification,
+)
+
+# Record type of each DSS MQTT event topic, by first topic level.
+NOTIFICATION_TYPES: Dict[str, Type[Notification]] = {
+    "place_limit_order": PlaceLimitOrderNotification,
+    "place_market_order": PlaceMarketOrderNotification,
+    "place_swap_order": PlaceSwapOrderNotification,
+    "change_order_size": ChangeOrderSizeNotification,
+    "cancel_order": CancelOrderNotification,
+    "fill": FillNotification,
+}
+
+DEFAULT_EVENT_TYPES = (
+    "fill",
+    "place_limit_order",
+    "cancel_order",
+    "change_order_size",
+    "place_swap_order",
+)
+
+# Identifies an event across topics: (market ID, transaction version,
+# taker order ID and sequence number for trade) for fills, which are
+# emitted twice on chain (to maker and taker) with different event
+# indices, or (market ID, transaction version, event index) otherwise.
+EventKey = Tuple[int, ...]
+
+
+def get_event_key(event_type: str, data: dict) -> EventKey:
+    if event_type == "fill":
+        return (
+            int(data["market_id"]),
+            int(data["txn_version"]),
+            int(data["taker_order_id"]),
+            int(data["sequence_number_for_trade"]),
+        )
+    return (int(data["market_id"]), int(data["txn_version"]), int(data["event_idx"]))
+
+
+class Deduplicator:
+    """
+    Remembers event keys for `window` seconds, and at most `max_size`
+    of them, to drop events delivered more than once: the same fill
+    published on both the maker's and the taker's topic, or a message
+    redelivered after a reconnect. Duplicates arriving later than
+    `window` seconds after the first delivery are not detected.
+    """
+
+    window: float
+    max_size: int
+    _seen: "OrderedDict[Hashable, float]"
+
+    def __init__(self, window: float = 60.0, max_size: int = 1_000_000):
+        self.window = window
+        self.max_size = max_size
+        self._seen = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def is_duplicate(self, key: Hashable) -> bool:
+        """
+        Return whether `key` was seen within the window, recording it
+        if not.
+        """
+        now = time.monotonic()
+        seen = self._seen
+        # Keys are in insertion order, so oldest first.
+        while len(seen) > 0:
+            seen_at = next(iter(seen.values()))
+            if now - seen_at <= self.window and len(seen) < self.max_size:
+                break
+            seen.popitem(last=False)
+        if key in seen:
+            return True
+        seen[key] = now
+        return False
+
+
+class StreamStats(dict):
+    """
+    Counters for an `EventStream`, with keys `received` (messages from
+    the broker), `delivered` (messages handed to the consumer),
+    `dropped` (messages discarded because the queue was full),
+    `duplicates`, `undecodable`, `queued`, `lag` (seconds the oldest
+    queued message has waited) and `max_lag` (longest wait of any
+    delivered message).
+    """
+
+
+class EventStream:
+    """
+    Receives DSS MQTT event topics on `paho`'s network thread and hands
+    them to the consumer in batches through a bounded queue, so that a
+    slow consumer can never stall the socket, and keep-alives and
+    acknowledgements go out on time.
+
+    The network thread only appends the raw message to the queue;
+    decoding the JSON payload into a `econia_sdk.records.Notification`
+    (or a dict, unless `records`) happens in `get_batch()` (or
+    `gen_get_batch()`), on the consumer's thread. When `max_queued`
+    messages are waiting, the oldest is dropped to make room, or the
+    new one if not `drop_oldest`, and counted in `stats()`, which also
+    reports how long queued messages have waited.
+
+    Subscribes to `event_types` for each of `market_ids`, or for all
+    markets if `None`, unless raw `topics` are given.
+
+    Events already delivered within the last `dedup_window` seconds, as
+    identified by `get_event_key()`, are dropped by a `Deduplicator`
+    before being decoded into records, so that subscribing to both
+    sides of a fill, or to overlapping topics, yields each event once.
+    Pass `None` to deliver every message.
+    """
+
+    topics: List[str]
+    max_queued: int
+    batch_size: int
+    drop_oldest: bool
+    records: bool
+    dedup: Optional[Deduplicator]
+    mqtt_client: Optional[mqtt.Client]
+    _queue: Deque[Tuple[float, str, bytes]]
+    _condition: threading.Condition
+    _counts: Dict[str, int]
+    _max_lag: float
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _ready: Optional[asyncio.Event]
+
+    def __init__(
+        self,
+        market_ids: Optional[List[int]] = None,
+        event_types: Tuple[str, ...] = DEFAULT_EVENT_TYPES,
+        topics: Optional[List[str]] = None,
+        max_queued: int = 100_000,
+        batch_size: int = 1000,
+        drop_oldest: bool = True,
+        records: bool = True,
+        dedup_window: Optional[float] = 60.0,
+    ):
+        if topics is None:
+            markets = ["+"] if market_ids is None else [str(m) for m in market_ids]
+            topics = [f"{t}/{m}/#" for t in event_types for m in markets]
+        self.topics = topics
+        self.max_queued = max_queued
+        self.batch_size = batch_size
+        self.drop_oldest = drop_oldest
+        self.records = records
+        self.dedup = None if dedup_window is None else Deduplicator(dedup_window)
+        self.mqtt_client = None
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._counts = {
+            "received": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "duplicates": 0,
+            "undecodable": 0,
+        }
+        self._max_lag = 0.0
+        self._loop = None
+        self._ready = None
+
+    def connect(
+        self,
+        host: str,
+        port: int = DEFAULT_MQTT_PORT,
+        keepalive: int = 60,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        """
+        Subscribe to the DSS MQTT broker at `host` on a network thread.
+        """
+        client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)
+        if username is not None:
+            client.username_pw_set(username, password)
+        client.on_connect = lambda client, userdata, flags, reason_code, properties: (
+            client.subscribe([(topic, 1) for topic in self.topics])
+        )
+        client.on_message = lambda client, userdata, msg: self.on_message(
+            msg.topic, msg.payload
+        )
+        client.connect(host, port, keepalive)
+        client.loop_start()
+        self.mqtt_client = client
+
+    def close(self):
+        if self.mqtt_client is not None:
+            self.mqtt_client.loop_stop()
+            self.mqtt_client.disconnect()
+            self.mqtt_client = None
+
+    def on_message(self, topic: str, payload: bytes):
+        """
+        Queue a message, as done on the network thread.
+        """
+        with self._condition:
+            self._counts["received"] += 1
+            if len(self._queue) >= self.max_queued:
+                self._counts["dropped"] += 1
+                if not self.drop_oldest:
+                    return
+                self._queue.popleft()
+            self._queue.append((time.monotonic(), topic, payload))
+            self._condition.notify()
+        # Only wake an async consumer that is waiting.
+        if self._ready is not None and not self._ready.is_set():
+            assert self._loop is not None
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def _take(self) -> List[Tuple[float, str, bytes]]:
+        # Caller holds the condition.
+        n_messages = min(self.batch_size, len(self._queue))
+        messages = [self._queue.popleft() for _ in range(n_messages)]
+        if n_messages > 0:
+            self._counts["delivered"] += n_messages
+            self._max_lag = max(self._max_lag, time.monotonic() - messages[0][0])
+        return messages
+
+    def _decode(self, messages: List[Tuple[float, str, bytes]]) -> List[Any]:
+        batch = []
+        for _, topic, payload in messages:
+            event_type = topic.split("/", 1)[0]
+            try:
+                data = json.loads(payload)
+                if (
+                    self.dedup is not None
+                    and event_type in NOTIFICATION_TYPES
+                    and self.dedup.is_duplicate(get_event_key(event_type, data))
+                ):
+                    self._counts["duplicates"] += 1
+                    continue
+                if self.records:
+                    data = NOTIFICATION_TYPES[event_type](data)
+            except Exception:
+                self._counts["undecodable"] += 1
+                continue
+            batch.append(data)
+        return batch
+
+    def get_batch(self, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Wait up to `timeout` seconds (forever if `None`) for messages,
+        and return up to `batch_size` of them, oldest first, decoded.
+        Returns an empty list on timeout.
+        """
+        with self._condition:
+            if len(self._queue) == 0:
+                self._condition.wait(timeout)
+            messages = self._take()
+        return self._decode(messages)
+
+    async def gen_get_batch(self, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Async variant of `get_batch()`, to be awaited from one event loop.
+        """
+        if self._ready is None:
+            self._loop = asyncio.get_running_loop()
+            self._ready = asyncio.Event()
+        assert self._ready is not None
+        with self._condition:
+            messages = self._take()
+            if len(messages) == 0:
+                self._ready.clear()
+        if len(messages) == 0:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            with self._condition:
+                messages = self._take()
+        return self._decode(messages)
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        """
+        Yield batches as they arrive, until `close()`.
+        """
+        while self.mqtt_client is not None or len(self._queue) > 0:
+            batch = self.get_batch(1.0)
+            if len(batch) > 0:
+                yield batch
+
+    def stats(self) -> StreamStats:
+        with self._condition:
+            lag = time.monotonic() - self._queue[0][0] if len(self._queue) > 0 else 0.0
+            return StreamStats(
+                received=self._counts["received"],
+                delivered=self._counts["delivered"],
+                dropped=self._counts["dropped"],
+                duplicates=self._counts["duplicates"],
+                undecodable=self._counts["undecodable"],
+                queued=len(self._queue),
+                lag=lag,
+                max_lag=self._max_lag,
+            )
@@ -0,0 +1,154 @@
+# Local codec for market order IDs and market account IDs
+
+from typing import Iterable, List, Tuple
+
+# Constants mirrored from `market.move`, `user.move` and `avl_queue.move`.
+HI_64 = 0xFFFFFFFFFFFFFFFF
+HI_PRICE = 0xFFFFFFFF
+NIL = 0
+SHIFT_COUNTER = 64
+SHIFT_MARKET_ID = 64
+SHIFT_ACCESS_SORT_ORDER = 32
+E_ORDER_DID_NOT_POST = 31
+
+
+def did_order_post(market_order_id: int) -> bool:
+    """
+    Return `True` if the order ID corresponds to an order that
+    resulted in a post to the order book.
+    """
+    return (market_order_id & HI_64) != NIL
+
+
+def get_market_order_id_counter(market_order_id: int) -> int:
+    """
+    Return order counter encoded in market order ID.
+    """
+    return (market_order_id >> SHIFT_COUNTER) & HI_64
+
+
+def get_market_order_id_price(market_order_id: int) -> int:
+    """
+    For an order that resulted in a post to the order book, return
+    the order price encoded in its market order ID.
+
+    Raises `ValueError` where the Move function aborts with
+    `E_ORDER_DID_NOT_POST`.
+    """
+    if (market_order_id & HI_64) == NIL:
+        raise ValueError("E_ORDER_DID_NOT_POST", E_ORDER_DID_NOT_POST)
+    return market_order_id & HI_PRICE
+
+
+def get_posted_order_id_side(market_order_id: int) -> bool:
+    """
+    For an order that resulted in a post to the order book, return
+    the side encoded in its order ID: `True` for ask, `False` for bid.
+
+    Raises `ValueError` where the Move function aborts with
+    `E_ORDER_DID_NOT_POST`.
+    """
+    if (market_order_id & HI_64) == NIL:
+        raise ValueError("E_ORDER_DID_NOT_POST", E_ORDER_DID_NOT_POST)
+    return bool((market_order_id >> SHIFT_ACCESS_SORT_ORDER) & 1)
+
+
+def get_market_id(market_account_id: int) -> int:
+    """
+    Return market ID encoded in market account ID.
+    """
+    return market_account_id >> SHIFT_MARKET_ID
+
+
+def get_custodian_id(market_account_id: int) -> int:
+    """
+    Return custodian ID encoded in market account ID.
+    """
+    return market_account_id & HI_64
+
+
+def get_market_account_id(market_id: int, custodian_id: int) -> int:
+    """
+    Return market account ID with encoded market and custodian IDs.
+    """
+    return (market_id << SHIFT_MARKET_ID) | custodian_id
+
+
+# Vectorized variants. NumPy has no 128-bit integer type, so `u128` IDs
+# are handled as a pair of `uint64` arrays: the high and low 64 bits.
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for vectorized ID decoding") from e
+    return numpy
+
+
+def split_u128(values: Iterable[int]) -> Tuple:
+    """
+    Split `u128` integers into `(hi, lo)` `uint64` NumPy arrays.
+    """
+    np = _import_numpy()
+    values = list(values)
+    hi = np.fromiter((value >> 64 for value in values), np.uint64, len(values))
+    lo = np.fromiter((value & HI_64 for value in values), np.uint64, len(values))
+    return hi, lo
+
+
+def join_u128(hi, lo) -> List[int]:
+    """
+    Reassemble `u128` integers from `(hi, lo)` `uint64` arrays.
+    """
+    return [(int(h) << 64) | int(l) for h, l in zip(hi, lo)]
+
+
+def did_orders_post(lo):
+    """
+    Vectorized `did_order_post()` over the low halves of order IDs.
+    """
+    return lo != NIL
+
+
+def get_market_order_id_counters(hi):
+    """
+    Vectorized `get_market_order_id_counter()`: the counter is the high
+    half of the order ID.
+    """
+    return hi
+
+
+def get_market_order_id_prices(lo):
+    """
+    Vectorized `get_market_order_id_price()` over the low halves of
+    order IDs. Raises `ValueError` if any order did not post.
+    """
+    np = _import_numpy()
+    if not np.all(lo != NIL):
+        raise ValueError("E_ORDER_DID_NOT_POST", E_ORDER_DID_NOT_POST)
+    return lo & np.uint64(HI_PRICE)
+
+
+def get_posted_order_id_sides(lo):
+    """
+    Vectorized `get_posted_order_id_side()` over the low halves of
+    order IDs, returning a boolean array (`True` for ask). Raises
+    `ValueError` if any order did not post.
+    """
+    np = _import_numpy()
+    if not np.all(lo != NIL):
+        raise ValueError("E_ORDER_DID_NOT_POST", E_ORDER_DID_NOT_POST)
+    return ((lo >> np.uint64(SHIFT_ACCESS_SORT_ORDER)) & np.uint64(1)).astype(bool)
+
+
+def get_market_account_ids(market_ids, custodian_ids) -> Tuple:
+    """
+    Vectorized `get_market_account_id()`, returning `(hi, lo)` arrays:
+    the market IDs and custodian IDs respectively.
+    """
+    np = _import_numpy()
+    return (
+        np.asarray(market_ids, dtype=np.uint64),
+        np.asarray(custodian_ids, dtype=np.uint64),
+    )
@@ -0,0 +1,158 @@
+# Sorted, array-backed price level ladders
+
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+from econia_sdk.types import Side
+
+
+class PriceLadder:
+    """
+    Price levels for one side of an order book, kept in price-time
+    priority order (ascending for asks, descending for bids) as two
+    parallel sequences: `prices`, an int64 array, and `sizes`, a list of
+    ints in lots, since level sizes are `u128` in Move.
+
+    Levels returned by `get_price_levels_paginated` arrive in priority
+    order, so adding them is usually an append or an in-place increment
+    of the last level, and a level split across two pages is merged
+    rather than counted twice.
+    """
+
+    side: Side
+    prices: array
+    sizes: List[int]
+
+    def __init__(self, side: Side, levels: Iterable[dict] = ()):
+        self.side = side
+        self.prices = array("q")
+        self.sizes = []
+        self.extend(levels)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __iter__(self):
+        return zip(self.prices, self.sizes)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, PriceLadder)
+            and self.side == other.side
+            and self.prices == other.prices
+            and self.sizes == other.sizes
+        )
+
+    def __repr__(self) -> str:
+        return f"PriceLadder({self.side.name}, {self.to_levels()})"
+
+    def _is_before(self, price_a: int, price_b: int) -> bool:
+        # Whether a level at `price_a` has priority over one at `price_b`.
+        if self.side == Side.ASK:
+            return price_a < price_b
+        return price_a > price_b
+
+    def _search(self, price: int) -> int:
+        # Index of the first level without priority over `price`.
+        lo, hi = 0, len(self.prices)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._is_before(self.prices[mid], price):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def add(self, price: int, size: int):
+        """
+        Add `size` to the level at `price`, creating it if needed.
+        """
+        n_levels = len(self.prices)
+        if n_levels == 0 or self._is_before(self.prices[-1], price):
+            self.prices.append(price)
+            self.sizes.append(size)
+            return
+        if self.prices[-1] == price:
+            self.sizes[-1] += size
+            return
+        index = self._search(price)
+        if index < n_levels and self.prices[index] == price:
+            self.sizes[index] += size
+        else:
+            self.prices.insert(index, price)
+            self.sizes.insert(index, size)
+
+    def extend(self, levels: Iterable[dict]):
+        """
+        Add price levels as returned by the view functions, i.e. dicts
+        with stringified `price` and `size`.
+        """
+        for level in levels:
+            self.add(int(level["price"]), int(level["size"]))
+
+    def truncate(self, n_levels: int):
+        """
+        Drop all but the best `n_levels` levels.
+        """
+        del self.prices[n_levels:]
+        del self.sizes[n_levels:]
+
+    def best(self) -> Optional[Tuple[int, int]]:
+        """
+        Return `(price, size)` of the best level, if any.
+        """
+        if len(self.prices) == 0:
+            return None
+        return (self.prices[0], self.sizes[0])
+
+    def size_at(self, price: int) -> int:
+        """
+        Return the size at `price`, 0 if there is no such level.
+        """
+        index = self._search(price)
+        if index < len(self.prices) and self.prices[index] == price:
+            return self.sizes[index]
+        return 0
+
+    def depth(self, n_levels: Optional[int] = None) -> int:
+        """
+        Return the total size of the best `n_levels` levels, or of the
+        whole ladder if `n_levels` is `None`.
+        """
+        return sum(self.sizes[:n_levels])
+
+    def depth_to_price(self, price: int) -> int:
+        """
+        Return the total size of all levels at or better than `price`.
+        """
+        index = self._search(price)
+        if index < len(self.prices) and self.prices[index] == price:
+            index += 1
+        return sum(self.sizes[:index])
+
+    def to_levels(self) -> List[dict]:
+        """
+        Return the ladder as a list of `{"price": ..., "size": ...}`
+        dicts in priority order.
+        """
+        return [
+            {"price": price, "size": size}
+            for price, size in zip(self.prices, self.sizes)
+        ]
+
+    def to_numpy(self) -> Tuple:
+        """
+        Return `(prices, sizes)` as NumPy arrays. `prices` shares the
+        ladder's memory, so levels cannot be inserted while it is alive,
+        and `sizes` is a uint64 copy, or an object array if a size does
+        not fit in 64 bits. Requires `numpy` to be installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("numpy is required for NumPy ladder views") from e
+        try:
+            sizes = np.array(self.sizes, dtype=np.uint64)
+        except OverflowError:
+            sizes = np.array(self.sizes, dtype=object)
+        return np.frombuffer(self.prices, dtype=np.int64), sizes
@@ -1,6 +1,6 @@
 from aptos_sdk.account_address import AccountAddress
 
-from econia_sdk.lib import EconiaViewer
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
 
 
 def get_cost_to_upgrade_integrator_fee_store_view(
@@ -50,6 +50,26 @@ def get_cost_to_upgrade_integrator_fee_store_view(
     return int(returns[0])
 
 
+async def gen_get_cost_to_upgrade_integrator_fee_store_view(
+    view: AsyncEconiaViewer,
+    quote_coin_type: str,
+    utility_coin_type: str,
+    integrator_address: AccountAddress,
+    market_id: int,
+    new_tier: int,
+) -> int:
+    """
+    Async variant of `get_cost_to_upgrade_integrator_fee_store_view()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_cost_to_upgrade_integrator_fee_store_view",
+        [quote_coin_type, utility_coin_type],
+        [integrator_address.address.hex(), str(market_id), str(new_tier)],
+    )
+    return int(returns[0])
+
+
 def get_custodian_registration_fee(view: EconiaViewer) -> int:
     """
     Return custodian registration fee.
@@ -58,6 +78,14 @@ def get_custodian_registration_fee(view: EconiaViewer) -> int:
     return int(returns[0])
 
 
+async def gen_get_custodian_registration_fee(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_custodian_registration_fee()`.
+    """
+    returns = await view.get_returns("incentives", "get_custodian_registration_fee")
+    return int(returns[0])
+
+
 def get_fee_share_divisor(view: EconiaViewer, tier: int) -> int:
     """
     Return integrator fee share divisor for `tier`.
@@ -66,6 +94,16 @@ def get_fee_share_divisor(view: EconiaViewer, tier: int) -> int:
     return int(returns[0])
 
 
+async def gen_get_fee_share_divisor(view: AsyncEconiaViewer, tier: int) -> int:
+    """
+    Async variant of `get_fee_share_divisor()`.
+    """
+    returns = await view.get_returns(
+        "incentives", "get_fee_share_divisor", [], [str(tier)]
+    )
+    return int(returns[0])
+
+
 def get_integrator_withdrawal_fee_view(
     view: EconiaViewer,
     quote_coin_type: str,
@@ -93,6 +131,27 @@ def get_integrator_withdrawal_fee_view(
     return int(returns[0])
 
 
+async def gen_get_integrator_withdrawal_fee_view(
+    view: AsyncEconiaViewer,
+    quote_coin_type: str,
+    integrator_address: AccountAddress,
+    market_id: int,
+) -> int:
+    """
+    Async variant of `get_integrator_withdrawal_fee_view()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_integrator_withdrawal_fee_view",
+        [quote_coin_type],
+        [
+            integrator_address.address.hex(),
+            market_id,
+        ],
+    )
+    return int(returns[0])
+
+
 def get_market_registration_fee(view: EconiaViewer) -> int:
     """
     Return market registration fee.
@@ -104,6 +163,17 @@ def get_market_registration_fee(view: EconiaViewer) -> int:
     return int(returns[0])
 
 
+async def gen_get_market_registration_fee(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_market_registration_fee()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_market_registration_fee",
+    )
+    return int(returns[0])
+
+
 def get_n_fee_store_tiers(view: EconiaViewer) -> int:
     """
     Return number of fee store tiers.
@@ -115,6 +185,17 @@ def get_n_fee_store_tiers(view: EconiaViewer) -> int:
     return int(returns[0])
 
 
+async def gen_get_n_fee_store_tiers(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_n_fee_store_tiers()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_n_fee_store_tiers",
+    )
+    return int(returns[0])
+
+
 def get_taker_fee_divisor(view: EconiaViewer) -> int:
     """
     Return taker fee divisor.
@@ -126,6 +207,17 @@ def get_taker_fee_divisor(view: EconiaViewer) -> int:
     return int(returns[0])
 
 
+async def gen_get_taker_fee_divisor(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_taker_fee_divisor()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_taker_fee_divisor",
+    )
+    return int(returns[0])
+
+
 def get_tier_activation_fee(view: EconiaViewer, tier: int) -> int:
     """
     Return fee to activate an `IntegratorFeeStore` to given `tier`.
@@ -134,6 +226,16 @@ def get_tier_activation_fee(view: EconiaViewer, tier: int) -> int:
     return int(returns[0])
 
 
+async def gen_get_tier_activation_fee(view: AsyncEconiaViewer, tier: int) -> int:
+    """
+    Async variant of `get_tier_activation_fee()`.
+    """
+    returns = await view.get_returns(
+        "incentives", "get_tier_activation_fee", [], [str(tier)]
+    )
+    return int(returns[0])
+
+
 def get_tier_withdrawal_fee(view: EconiaViewer, tier: int) -> int:
     """
     Return fee to withdraw from `IntegratorFeeStore` activated to
@@ -143,6 +245,16 @@ def get_tier_withdrawal_fee(view: EconiaViewer, tier: int) -> int:
     return int(returns[0])
 
 
+async def gen_get_tier_withdrawal_fee(view: AsyncEconiaViewer, tier: int) -> int:
+    """
+    Async variant of `get_tier_withdrawal_fee()`.
+    """
+    returns = await view.get_returns(
+        "incentives", "get_tier_withdrawal_fee", [], [str(tier)]
+    )
+    return int(returns[0])
+
+
 def get_underwriter_registration_fee(view: EconiaViewer) -> int:
     """
     Return underwriter registration fee.
@@ -154,9 +266,28 @@ def get_underwriter_registration_fee(view: EconiaViewer) -> int:
     return int(returns[0])
 
 
+async def gen_get_underwriter_registration_fee(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_underwriter_registration_fee()`.
+    """
+    returns = await view.get_returns(
+        "incentives",
+        "get_underwriter_registration_fee",
+    )
+    return int(returns[0])
+
+
 def is_utility_coin_type(view: EconiaViewer, type: str) -> int:
     """
     Return `true` if `type` is the utility coin type.
     """
     returns = view.get_returns("incentives", "is_utility_coin_type", [type])
     return int(returns[0])
+
+
+async def gen_is_utility_coin_type(view: AsyncEconiaViewer, type: str) -> int:
+    """
+    Async variant of `is_utility_coin_type()`.
+    """
+    returns = await view.get_returns("incentives", "is_utility_coin_type", [type])
+    return int(returns[0])
@@ -1,9 +1,16 @@
-from typing import Any, Optional
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aptos_sdk.account_address import AccountAddress
 
-from econia_sdk.lib import EconiaViewer
+from econia_sdk import columnar
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
+from econia_sdk.records import OpenOrder, PriceLevel
 from econia_sdk.types import Side
+from econia_sdk.utils import ids
+from econia_sdk.utils.ladder import PriceLadder
 
 _HI_64 = 18446744073709551615
 
@@ -12,7 +19,15 @@ def get_ABORT(view: EconiaViewer) -> int:
     """
     Public constant getter for `ABORT`.
     """
-    result = int(view.get_returns("market", "get_ABORT")[0])
+    result = int(view.get_constant("market", "get_ABORT")[0])
+    return result
+
+
+async def gen_get_ABORT(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_ABORT()`.
+    """
+    result = int((await view.get_constant("market", "get_ABORT"))[0])
     return result
 
 
@@ -20,7 +35,15 @@ def get_ASK(view: EconiaViewer) -> bool:
     """
     Public constant getter for `ASK`.
     """
-    result = bool(view.get_returns("market", "get_ASK")[0])
+    result = bool(view.get_constant("market", "get_ASK")[0])
+    return result
+
+
+async def gen_get_ASK(view: AsyncEconiaViewer) -> bool:
+    """
+    Async variant of `get_ASK()`.
+    """
+    result = bool((await view.get_constant("market", "get_ASK"))[0])
     return result
 
 
@@ -28,7 +51,15 @@ def get_BID(view: EconiaViewer) -> bool:
     """
     Public constant getter for `BID`.
     """
-    result = bool(view.get_returns("market", "get_BID")[0])
+    result = bool(view.get_constant("market", "get_BID")[0])
+    return result
+
+
+async def gen_get_BID(view: AsyncEconiaViewer) -> bool:
+    """
+    Async variant of `get_BID()`.
+    """
+    result = bool((await view.get_constant("market", "get_BID"))[0])
     return result
 
 
@@ -36,7 +67,15 @@ def get_BUY(view: EconiaViewer) -> bool:
     """
     Public constant getter for `BUY`.
     """
-    result = bool(view.get_returns("market", "get_BUY")[0])
+    result = bool(view.get_constant("market", "get_BUY")[0])
+    return result
+
+
+async def gen_get_BUY(view: AsyncEconiaViewer) -> bool:
+    """
+    Async variant of `get_BUY()`.
+    """
+    result = bool((await view.get_constant("market", "get_BUY"))[0])
     return result
 
 
@@ -44,7 +83,15 @@ def get_CANCEL_BOTH(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_BOTH`.
     """
-    result = int(view.get_returns("market", "get_CANCEL_BOTH")[0])
+    result = int(view.get_constant("market", "get_CANCEL_BOTH")[0])
+    return result
+
+
+async def gen_get_CANCEL_BOTH(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_BOTH()`.
+    """
+    result = int((await view.get_constant("market", "get_CANCEL_BOTH"))[0])
     return result
 
 
@@ -52,7 +99,15 @@ def get_CANCEL_MAKER(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_MAKER`.
     """
-    result = int(view.get_returns("market", "get_CANCEL_MAKER")[0])
+    result = int(view.get_constant("market", "get_CANCEL_MAKER")[0])
+    return result
+
+
+async def gen_get_CANCEL_MAKER(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_MAKER()`.
+    """
+    result = int((await view.get_constant("market", "get_CANCEL_MAKER"))[0])
     return result
 
 
@@ -60,7 +115,15 @@ def get_CANCEL_TAKER(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_TAKER`.
     """
-    result = int(view.get_returns("market", "get_CANCEL_TAKER")[0])
+    result = int(view.get_constant("market", "get_CANCEL_TAKER")[0])
+    return result
+
+
+async def gen_get_CANCEL_TAKER(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_TAKER()`.
+    """
+    result = int((await view.get_constant("market", "get_CANCEL_TAKER"))[0])
     return result
 
 
@@ -68,7 +131,15 @@ def get_FILL_OR_ABORT(view: EconiaViewer) -> int:
     """
     Public constant getter for `FILL_OR_ABORT`.
     """
-    result = int(view.get_returns("market", "get_FILL_OR_ABORT")[0])
+    result = int(view.get_constant("market", "get_FILL_OR_ABORT")[0])
+    return result
+
+
+async def gen_get_FILL_OR_ABORT(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_FILL_OR_ABORT()`.
+    """
+    result = int((await view.get_constant("market", "get_FILL_OR_ABORT"))[0])
     return result
 
 
@@ -76,7 +147,15 @@ def get_HI_PRICE(view: EconiaViewer) -> int:
     """
     Public constant getter for `HI_PRICE`.
     """
-    result = int(view.get_returns("market", "get_HI_PRICE")[0])
+    result = int(view.get_constant("market", "get_HI_PRICE")[0])
+    return result
+
+
+async def gen_get_HI_PRICE(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_HI_PRICE()`.
+    """
+    result = int((await view.get_constant("market", "get_HI_PRICE"))[0])
     return result
 
 
@@ -84,7 +163,15 @@ def get_IMMEDIATE_OR_CANCEL(view: EconiaViewer) -> int:
     """
     Public constant getter for `IMMEDIATE_OR_CANCEL`.
     """
-    result = int(view.get_returns("market", "get_IMMEDIATE_OR_CANCEL")[0])
+    result = int(view.get_constant("market", "get_IMMEDIATE_OR_CANCEL")[0])
+    return result
+
+
+async def gen_get_IMMEDIATE_OR_CANCEL(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_IMMEDIATE_OR_CANCEL()`.
+    """
+    result = int((await view.get_constant("market", "get_IMMEDIATE_OR_CANCEL"))[0])
     return result
 
 
@@ -92,7 +179,15 @@ def get_MAX_POSSIBLE(view: EconiaViewer) -> int:
     """
     Public constant getter for `MAX_POSSIBLE`.
     """
-    result = int(view.get_returns("market", "get_MAX_POSSIBLE")[0])
+    result = int(view.get_constant("market", "get_MAX_POSSIBLE")[0])
+    return result
+
+
+async def gen_get_MAX_POSSIBLE(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_MAX_POSSIBLE()`.
+    """
+    result = int((await view.get_constant("market", "get_MAX_POSSIBLE"))[0])
     return result
 
 
@@ -100,7 +195,15 @@ def get_NO_CUSTODIAN(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_CUSTODIAN`.
     """
-    result = int(view.get_returns("market", "get_NO_CUSTODIAN")[0])
+    result = int(view.get_constant("market", "get_NO_CUSTODIAN")[0])
+    return result
+
+
+async def gen_get_NO_CUSTODIAN(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_CUSTODIAN()`.
+    """
+    result = int((await view.get_constant("market", "get_NO_CUSTODIAN"))[0])
     return result
 
 
@@ -108,7 +211,15 @@ def get_NO_RESTRICTION(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_RESTRICTION`.
     """
-    result = int(view.get_returns("market", "get_NO_RESTRICTION")[0])
+    result = int(view.get_constant("market", "get_NO_RESTRICTION")[0])
+    return result
+
+
+async def gen_get_NO_RESTRICTION(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_RESTRICTION()`.
+    """
+    result = int((await view.get_constant("market", "get_NO_RESTRICTION"))[0])
     return result
 
 
@@ -116,7 +227,15 @@ def get_NO_UNDERWRITER(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_UNDERWRITER`.
     """
-    result = int(view.get_returns("market", "get_NO_UNDERWRITER")[0])
+    result = int(view.get_constant("market", "get_NO_UNDERWRITER")[0])
+    return result
+
+
+async def gen_get_NO_UNDERWRITER(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_UNDERWRITER()`.
+    """
+    result = int((await view.get_constant("market", "get_NO_UNDERWRITER"))[0])
     return result
 
 
@@ -124,7 +243,15 @@ def get_POST_OR_ABORT(view: EconiaViewer) -> int:
     """
     Public constant getter for `POST_OR_ABORT`.
     """
-    result = int(view.get_returns("market", "get_POST_OR_ABORT")[0])
+    result = int(view.get_constant("market", "get_POST_OR_ABORT")[0])
+    return result
+
+
+async def gen_get_POST_OR_ABORT(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_POST_OR_ABORT()`.
+    """
+    result = int((await view.get_constant("market", "get_POST_OR_ABORT"))[0])
     return result
 
 
@@ -132,7 +259,15 @@ def get_PERCENT(view: EconiaViewer) -> int:
     """
     Public constant getter for `PERCENT`.
     """
-    result = bool(view.get_returns("market", "get_PERCENT")[0])
+    result = bool(view.get_constant("market", "get_PERCENT")[0])
+    return result
+
+
+async def gen_get_PERCENT(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_PERCENT()`.
+    """
+    result = bool((await view.get_constant("market", "get_PERCENT"))[0])
     return result
 
 
@@ -140,7 +275,15 @@ def get_SELL(view: EconiaViewer) -> int:
     """
     Public constant getter for `SELL`.
     """
-    result = bool(view.get_returns("market", "get_SELL")[0])
+    result = bool(view.get_constant("market", "get_SELL")[0])
+    return result
+
+
+async def gen_get_SELL(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_SELL()`.
+    """
+    result = bool((await view.get_constant("market", "get_SELL"))[0])
     return result
 
 
@@ -148,21 +291,51 @@ def get_TICKS(view: EconiaViewer) -> int:
     """
     Public constant getter for `TICKS`.
     """
-    result = bool(view.get_returns("market", "get_TICKS")[0])
+    result = bool(view.get_constant("market", "get_TICKS")[0])
+    return result
+
+
+async def gen_get_TICKS(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_TICKS()`.
+    """
+    result = bool((await view.get_constant("market", "get_TICKS"))[0])
     return result
 
 
-def get_market_order_id_counter(view: EconiaViewer, market_order_id: int) -> int:
+def get_market_order_id_counter(
+    view: EconiaViewer, market_order_id: int, remote: bool = False
+) -> int:
     """
     Return order counter encoded in market order ID.
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_market_order_id_counter(market_order_id)
     returns = view.get_returns(
         "market", "get_market_order_id_counter", [], [str(market_order_id)]
     )
     return int(returns[0])
 
 
-def get_market_order_id_price(view: EconiaViewer, market_order_id: int) -> int:
+async def gen_get_market_order_id_counter(
+    view: AsyncEconiaViewer, market_order_id: int, remote: bool = False
+) -> int:
+    """
+    Async variant of `get_market_order_id_counter()`.
+    """
+    if not remote:
+        return ids.get_market_order_id_counter(market_order_id)
+    returns = await view.get_returns(
+        "market", "get_market_order_id_counter", [], [str(market_order_id)]
+    )
+    return int(returns[0])
+
+
+def get_market_order_id_price(
+    view: EconiaViewer, market_order_id: int, remote: bool = False
+) -> int:
     """
     For an order that resulted in a post to the order book, return
     the order price encoded in its market order ID, corresponding to
@@ -172,14 +345,34 @@ def get_market_order_id_price(view: EconiaViewer, market_order_id: int) -> int:
     Aborts:
     * `E_ORDER_DID_NOT_POST`: Order ID corresponds to an order that
       did not post to the book.
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_market_order_id_price(market_order_id)
     returns = view.get_returns(
         "market", "get_market_order_id_price", [], [str(market_order_id)]
     )
     return int(returns[0])
 
 
-def get_posted_order_id_side(view: EconiaViewer, market_order_id: int) -> bool:
+async def gen_get_market_order_id_price(
+    view: AsyncEconiaViewer, market_order_id: int, remote: bool = False
+) -> int:
+    """
+    Async variant of `get_market_order_id_price()`.
+    """
+    if not remote:
+        return ids.get_market_order_id_price(market_order_id)
+    returns = await view.get_returns(
+        "market", "get_market_order_id_price", [], [str(market_order_id)]
+    )
+    return int(returns[0])
+
+
+def get_posted_order_id_side(
+    view: EconiaViewer, market_order_id: int, remote: bool = False
+) -> bool:
     """
     For an order that resulted in a post to the order book, return
     the order side encoded in its order ID, corresponding to the
@@ -188,13 +381,31 @@ def get_posted_order_id_side(view: EconiaViewer, market_order_id: int) -> bool:
     Aborts:
     * `E_ORDER_DID_NOT_POST`: Order ID corresponds to an order that
       did not post to the book.
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_posted_order_id_side(market_order_id)
     returns = view.get_returns(
         "market", "get_posted_order_id_side", [], [str(market_order_id)]
     )
     return bool(returns[0])
 
 
+async def gen_get_posted_order_id_side(
+    view: AsyncEconiaViewer, market_order_id: int, remote: bool = False
+) -> bool:
+    """
+    Async variant of `get_posted_order_id_side()`.
+    """
+    if not remote:
+        return ids.get_posted_order_id_side(market_order_id)
+    returns = await view.get_returns(
+        "market", "get_posted_order_id_side", [], [str(market_order_id)]
+    )
+    return bool(returns[0])
+
+
 def get_open_order(
     view: EconiaViewer, market_id: int, market_order_id: int
 ) -> Optional[dict]:
@@ -212,11 +423,28 @@ def get_open_order(
         return _convert_open_order_value(opt_val[0])
 
 
+async def gen_get_open_order(
+    view: AsyncEconiaViewer, market_id: int, market_order_id: int
+) -> Optional[dict]:
+    """
+    Async variant of `get_open_order()`.
+    """
+    returns = await view.get_returns(
+        "market", "get_open_order", [], [str(market_id), str(market_order_id)]
+    )
+    opt_val = returns[0]["vec"]
+    if len(opt_val) == 0:
+        return None
+    else:
+        return _convert_open_order_value(opt_val[0])
+
+
 def get_open_orders(
     view: EconiaViewer,
     market_id: int,
     n_asks_max: int = _HI_64,
     n_bids_max: int = _HI_64,
+    records: bool = False,
 ) -> dict:
     """
     Index order book for given market ID into "asks" and "bids"
@@ -226,6 +454,8 @@ def get_open_orders(
     * `market_id`: Market ID of maker orders to index.
     * `n_asks_max`: Maximum number of asks to index.
     * `n_bids_max`: Maximum number of bids to index.
+    * `records`: Return `econia_sdk.records.OpenOrder` instances rather
+      than dicts.
 
     Aborts:
     * `E_INVALID_MARKET_ID`: No market with given ID.
@@ -240,7 +470,38 @@ def get_open_orders(
             str(n_bids_max),
         ],
     )
-    value = returns[0]
+    return _convert_open_orders_value(returns[0], records)
+
+
+async def gen_get_open_orders(
+    view: AsyncEconiaViewer,
+    market_id: int,
+    n_asks_max: int = _HI_64,
+    n_bids_max: int = _HI_64,
+    records: bool = False,
+) -> dict:
+    """
+    Async variant of `get_open_orders()`.
+    """
+    returns = await view.get_returns(
+        "market",
+        "get_open_orders",
+        [],
+        [
+            str(market_id),
+            str(n_asks_max),
+            str(n_bids_max),
+        ],
+    )
+    return _convert_open_orders_value(returns[0], records)
+
+
+def _convert_open_orders_value(value, records: bool = False) -> dict:
+    if records:
+        return {
+            "bids": [OpenOrder(bid) for bid in value["bids"]],
+            "asks": [OpenOrder(ask) for ask in value["asks"]],
+        }
     bids = []
     for bid in value["bids"]:
         bids.append(_convert_open_order_value(bid))
@@ -265,12 +526,23 @@ def _convert_open_order_value(value) -> dict:
     }
 
 
-def get_open_orders_all(view: EconiaViewer, market_id: int) -> dict:
+def get_open_orders_all(
+    view: EconiaViewer, market_id: int, records: bool = False
+) -> dict:
     """
     Wrapped call to `get_open_orders()` for getting all open orders
     on both sides.
     """
-    return get_open_orders(view, market_id)
+    return get_open_orders(view, market_id, records=records)
+
+
+async def gen_get_open_orders_all(
+    view: AsyncEconiaViewer, market_id: int, records: bool = False
+) -> dict:
+    """
+    Async variant of `get_open_orders_all()`.
+    """
+    return await gen_get_open_orders(view, market_id, records=records)
 
 
 def get_price_levels(
@@ -278,6 +550,8 @@ def get_price_levels(
     market_id: int,
     n_ask_levels_max: int = _HI_64,
     n_bid_levels_max: int = _HI_64,
+    records: bool = False,
+    ledger_version: int = -1,
 ) -> dict:
     """
     Index order book for given market ID into price level "bids" and
@@ -291,6 +565,10 @@ def get_price_levels(
       index.
     * `n_bid_levels_max`: Maximum number of bid price levels to
       index.
+    * `records`: Return `econia_sdk.records.PriceLevel` instances
+      rather than dicts.
+    * `ledger_version`: Ledger version to read the order book at, the
+      latest if negative.
     """
     returns = view.get_returns(
         "market",
@@ -301,8 +579,43 @@ def get_price_levels(
             str(n_ask_levels_max),
             str(n_bid_levels_max),
         ],
+        ledger_version=ledger_version,
+    )
+    return _convert_price_levels_value(returns[0], records)
+
+
+async def gen_get_price_levels(
+    view: AsyncEconiaViewer,
+    market_id: int,
+    n_ask_levels_max: int = _HI_64,
+    n_bid_levels_max: int = _HI_64,
+    records: bool = False,
+    ledger_version: int = -1,
+) -> dict:
+    """
+    Async variant of `get_price_levels()`.
+    """
+    returns = await view.get_returns(
+        "market",
+        "get_price_levels",
+        [],
+        [
+            str(market_id),
+            str(n_ask_levels_max),
+            str(n_bid_levels_max),
+        ],
+        ledger_version=ledger_version,
     )
-    value = returns[0]
+    return _convert_price_levels_value(returns[0], records)
+
+
+def _convert_price_levels_value(value, records: bool = False) -> dict:
+    if records:
+        return {
+            "asks": [PriceLevel(ask) for ask in value["asks"]],
+            "bids": [PriceLevel(bid) for bid in value["bids"]],
+            "market_id": int(value["market_id"]),
+        }
     asks = []
     for ask in value["asks"]:
         asks.append({"price": int(ask["price"]), "size": int(ask["size"])})
@@ -312,60 +625,257 @@ def get_price_levels(
     return {"asks": asks, "bids": bids, "market_id": int(value["market_id"])}
 
 
-def get_price_levels_all(view: EconiaViewer, market_id: int) -> dict:
+def get_price_levels_all(
+    view: EconiaViewer, market_id: int, records: bool = False
+) -> dict:
     """
     Wrapped call to `get_price_levels()` for getting all price
     levels on both sides.
     """
-    return get_price_levels(view, market_id)
+    return get_price_levels(view, market_id, records=records)
 
 
-def get_open_orders_paginated(
-    viewer: EconiaViewer,
+async def gen_get_price_levels_all(
+    view: AsyncEconiaViewer, market_id: int, records: bool = False
+) -> dict:
+    """
+    Async variant of `get_price_levels_all()`.
+    """
+    return await gen_get_price_levels(view, market_id, records=records)
+
+
+def get_open_orders_columnar(
+    view: EconiaViewer,
     market_id: int,
-    ask_page_size: int,
-    bid_page_size: int,
-    next_ask_idx: int,
-    next_bid_idx: int,
-    ledger_version: int,
-):
-    returns = viewer.get_returns(
+    n_asks_max: int = _HI_64,
+    n_bids_max: int = _HI_64,
+) -> dict:
+    """
+    Like `get_open_orders()`, but with each side decoded directly into a
+    NumPy structured array per `econia_sdk.columnar.OPEN_ORDER_FIELDS`.
+    """
+    returns = view.get_returns(
         "market",
-        "get_open_orders_paginated",
+        "get_open_orders",
         [],
         [
             str(market_id),
-            str(ask_page_size),
-            str(bid_page_size),
-            str(next_ask_idx),
-            str(next_bid_idx),
+            str(n_asks_max),
+            str(n_bids_max),
         ],
-        ledger_version=ledger_version,
     )
-    return returns
+    return {
+        "asks": columnar.open_orders_to_numpy(returns[0]["asks"]),
+        "bids": columnar.open_orders_to_numpy(returns[0]["bids"]),
+    }
 
 
-def get_open_orders_with_pagination(
-    viewer: EconiaViewer,
+async def gen_get_open_orders_columnar(
+    view: AsyncEconiaViewer,
     market_id: int,
-    max_asks: int = 100,
-    max_bids: int = 100,
-    page_size: int = 100,
+    n_asks_max: int = _HI_64,
+    n_bids_max: int = _HI_64,
 ) -> dict:
-    info = viewer.aptos_client.info()
-    ledger_version = int(info["ledger_version"])
+    """
+    Async variant of `get_open_orders_columnar()`.
+    """
+    returns = await view.get_returns(
+        "market",
+        "get_open_orders",
+        [],
+        [
+            str(market_id),
+            str(n_asks_max),
+            str(n_bids_max),
+        ],
+    )
+    return {
+        "asks": columnar.open_orders_to_numpy(returns[0]["asks"]),
+        "bids": columnar.open_orders_to_numpy(returns[0]["bids"]),
+    }
 
-    next_ask_idx = "0"
-    next_bid_idx = "0"
-    bid_page_size = ask_page_size = page_size
 
-    asks = []
-    bids = []
+def get_price_levels_columnar(
+    view: EconiaViewer,
+    market_id: int,
+    n_ask_levels_max: int = _HI_64,
+    n_bid_levels_max: int = _HI_64,
+) -> dict:
+    """
+    Like `get_price_levels()`, but with each side decoded directly into
+    a NumPy structured array per `econia_sdk.columnar.PRICE_LEVEL_FIELDS`.
+    """
+    returns = view.get_returns(
+        "market",
+        "get_price_levels",
+        [],
+        [
+            str(market_id),
+            str(n_ask_levels_max),
+            str(n_bid_levels_max),
+        ],
+    )
+    return {
+        "asks": columnar.price_levels_to_numpy(returns[0]["asks"]),
+        "bids": columnar.price_levels_to_numpy(returns[0]["bids"]),
+        "market_id": int(returns[0]["market_id"]),
+    }
 
-    keep_looping = True
-    while keep_looping:
-        returns = get_open_orders_paginated(
-            viewer,
+
+async def gen_get_price_levels_columnar(
+    view: AsyncEconiaViewer,
+    market_id: int,
+    n_ask_levels_max: int = _HI_64,
+    n_bid_levels_max: int = _HI_64,
+) -> dict:
+    """
+    Async variant of `get_price_levels_columnar()`.
+    """
+    returns = await view.get_returns(
+        "market",
+        "get_price_levels",
+        [],
+        [
+            str(market_id),
+            str(n_ask_levels_max),
+            str(n_bid_levels_max),
+        ],
+    )
+    return {
+        "asks": columnar.price_levels_to_numpy(returns[0]["asks"]),
+        "bids": columnar.price_levels_to_numpy(returns[0]["bids"]),
+        "market_id": int(returns[0]["market_id"]),
+    }
+
+
+def get_open_orders_paginated(
+    viewer: EconiaViewer,
+    market_id: int,
+    ask_page_size: int,
+    bid_page_size: int,
+    next_ask_idx: int,
+    next_bid_idx: int,
+    ledger_version: int,
+):
+    returns = viewer.get_returns(
+        "market",
+        "get_open_orders_paginated",
+        [],
+        [
+            str(market_id),
+            str(ask_page_size),
+            str(bid_page_size),
+            str(next_ask_idx),
+            str(next_bid_idx),
+        ],
+        ledger_version=ledger_version,
+    )
+    return returns
+
+
+async def gen_get_open_orders_paginated(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    ask_page_size: int,
+    bid_page_size: int,
+    next_ask_idx: int,
+    next_bid_idx: int,
+    ledger_version: int,
+):
+    returns = await viewer.get_returns(
+        "market",
+        "get_open_orders_paginated",
+        [],
+        [
+            str(market_id),
+            str(ask_page_size),
+            str(bid_page_size),
+            str(next_ask_idx),
+            str(next_bid_idx),
+        ],
+        ledger_version=ledger_version,
+    )
+    return returns
+
+
+def get_open_orders_with_pagination(
+    viewer: EconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    records: bool = False,
+) -> dict:
+    info = viewer.aptos_client.info()
+    ledger_version = int(info["ledger_version"])
+
+    next_ask_idx = "0"
+    next_bid_idx = "0"
+    bid_page_size = ask_page_size = page_size
+
+    asks = []
+    bids = []
+
+    keep_looping = True
+    while keep_looping:
+        returns = get_open_orders_paginated(
+            viewer,
+            market_id,
+            min(ask_page_size, max(max_asks - len(asks), 0)),
+            min(bid_page_size, max(max_bids - len(bids), 0)),
+            int(next_ask_idx),
+            int(next_bid_idx),
+            ledger_version,
+        )
+
+        value = returns[0]
+        next_ask_idx = returns[1]
+        next_bid_idx = returns[2]
+
+        convert = OpenOrder if records else _convert_open_order_value
+        for ask in value["asks"]:
+            asks.append(convert(ask))
+        for bid in value["bids"]:
+            bids.append(convert(bid))
+
+        if (len(asks) >= max_asks or next_ask_idx == "0") and (
+            len(bids) >= max_bids or next_bid_idx == "0"
+        ):
+            keep_looping = False
+        elif next_ask_idx == "0" or next_bid_idx == "0":
+            if next_ask_idx == "0":
+                ask_page_size = 0
+            else:
+                bid_page_size = 0
+
+    return {"asks": asks, "bids": bids, "market_id": market_id}
+
+
+async def gen_get_open_orders_with_pagination(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    records: bool = False,
+) -> dict:
+    """
+    Async variant of `get_open_orders_with_pagination()`.
+    """
+    info = await viewer.aptos_client.info()
+    ledger_version = int(info["ledger_version"])
+
+    next_ask_idx = "0"
+    next_bid_idx = "0"
+    bid_page_size = ask_page_size = page_size
+
+    asks: list = []
+    bids: list = []
+
+    keep_looping = True
+    while keep_looping:
+        returns = await gen_get_open_orders_paginated(
+            viewer,
             market_id,
             min(ask_page_size, max(max_asks - len(asks), 0)),
             min(bid_page_size, max(max_bids - len(bids), 0)),
@@ -378,10 +888,11 @@ def get_open_orders_with_pagination(
         next_ask_idx = returns[1]
         next_bid_idx = returns[2]
 
+        convert = OpenOrder if records else _convert_open_order_value
         for ask in value["asks"]:
-            asks.append(_convert_open_order_value(ask))
+            asks.append(convert(ask))
         for bid in value["bids"]:
-            bids.append(_convert_open_order_value(bid))
+            bids.append(convert(bid))
 
         if (len(asks) >= max_asks or next_ask_idx == "0") and (
             len(bids) >= max_bids or next_bid_idx == "0"
@@ -421,71 +932,582 @@ def get_price_levels_paginated(
     return returns
 
 
-def get_price_levels_with_pagination(
+async def gen_get_price_levels_paginated(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    ask_page_size: int,
+    bid_page_size: int,
+    next_ask_idx: int,
+    next_bid_idx: int,
+    ledger_version: int,
+):
+    returns = await viewer.get_returns(
+        "market",
+        "get_price_levels_paginated",
+        [],
+        [
+            str(market_id),
+            str(ask_page_size),
+            str(bid_page_size),
+            str(next_ask_idx),
+            str(next_bid_idx),
+        ],
+        ledger_version=ledger_version,
+    )
+    return returns
+
+
+def _truncate_price_ladders(
+    ladders: Dict[str, PriceLadder], max_asks: int, max_bids: int, market_id: int
+) -> dict:
+    ladders["asks"].truncate(max_asks)
+    ladders["bids"].truncate(max_bids)
+    return {**ladders, "market_id": market_id}
+
+
+def _get_price_levels_lists(ladders: dict) -> dict:
+    return {
+        "asks": ladders["asks"].to_levels(),
+        "bids": ladders["bids"].to_levels(),
+        "market_id": ladders["market_id"],
+    }
+
+
+def _get_ladder_page_sizes(
+    ladders: Dict[str, PriceLadder],
+    max_asks: int,
+    max_bids: int,
+    page_size: int,
+    next_ask_idx: int,
+    next_bid_idx: int,
+) -> Tuple[int, int]:
+    # A side is done once its cursor is `NIL` or it holds more than the
+    # maximum number of levels, since only then is the last kept level
+    # known to be complete.
+    ask_page_size = bid_page_size = 0
+    if next_ask_idx != 0 and len(ladders["asks"]) <= max_asks:
+        ask_page_size = page_size
+    if next_bid_idx != 0 and len(ladders["bids"]) <= max_bids:
+        bid_page_size = page_size
+    return ask_page_size, bid_page_size
+
+
+def get_price_ladders_with_pagination(
     viewer: EconiaViewer,
     market_id: int,
     max_asks: int = 100,
     max_bids: int = 100,
     page_size: int = 100,
+    ledger_version: int = -1,
 ) -> dict:
-    info = viewer.aptos_client.info()
-    ledger_version = int(info["ledger_version"])
+    """
+    Index up to `max_asks` ask and `max_bids` bid price levels into
+    `PriceLadder`s, paginating `page_size` orders at a time with every
+    page pinned to the same ledger version.
 
-    next_ask_idx = "0"
-    next_bid_idx = "0"
-    bid_page_size = ask_page_size = page_size
+    Returns a dict with `asks` and `bids` ladders and `market_id`.
+    """
+    if ledger_version < 0:
+        info = viewer.aptos_client.info()
+        ledger_version = int(info["ledger_version"])
 
-    asks = dict()
-    n_indexed_asks = 0
-    bids = dict()
-    n_indexed_bids = 0
+    ladders = {"asks": PriceLadder(Side.ASK), "bids": PriceLadder(Side.BID)}
+    ask_page_size = page_size if max_asks > 0 else 0
+    bid_page_size = page_size if max_bids > 0 else 0
+    next_ask_idx = next_bid_idx = 0
 
-    keep_looping = True
-    while keep_looping:
+    while ask_page_size > 0 or bid_page_size > 0:
         returns = get_price_levels_paginated(
             viewer,
             market_id,
-            min(ask_page_size, max(max_asks - n_indexed_asks, 0)),
-            min(bid_page_size, max(max_bids - n_indexed_bids, 0)),
-            int(next_ask_idx),
-            int(next_bid_idx),
+            ask_page_size,
+            bid_page_size,
+            next_ask_idx,
+            next_bid_idx,
             ledger_version,
         )
 
         value = returns[0]
-        next_ask_idx = returns[1]
-        next_bid_idx = returns[2]
+        next_ask_idx = int(returns[1])
+        next_bid_idx = int(returns[2])
 
-        for ask in value["asks"]:
-            price = int(ask["price"])
-            size = int(ask["size"])
-            if price in asks:
-                asks[price] += size
-            else:
-                asks[price] = size
-        for bid in value["bids"]:
-            price = int(bid["price"])
-            size = int(bid["size"])
-            if price in bids:
-                bids[price] += size
-            else:
-                bids[price] = size
-        n_indexed_asks += ask_page_size
-        n_indexed_bids += bid_page_size
+        ladders["asks"].extend(value["asks"])
+        ladders["bids"].extend(value["bids"])
+        ask_page_size, bid_page_size = _get_ladder_page_sizes(
+            ladders, max_asks, max_bids, page_size, next_ask_idx, next_bid_idx
+        )
 
-        if (n_indexed_asks >= max_asks or next_ask_idx == "0") and (
-            n_indexed_bids >= max_bids or next_bid_idx == "0"
-        ):
-            keep_looping = False
-        elif next_ask_idx == "0" or next_bid_idx == "0":
-            if next_ask_idx == "0":
-                ask_page_size = 0
-            else:
-                bid_page_size = 0
+    return _truncate_price_ladders(ladders, max_asks, max_bids, market_id)
 
-    asks_levels = [{"price": price, "size": size} for price, size in asks.items()]
-    bids_levels = [{"price": price, "size": size} for price, size in bids.items()]
-    return {"asks": asks_levels, "bids": bids_levels, "market_id": market_id}
+
+async def gen_get_price_ladders_with_pagination(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    ledger_version: int = -1,
+) -> dict:
+    """
+    Async variant of `get_price_ladders_with_pagination()`.
+    """
+    if ledger_version < 0:
+        info = await viewer.aptos_client.info()
+        ledger_version = int(info["ledger_version"])
+
+    ladders = {"asks": PriceLadder(Side.ASK), "bids": PriceLadder(Side.BID)}
+    ask_page_size = page_size if max_asks > 0 else 0
+    bid_page_size = page_size if max_bids > 0 else 0
+    next_ask_idx = next_bid_idx = 0
+
+    while ask_page_size > 0 or bid_page_size > 0:
+        returns = await gen_get_price_levels_paginated(
+            viewer,
+            market_id,
+            ask_page_size,
+            bid_page_size,
+            next_ask_idx,
+            next_bid_idx,
+            ledger_version,
+        )
+
+        value = returns[0]
+        next_ask_idx = int(returns[1])
+        next_bid_idx = int(returns[2])
+
+        ladders["asks"].extend(value["asks"])
+        ladders["bids"].extend(value["bids"])
+        ask_page_size, bid_page_size = _get_ladder_page_sizes(
+            ladders, max_asks, max_bids, page_size, next_ask_idx, next_bid_idx
+        )
+
+    return _truncate_price_ladders(ladders, max_asks, max_bids, market_id)
+
+
+def get_price_levels_with_pagination(
+    viewer: EconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+) -> dict:
+    """
+    Like `get_price_ladders_with_pagination()`, but with each side as a
+    list of `{"price": ..., "size": ...}` dicts in priority order.
+    """
+    ladders = get_price_ladders_with_pagination(
+        viewer, market_id, max_asks, max_bids, page_size
+    )
+    return _get_price_levels_lists(ladders)
+
+
+async def gen_get_price_levels_with_pagination(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+) -> dict:
+    """
+    Async variant of `get_price_levels_with_pagination()`.
+    """
+    ladders = await gen_get_price_ladders_with_pagination(
+        viewer, market_id, max_asks, max_bids, page_size
+    )
+    return _get_price_levels_lists(ladders)
+
+
+class PaginationStats(dict):
+    """
+    Counters for a pipelined pagination run, with keys `ledger_version`,
+    `ask_pages`, `bid_pages`, `pages`, `elapsed` (seconds) and
+    `pages_per_second`.
+    """
+
+    def __init__(self, ledger_version: int):
+        super().__init__(
+            ledger_version=ledger_version,
+            ask_pages=0,
+            bid_pages=0,
+            pages=0,
+            elapsed=0.0,
+            pages_per_second=0.0,
+        )
+        self._start = time.perf_counter()
+
+    def _count_page(self, side: str):
+        self[f"{side[:3]}_pages"] += 1
+        self["pages"] += 1
+
+    def _finish(self):
+        self["elapsed"] = time.perf_counter() - self._start
+        if self["elapsed"] > 0:
+            self["pages_per_second"] = self["pages"] / self["elapsed"]
+
+
+def _get_side_page_args(
+    side: str, n_to_index: int, next_idx: int
+) -> Tuple[int, int, int, int]:
+    # (ask_page_size, bid_page_size, next_ask_idx, next_bid_idx)
+    if side == "asks":
+        return (n_to_index, 0, next_idx, 0)
+    return (0, n_to_index, 0, next_idx)
+
+
+def _paginate_pipelined(
+    viewer: EconiaViewer,
+    get_paginated: Callable,
+    market_id: int,
+    max_asks: int,
+    max_bids: int,
+    page_size: int,
+    max_concurrency: int,
+    ledger_version: int,
+    decode: Callable[[str, List[dict]], bool],
+    limit_page_sizes: bool,
+) -> PaginationStats:
+    # Walk asks and bids on independent cursors. Each side has at most
+    # one page in flight, and the next page is requested before the
+    # current one is handed to `decode()`, which returns `True` once the
+    # side needs no more pages, in which case the page requested is
+    # dropped without waiting for it. If `limit_page_sizes`, pages are
+    # also capped so no more than the maximum number of orders is
+    # indexed.
+    if ledger_version < 0:
+        ledger_version = int(viewer.aptos_client.info()["ledger_version"])
+    stats = PaginationStats(ledger_version)
+    max_items = {"asks": max_asks, "bids": max_bids}
+    n_indexed = {"asks": 0, "bids": 0}
+    requested: Dict[str, int] = {}
+    pending: Dict[Future, str] = {}
+    in_flight: Dict[str, Future] = {}
+
+    def submit(side: str, next_idx: int):
+        n_to_index = page_size
+        if limit_page_sizes:
+            n_to_index = min(page_size, max_items[side] - n_indexed[side])
+        future = executor.submit(
+            get_paginated,
+            viewer,
+            market_id,
+            *_get_side_page_args(side, n_to_index, next_idx),
+            ledger_version,
+        )
+        requested[side] = n_to_index
+        pending[future] = side
+        in_flight[side] = future
+
+    # Not a context manager, which would wait for dropped pages on exit.
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, 2))
+    try:
+        for side in ("asks", "bids"):
+            if max_items[side] > 0:
+                submit(side, 0)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                side = pending.pop(future)
+                del in_flight[side]
+                returns = future.result()
+                stats._count_page(side)
+                next_idx = int(returns[1] if side == "asks" else returns[2])
+                n_indexed[side] += requested[side]
+                if next_idx != 0 and (
+                    not limit_page_sizes or n_indexed[side] < max_items[side]
+                ):
+                    submit(side, next_idx)
+                if decode(side, returns[0][side]) and side in in_flight:
+                    dropped = in_flight.pop(side)
+                    dropped.cancel()
+                    del pending[dropped]
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+    stats._finish()
+    return stats
+
+
+async def _cancel_task(task: asyncio.Task):
+    # Cancel `task` and wait for it to finish, ignoring its outcome.
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def _gen_paginate_pipelined(
+    viewer: AsyncEconiaViewer,
+    gen_get_paginated: Callable,
+    market_id: int,
+    max_asks: int,
+    max_bids: int,
+    page_size: int,
+    max_concurrency: int,
+    ledger_version: int,
+    decode: Callable[[str, List[dict]], bool],
+    limit_page_sizes: bool,
+) -> PaginationStats:
+    if ledger_version < 0:
+        info = await viewer.aptos_client.info()
+        ledger_version = int(info["ledger_version"])
+    stats = PaginationStats(ledger_version)
+    semaphore = asyncio.Semaphore(min(max_concurrency, 2))
+
+    async def get_page(side: str, n_to_index: int, next_idx: int):
+        async with semaphore:
+            return await gen_get_paginated(
+                viewer,
+                market_id,
+                *_get_side_page_args(side, n_to_index, next_idx),
+                ledger_version,
+            )
+
+    def get_n_to_index(max_items: int, n_indexed: int) -> int:
+        if limit_page_sizes:
+            return min(page_size, max_items - n_indexed)
+        return page_size
+
+    async def paginate_side(side: str, max_items: int):
+        n_indexed = 0
+        n_to_index = get_n_to_index(max_items, n_indexed)
+        task: Optional[asyncio.Task] = asyncio.create_task(
+            get_page(side, n_to_index, 0)
+        )
+        try:
+            while task is not None:
+                returns = await task
+                stats._count_page(side)
+                next_idx = int(returns[1] if side == "asks" else returns[2])
+                n_indexed += n_to_index
+                task = None
+                if next_idx != 0 and (not limit_page_sizes or n_indexed < max_items):
+                    n_to_index = get_n_to_index(max_items, n_indexed)
+                    task = asyncio.create_task(get_page(side, n_to_index, next_idx))
+                if decode(side, returns[0][side]) and task is not None:
+                    await _cancel_task(task)
+                    task = None
+        finally:
+            # Reap the page in flight if the other side failed, or this
+            # one did.
+            if task is not None:
+                await _cancel_task(task)
+
+    tasks = [
+        asyncio.ensure_future(paginate_side(side, max_items))
+        for side, max_items in (("asks", max_asks), ("bids", max_bids))
+        if max_items > 0
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    stats._finish()
+    return stats
+
+
+def get_open_orders_pipelined(
+    viewer: EconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+    records: bool = False,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Like `get_open_orders_with_pagination()`, but asks and bids are
+    paginated on independent cursors, concurrently, with the next page
+    of each side requested while the current one is decoded.
+
+    Every page is pinned to `ledger_version`, or to the latest ledger
+    version read once up front if negative. Each side has at most one
+    page in flight, so `max_concurrency` is capped at 2: pass 1 to
+    request one page at a time.
+
+    Returns the open orders and a `PaginationStats`.
+    """
+    orders: Dict[str, list] = {"asks": [], "bids": []}
+    convert = OpenOrder if records else _convert_open_order_value
+
+    def decode(side: str, values: List[dict]) -> bool:
+        for value in values:
+            orders[side].append(convert(value))
+        return False
+
+    stats = _paginate_pipelined(
+        viewer,
+        get_open_orders_paginated,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+        decode,
+        True,
+    )
+    return {**orders, "market_id": market_id}, stats
+
+
+async def gen_get_open_orders_pipelined(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+    records: bool = False,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Async variant of `get_open_orders_pipelined()`.
+    """
+    orders: Dict[str, list] = {"asks": [], "bids": []}
+    convert = OpenOrder if records else _convert_open_order_value
+
+    def decode(side: str, values: List[dict]) -> bool:
+        for value in values:
+            orders[side].append(convert(value))
+        return False
+
+    stats = await _gen_paginate_pipelined(
+        viewer,
+        gen_get_open_orders_paginated,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+        decode,
+        True,
+    )
+    return {**orders, "market_id": market_id}, stats
+
+
+def _aggregate_price_levels(
+    ladders: Dict[str, PriceLadder], max_asks: int, max_bids: int
+) -> Callable[[str, List[dict]], bool]:
+    max_levels = {"asks": max_asks, "bids": max_bids}
+
+    def decode(side: str, values: List[dict]) -> bool:
+        ladders[side].extend(values)
+        # Only once a further level has started is the last kept level
+        # known to be complete.
+        return len(ladders[side]) > max_levels[side]
+
+    return decode
+
+
+def get_price_ladders_pipelined(
+    viewer: EconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Like `get_price_ladders_with_pagination()`, but paginated as in
+    `get_open_orders_pipelined()`.
+
+    Returns the price ladders and a `PaginationStats`.
+    """
+    ladders = {"asks": PriceLadder(Side.ASK), "bids": PriceLadder(Side.BID)}
+    stats = _paginate_pipelined(
+        viewer,
+        get_price_levels_paginated,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+        _aggregate_price_levels(ladders, max_asks, max_bids),
+        False,
+    )
+    return _truncate_price_ladders(ladders, max_asks, max_bids, market_id), stats
+
+
+async def gen_get_price_ladders_pipelined(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Async variant of `get_price_ladders_pipelined()`.
+    """
+    ladders = {"asks": PriceLadder(Side.ASK), "bids": PriceLadder(Side.BID)}
+    stats = await _gen_paginate_pipelined(
+        viewer,
+        gen_get_price_levels_paginated,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+        _aggregate_price_levels(ladders, max_asks, max_bids),
+        False,
+    )
+    return _truncate_price_ladders(ladders, max_asks, max_bids, market_id), stats
+
+
+def get_price_levels_pipelined(
+    viewer: EconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Like `get_price_ladders_pipelined()`, but with each side as a list
+    of `{"price": ..., "size": ...}` dicts in priority order.
+    """
+    ladders, stats = get_price_ladders_pipelined(
+        viewer,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+    )
+    return _get_price_levels_lists(ladders), stats
+
+
+async def gen_get_price_levels_pipelined(
+    viewer: AsyncEconiaViewer,
+    market_id: int,
+    max_asks: int = 100,
+    max_bids: int = 100,
+    page_size: int = 100,
+    max_concurrency: int = 2,
+    ledger_version: int = -1,
+) -> Tuple[dict, PaginationStats]:
+    """
+    Async variant of `get_price_levels_pipelined()`.
+    """
+    ladders, stats = await gen_get_price_ladders_pipelined(
+        viewer,
+        market_id,
+        max_asks,
+        max_bids,
+        page_size,
+        max_concurrency,
+        ledger_version,
+    )
+    return _get_price_levels_lists(ladders), stats
 
 
 def has_open_order(view: EconiaViewer, market_id: int, market_order_id: int) -> bool:
@@ -499,16 +1521,44 @@ def has_open_order(view: EconiaViewer, market_id: int, market_order_id: int) ->
     return bool(returns[0])
 
 
-def did_order_post(view: EconiaViewer, order_id: int) -> bool:
+async def gen_has_open_order(
+    view: AsyncEconiaViewer, market_id: int, market_order_id: int
+) -> bool:
+    """
+    Async variant of `has_open_order()`.
+    """
+    returns = await view.get_returns(
+        "market", "has_open_order", [], [str(market_id), str(market_order_id)]
+    )
+    return bool(returns[0])
+
+
+def did_order_post(view: EconiaViewer, order_id: int, remote: bool = False) -> bool:
     """
     Return `True` if the order ID corresponds to an order that
     resulted in a post to the order book (including an order that
     filled across the spread as a taker before posting as a maker).
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.did_order_post(order_id)
     returns = view.get_returns("market", "did_order_post", [], [str(order_id)])
     return bool(returns[0])
 
 
+async def gen_did_order_post(
+    view: AsyncEconiaViewer, order_id: int, remote: bool = False
+) -> bool:
+    """
+    Async variant of `did_order_post()`.
+    """
+    if not remote:
+        return ids.did_order_post(order_id)
+    returns = await view.get_returns("market", "did_order_post", [], [str(order_id)])
+    return bool(returns[0])
+
+
 def get_market_event_handle_creation_info(
     view: EconiaViewer, market_id: int
 ) -> Optional[Any]:
@@ -526,6 +1576,22 @@ def get_market_event_handle_creation_info(
         return opt_val[0]
 
 
+async def gen_get_market_event_handle_creation_info(
+    view: AsyncEconiaViewer, market_id: int
+) -> Optional[Any]:
+    """
+    Async variant of `get_market_event_handle_creation_info()`.
+    """
+    returns = await view.get_returns(
+        "market", "get_market_event_handle_creation_info", [], [str(market_id)]
+    )
+    opt_val = returns[0]["vec"]
+    if len(opt_val) == 0:
+        return None
+    else:
+        return opt_val[0]
+
+
 def get_swapper_event_handle_creation_numbers(
     view: EconiaViewer, swapper: AccountAddress, market_id: int
 ) -> Optional[Any]:
@@ -544,3 +1610,22 @@ def get_swapper_event_handle_creation_numbers(
         return None
     else:
         return opt_val[0]
+
+
+async def gen_get_swapper_event_handle_creation_numbers(
+    view: AsyncEconiaViewer, swapper: AccountAddress, market_id: int
+) -> Optional[Any]:
+    """
+    Async variant of `get_swapper_event_handle_creation_numbers()`.
+    """
+    returns = await view.get_returns(
+        "market",
+        "get_swapper_event_handle_creation_numbers",
+        [],
+        [swapper.address.hex(), str(market_id)],
+    )
+    opt_val = returns[0]["vec"]
+    if len(opt_val) == 0:
+        return None
+    else:
+        return opt_val[0]
@@ -1,18 +1,24 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from aptos_sdk.account_address import AccountAddress
 
-from econia_sdk.lib import EconiaViewer
+from econia_sdk.events import DEFAULT_PAGE_SIZE, AsyncEventIterator, EventIterator
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
 
 
 def get_MAX_CHARACTERS_GENERIC(view: EconiaViewer) -> int:
     """
     Public constant getter for `MAX_CHARACTERS_GENERIC`.
     """
-    returns = view.get_returns(
-        "registry",
-        "get_MAX_CHARACTERS_GENERIC",
-    )
+    returns = view.get_constant("registry", "get_MAX_CHARACTERS_GENERIC")
+    return int(returns[0])
+
+
+async def gen_get_MAX_CHARACTERS_GENERIC(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_MAX_CHARACTERS_GENERIC()`.
+    """
+    returns = await view.get_constant("registry", "get_MAX_CHARACTERS_GENERIC")
     return int(returns[0])
 
 
@@ -20,10 +26,15 @@ def get_MIN_CHARACTERS_GENERIC(view: EconiaViewer) -> int:
     """
     Public constant getter for `MIN_CHARACTERS_GENERIC`.
     """
-    returns = view.get_returns(
-        "registry",
-        "get_MIN_CHARACTERS_GENERIC",
-    )
+    returns = view.get_constant("registry", "get_MIN_CHARACTERS_GENERIC")
+    return int(returns[0])
+
+
+async def gen_get_MIN_CHARACTERS_GENERIC(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_MIN_CHARACTERS_GENERIC()`.
+    """
+    returns = await view.get_constant("registry", "get_MIN_CHARACTERS_GENERIC")
     return int(returns[0])
 
 
@@ -31,10 +42,15 @@ def get_NO_CUSTODIAN(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_CUSTODIAN`.
     """
-    returns = view.get_returns(
-        "registry",
-        "get_NO_CUSTODIAN",
-    )
+    returns = view.get_constant("registry", "get_NO_CUSTODIAN")
+    return int(returns[0])
+
+
+async def gen_get_NO_CUSTODIAN(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_CUSTODIAN()`.
+    """
+    returns = await view.get_constant("registry", "get_NO_CUSTODIAN")
     return int(returns[0])
 
 
@@ -42,10 +58,15 @@ def get_NO_UNDERWRITER(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_UNDERWRITER`.
     """
-    returns = view.get_returns(
-        "registry",
-        "get_NO_UNDERWRITER",
-    )
+    returns = view.get_constant("registry", "get_NO_UNDERWRITER")
+    return int(returns[0])
+
+
+async def gen_get_NO_UNDERWRITER(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_UNDERWRITER()`.
+    """
+    returns = await view.get_constant("registry", "get_NO_UNDERWRITER")
     return int(returns[0])
 
 
@@ -66,13 +87,28 @@ def get_market_counts(view: EconiaViewer) -> dict:
     }
 
 
+async def gen_get_market_counts(view: AsyncEconiaViewer) -> dict:
+    """
+    Async variant of `get_market_counts()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "get_market_counts",
+    )
+    value = returns[0]
+    return {
+        "n_markets": int(value["n_markets"]),
+        "n_recognized_markets": int(value["n_recognized_markets"]),
+    }
+
+
 class GetMarketInfoReturn(dict):
-    def is_coin_market(self, viewer: EconiaViewer) -> bool:
+    def is_coin_market(self, viewer: Union[EconiaViewer, AsyncEconiaViewer]) -> bool:
         """
         Assess whether or not this market is a generic market.
         """
         base_info = self["base_type"]
-        is_econia = viewer.econia_address.hex() == base_info["package_address"]
+        is_econia = viewer.econia_address == base_info["package_address"]
         is_generic = (
             base_info["module_name"] == "registry"
             and base_info["type_name"] == "GenericAsset"
@@ -90,34 +126,94 @@ class GetMarketInfoReturn(dict):
         ), "Generic market has no decimals for base type!"
         return self._get_decimals(viewer, self["base_type"])
 
+    async def gen_get_decimals_base(self, viewer: AsyncEconiaViewer):
+        """
+        Async variant of `get_decimals_base()`.
+        """
+        assert self.is_coin_market(
+            viewer
+        ), "Generic market has no decimals for base type!"
+        return await self._gen_get_decimals(viewer, self["base_type"])
+
     def get_decimals_quote(self, viewer: EconiaViewer):
         """
         Get the number of decimals for the quote coin.
         """
         return self._get_decimals(viewer, self["quote_type"])
 
+    async def gen_get_decimals_quote(self, viewer: AsyncEconiaViewer):
+        """
+        Async variant of `get_decimals_quote()`.
+        """
+        return await self._gen_get_decimals(viewer, self["quote_type"])
+
     def _get_decimals(self, viewer: EconiaViewer, type_info: dict):
-        request = f"{viewer.aptos_client.base_url}/view"
-        address = type_info["package_address"].hex()
-        module = type_info["module_name"]
-        type_name = type_info["type_name"]
-        response = viewer.aptos_client.client.post(
-            request,
-            json={
-                "function": f"0x1::coin::decimals",
-                "type_arguments": [f"{address}::{module}::{type_name}"],
-                "arguments": [],
-            },
-        )
+        return get_coin_decimals(viewer, type_info)
 
-        if response.status_code >= 400:
-            raise Exception(response.text, response.status_code)
-        return int(response.json()[0])
+    async def _gen_get_decimals(self, viewer: AsyncEconiaViewer, type_info: dict):
+        return await gen_get_coin_decimals(viewer, type_info)
+
+
+def get_coin_decimals(view: EconiaViewer, type_info: dict) -> int:
+    """
+    Get the number of decimals for the coin described by `type_info`,
+    as found under `base_type` or `quote_type` in `get_market_info()`.
+    """
+    request = f"{view.aptos_client.base_url}/view"
+    response = view.aptos_client.client.post(
+        request,
+        json=_get_decimals_payload(type_info),
+    )
+
+    if response.status_code >= 400:
+        raise Exception(response.text, response.status_code)
+    return int(response.json()[0])
+
+
+async def gen_get_coin_decimals(view: AsyncEconiaViewer, type_info: dict) -> int:
+    """
+    Async variant of `get_coin_decimals()`.
+    """
+    request = f"{view.aptos_client.base_url}/view"
+    response = await view.aptos_client.client.post(
+        request,
+        json=_get_decimals_payload(type_info),
+    )
+
+    if response.status_code >= 400:
+        raise Exception(response.text, response.status_code)
+    return int(response.json()[0])
+
+
+def _get_decimals_payload(type_info: dict) -> dict:
+    address = type_info["package_address"].hex()
+    module = type_info["module_name"]
+    type_name = type_info["type_name"]
+    return {
+        "function": f"0x1::coin::decimals",
+        "type_arguments": [f"{address}::{module}::{type_name}"],
+        "arguments": [],
+    }
 
 
 def get_market_info(view: EconiaViewer, market_id: int) -> GetMarketInfoReturn:
     returns = view.get_returns("registry", "get_market_info", [], [str(market_id)])
-    value = returns[0]
+    return _convert_market_info_value(returns[0])
+
+
+async def gen_get_market_info(
+    view: AsyncEconiaViewer, market_id: int
+) -> GetMarketInfoReturn:
+    """
+    Async variant of `get_market_info()`.
+    """
+    returns = await view.get_returns(
+        "registry", "get_market_info", [], [str(market_id)]
+    )
+    return _convert_market_info_value(returns[0])
+
+
+def _convert_market_info_value(value) -> GetMarketInfoReturn:
     return GetMarketInfoReturn(
         {
             "base_name_generic": value["base_name_generic"],
@@ -161,6 +257,22 @@ def get_recognized_market_id_base_coin(
     return int(returns[0])
 
 
+async def gen_get_recognized_market_id_base_coin(
+    view: AsyncEconiaViewer,
+    base_coin_type: str,
+    quote_coin_type: str,
+) -> int:
+    """
+    Async variant of `get_recognized_market_id_base_coin()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "get_recognized_market_id_base_coin",
+        [base_coin_type, quote_coin_type],
+    )
+    return int(returns[0])
+
+
 def get_recognized_market_id_base_generic(
     view: EconiaViewer,
     quote_coin_type: str,
@@ -177,6 +289,21 @@ def get_recognized_market_id_base_generic(
     return int(returns[0])
 
 
+async def gen_get_recognized_market_id_base_generic(
+    view: AsyncEconiaViewer,
+    quote_coin_type: str,
+) -> int:
+    """
+    Async variant of `get_recognized_market_id_base_generic()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "get_recognized_market_id_base_generic",
+        [quote_coin_type],
+    )
+    return int(returns[0])
+
+
 def has_recognized_market_base_coin_by_type(
     view: EconiaViewer,
     base_coin_type: str,
@@ -198,6 +325,22 @@ def has_recognized_market_base_coin_by_type(
     return bool(returns[0])
 
 
+async def gen_has_recognized_market_base_coin_by_type(
+    view: AsyncEconiaViewer,
+    base_coin_type: str,
+    quote_coin_type: str,
+) -> bool:
+    """
+    Async variant of `has_recognized_market_base_coin_by_type()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "has_recognized_market_base_coin_by_type",
+        [base_coin_type, quote_coin_type],
+    )
+    return bool(returns[0])
+
+
 def has_recognized_market_base_generic_by_type(
     view: EconiaViewer,
     quote_coin_type: str,
@@ -220,6 +363,23 @@ def has_recognized_market_base_generic_by_type(
     return bool(returns[0])
 
 
+async def gen_has_recognized_market_base_generic_by_type(
+    view: AsyncEconiaViewer,
+    quote_coin_type: str,
+    base_name_generic: str,
+) -> bool:
+    """
+    Async variant of `has_recognized_market_base_generic_by_type()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "has_recognized_market_base_generic_by_type",
+        [quote_coin_type],
+        [base_name_generic],
+    )
+    return bool(returns[0])
+
+
 def get_market_id_base_coin(
     view: EconiaViewer,
     base_coin_type: str,
@@ -249,6 +409,34 @@ def get_market_id_base_coin(
         return int(opt_val[0])
 
 
+async def gen_get_market_id_base_coin(
+    view: AsyncEconiaViewer,
+    base_coin_type: str,
+    quote_coin_type: str,
+    lot_size: int,
+    tick_size: int,
+    min_size: int,
+) -> Optional[int]:
+    """
+    Async variant of `get_market_id_base_coin()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "get_market_id_base_coin",
+        [base_coin_type, quote_coin_type],
+        [
+            str(lot_size),
+            str(tick_size),
+            str(min_size),
+        ],
+    )
+    opt_val = returns[0]["vec"]
+    if len(opt_val) == 0:
+        return None
+    else:
+        return int(opt_val[0])
+
+
 def get_market_id_base_generic(
     view: EconiaViewer,
     quote_type: str,
@@ -281,6 +469,37 @@ def get_market_id_base_generic(
         return int(opt_val[0])
 
 
+async def gen_get_market_id_base_generic(
+    view: AsyncEconiaViewer,
+    quote_type: str,
+    base_name_generic: str,
+    lot_size: int,
+    tick_size: int,
+    min_size: int,
+    underwriter_id: int = 0,
+) -> Optional[int]:
+    """
+    Async variant of `get_market_id_base_generic()`.
+    """
+    returns = await view.get_returns(
+        "registry",
+        "get_market_id_base_generic",
+        [quote_type],
+        [
+            base_name_generic,
+            str(lot_size),
+            str(tick_size),
+            str(min_size),
+            str(underwriter_id),
+        ],
+    )
+    opt_val = returns[0]["vec"]
+    if len(opt_val) == 0:
+        return None
+    else:
+        return int(opt_val[0])
+
+
 def get_market_registration_events(
     view: EconiaViewer, limit: Optional[int] = None
 ) -> List[dict]:
@@ -294,46 +513,113 @@ def get_market_registration_events(
     )
     events_parsed = []
     for event in events:
-        event_parsed = {
-            "version": int(event["version"]),
-            "guid": {
-                "creation_number": int(event["guid"]["creation_number"]),
+        events_parsed.append(_convert_market_registration_event(event))
+    return events_parsed
+
+
+async def gen_get_market_registration_events(
+    view: AsyncEconiaViewer, limit: Optional[int] = None
+) -> List[dict]:
+    """
+    Async variant of `get_market_registration_events()`.
+    """
+    events = await view.get_events_by_handle(
+        f"{view.econia_address.hex()}::registry::Registry",
+        "market_registration_events",
+        limit,
+    )
+    events_parsed = []
+    for event in events:
+        events_parsed.append(_convert_market_registration_event(event))
+    return events_parsed
+
+
+def iter_market_registration_events(
+    view: EconiaViewer,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> EventIterator:
+    """
+    Iterate over all market registration events from sequence number
+    `start` onwards, as per `econia_sdk.events.EventIterator`.
+    """
+
+    def get_page(start: int, limit: int) -> List[dict]:
+        return view.get_events_by_handle(
+            f"{view.econia_address.hex()}::registry::Registry",
+            "market_registration_events",
+            limit,
+            start,
+        )
+
+    return EventIterator(
+        get_page, _convert_market_registration_event, start, page_size, prefetch
+    )
+
+
+def gen_iter_market_registration_events(
+    view: AsyncEconiaViewer,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> AsyncEventIterator:
+    """
+    Async variant of `iter_market_registration_events()`.
+    """
+
+    async def get_page(start: int, limit: int) -> List[dict]:
+        return await view.get_events_by_handle(
+            f"{view.econia_address.hex()}::registry::Registry",
+            "market_registration_events",
+            limit,
+            start,
+        )
+
+    return AsyncEventIterator(
+        get_page, _convert_market_registration_event, start, page_size, prefetch
+    )
+
+
+def _convert_market_registration_event(event: dict) -> dict:
+    return {
+        "version": int(event["version"]),
+        "guid": {
+            "creation_number": int(event["guid"]["creation_number"]),
+            "account_address": AccountAddress.from_hex(
+                event["guid"]["account_address"]
+            ),
+        },
+        "sequence_number": int(event["sequence_number"]),
+        "type": event["type"],
+        "data": {
+            "base_name_generic": event["data"]["base_name_generic"],
+            "base_type": {
                 "account_address": AccountAddress.from_hex(
-                    event["guid"]["account_address"]
+                    event["data"]["base_type"]["account_address"]
                 ),
+                "module_name": bytes.fromhex(
+                    event["data"]["base_type"]["module_name"][2:]
+                ).decode("ascii"),
+                "struct_name": bytes.fromhex(
+                    event["data"]["base_type"]["struct_name"][2:]
+                ).decode("ascii"),
             },
-            "sequence_number": int(event["sequence_number"]),
-            "type": event["type"],
-            "data": {
-                "base_name_generic": event["data"]["base_name_generic"],
-                "base_type": {
-                    "account_address": AccountAddress.from_hex(
-                        event["data"]["base_type"]["account_address"]
-                    ),
-                    "module_name": bytes.fromhex(
-                        event["data"]["base_type"]["module_name"][2:]
-                    ).decode("ascii"),
-                    "struct_name": bytes.fromhex(
-                        event["data"]["base_type"]["struct_name"][2:]
-                    ).decode("ascii"),
-                },
-                "lot_size": int(event["data"]["lot_size"]),
-                "market_id": int(event["data"]["market_id"]),
-                "min_size": int(event["data"]["min_size"]),
-                "quote_type": {
-                    "account_address": AccountAddress.from_hex(
-                        event["data"]["quote_type"]["account_address"]
-                    ),
-                    "module_name": bytes.fromhex(
-                        event["data"]["quote_type"]["module_name"][2:]
-                    ).decode("ascii"),
-                    "struct_name": bytes.fromhex(
-                        event["data"]["quote_type"]["struct_name"][2:]
-                    ).decode("ascii"),
-                },
-                "tick_size": int(event["data"]["tick_size"]),
-                "underwriter_id": int(event["data"]["underwriter_id"]),
+            "lot_size": int(event["data"]["lot_size"]),
+            "market_id": int(event["data"]["market_id"]),
+            "min_size": int(event["data"]["min_size"]),
+            "quote_type": {
+                "account_address": AccountAddress.from_hex(
+                    event["data"]["quote_type"]["account_address"]
+                ),
+                "module_name": bytes.fromhex(
+                    event["data"]["quote_type"]["module_name"][2:]
+                ).decode("ascii"),
+                "struct_name": bytes.fromhex(
+                    event["data"]["quote_type"]["struct_name"][2:]
+                ).decode("ascii"),
             },
-        }
-        events_parsed.append(event_parsed)
-    return events_parsed
+            "tick_size": int(event["data"]["tick_size"]),
+            "underwriter_id": int(event["data"]["underwriter_id"]),
+        },
+    }
@@ -1,6 +1,6 @@
 from aptos_sdk.account_address import AccountAddress
 
-from econia_sdk.lib import EconiaViewer
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer
 
 
 def get_address(view: EconiaViewer) -> AccountAddress:
@@ -9,3 +9,11 @@ def get_address(view: EconiaViewer) -> AccountAddress:
     """
     returns = view.get_returns("resource_account", "get_address")
     return AccountAddress.from_hex(returns[0])
+
+
+async def gen_get_address(view: AsyncEconiaViewer) -> AccountAddress:
+    """
+    Async variant of `get_address()`.
+    """
+    returns = await view.get_returns("resource_account", "get_address")
+    return AccountAddress.from_hex(returns[0])
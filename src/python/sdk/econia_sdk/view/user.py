@@ -1,16 +1,34 @@
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from aptos_sdk.account_address import AccountAddress
 
-from econia_sdk.lib import EconiaViewer
+from econia_sdk import columnar
+from econia_sdk.events import DEFAULT_PAGE_SIZE, AsyncEventIterator, EventIterator
+from econia_sdk.lib import AsyncEconiaViewer, EconiaViewer, ViewCall
+from econia_sdk.records import (
+    CancelOrderEvent,
+    ChangeOrderSizeEvent,
+    FillEvent,
+    PlaceLimitOrderEvent,
+    PlaceMarketOrderEvent,
+)
 from econia_sdk.types import CancelReason, Restriction, SelfMatchBehavior, Side
+from econia_sdk.utils import ids
 
 
 def get_ASK(view: EconiaViewer) -> bool:
     """
     Public constant getter for `ASK`.
     """
-    returns = view.get_returns("user", "get_ASK")
+    returns = view.get_constant("user", "get_ASK")
+    return bool(returns[0])
+
+
+async def gen_get_ASK(view: AsyncEconiaViewer) -> bool:
+    """
+    Async variant of `get_ASK()`.
+    """
+    returns = await view.get_constant("user", "get_ASK")
     return bool(returns[0])
 
 
@@ -18,7 +36,15 @@ def get_BID(view: EconiaViewer) -> bool:
     """
     Public constant getter for `BID`.
     """
-    returns = view.get_returns("user", "get_BID")
+    returns = view.get_constant("user", "get_BID")
+    return bool(returns[0])
+
+
+async def gen_get_BID(view: AsyncEconiaViewer) -> bool:
+    """
+    Async variant of `get_BID()`.
+    """
+    returns = await view.get_constant("user", "get_BID")
     return bool(returns[0])
 
 
@@ -26,7 +52,15 @@ def get_NO_CUSTODIAN(view: EconiaViewer) -> int:
     """
     Public constant getter for `NO_CUSTODIAN`.
     """
-    returns = view.get_returns("user", "get_NO_CUSTODIAN")
+    returns = view.get_constant("user", "get_NO_CUSTODIAN")
+    return int(returns[0])
+
+
+async def gen_get_NO_CUSTODIAN(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_NO_CUSTODIAN()`.
+    """
+    returns = await view.get_constant("user", "get_NO_CUSTODIAN")
     return int(returns[0])
 
 
@@ -34,7 +68,15 @@ def get_CANCEL_REASON_EVICTION(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_EVICTION`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_EVICTION")
+    returns = view.get_constant("user", "get_CANCEL_REASON_EVICTION")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_EVICTION(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_EVICTION()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_EVICTION")
     return int(returns[0])
 
 
@@ -42,7 +84,15 @@ def get_CANCEL_REASON_IMMEDIATE_OR_CANCEL(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_IMMEDIATE_OR_CANCEL`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_IMMEDIATE_OR_CANCEL")
+    returns = view.get_constant("user", "get_CANCEL_REASON_IMMEDIATE_OR_CANCEL")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_IMMEDIATE_OR_CANCEL(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_IMMEDIATE_OR_CANCEL()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_IMMEDIATE_OR_CANCEL")
     return int(returns[0])
 
 
@@ -50,7 +100,15 @@ def get_CANCEL_REASON_MANUAL_CANCEL(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_MANUAL_CANCEL`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_MANUAL_CANCEL")
+    returns = view.get_constant("user", "get_CANCEL_REASON_MANUAL_CANCEL")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_MANUAL_CANCEL(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_MANUAL_CANCEL()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_MANUAL_CANCEL")
     return int(returns[0])
 
 
@@ -58,7 +116,15 @@ def get_CANCEL_REASON_MAX_QUOTE_TRADED(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_MAX_QUOTE_TRADED`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_MAX_QUOTE_TRADED")
+    returns = view.get_constant("user", "get_CANCEL_REASON_MAX_QUOTE_TRADED")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_MAX_QUOTE_TRADED(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_MAX_QUOTE_TRADED()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_MAX_QUOTE_TRADED")
     return int(returns[0])
 
 
@@ -66,7 +132,15 @@ def get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_NOT_ENOUGH_LIQUIDITY`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY")
+    returns = view.get_constant("user", "get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_NOT_ENOUGH_LIQUIDITY")
     return int(returns[0])
 
 
@@ -74,7 +148,15 @@ def get_CANCEL_REASON_SELF_MATCH_TAKER(view: EconiaViewer) -> int:
     """
     Public constant getter for `CANCEL_REASON_SELF_MATCH_TAKER`.
     """
-    returns = view.get_returns("user", "get_CANCEL_REASON_SELF_MATCH_TAKER")
+    returns = view.get_constant("user", "get_CANCEL_REASON_SELF_MATCH_TAKER")
+    return int(returns[0])
+
+
+async def gen_get_CANCEL_REASON_SELF_MATCH_TAKER(view: AsyncEconiaViewer) -> int:
+    """
+    Async variant of `get_CANCEL_REASON_SELF_MATCH_TAKER()`.
+    """
+    returns = await view.get_constant("user", "get_CANCEL_REASON_SELF_MATCH_TAKER")
     return int(returns[0])
 
 
@@ -88,14 +170,137 @@ def get_market_event_handle_creation_numbers(
     Return the market event handle creation numbers for `market_id` and
     `custodian_id`, if `user` has event handles for indicated market
     account.
+
+    Results are memoized in `view.event_handles`, so only the first
+    lookup for a market account goes to the node.
     """
+    creation_numbers = view.event_handles.get(user, market_id, custodian_id)
+    if creation_numbers is not None:
+        return creation_numbers
     returns = view.get_returns(
         "user",
         "get_market_event_handle_creation_numbers",
         [],
         [serialize_address(user), str(market_id), str(custodian_id)],
     )
-    opt_val = returns[0]["vec"]
+    creation_numbers = _convert_market_event_handle_creation_numbers_value(returns[0])
+    if creation_numbers is not None:
+        view.event_handles.put(user, market_id, custodian_id, creation_numbers)
+    return creation_numbers
+
+
+async def gen_get_market_event_handle_creation_numbers(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+) -> Optional[dict]:
+    """
+    Async variant of `get_market_event_handle_creation_numbers()`.
+    """
+    creation_numbers = view.event_handles.get(user, market_id, custodian_id)
+    if creation_numbers is not None:
+        return creation_numbers
+    returns = await view.get_returns(
+        "user",
+        "get_market_event_handle_creation_numbers",
+        [],
+        [serialize_address(user), str(market_id), str(custodian_id)],
+    )
+    creation_numbers = _convert_market_event_handle_creation_numbers_value(returns[0])
+    if creation_numbers is not None:
+        view.event_handles.put(user, market_id, custodian_id, creation_numbers)
+    return creation_numbers
+
+
+def _get_missing_market_accounts(
+    view: Union[EconiaViewer, AsyncEconiaViewer],
+    market_accounts: List[Tuple[AccountAddress, int, int]],
+) -> List[Tuple[AccountAddress, int, int]]:
+    missing = {}
+    for user, market_id, custodian_id in market_accounts:
+        if view.event_handles.get(user, market_id, custodian_id) is None:
+            missing[(user.hex(), market_id, custodian_id)] = (
+                user,
+                market_id,
+                custodian_id,
+            )
+    return list(missing.values())
+
+
+def _get_market_event_handle_creation_numbers_calls(
+    market_accounts: List[Tuple[AccountAddress, int, int]]
+) -> List[ViewCall]:
+    return [
+        (
+            "user",
+            "get_market_event_handle_creation_numbers",
+            [],
+            [serialize_address(user), str(market_id), str(custodian_id)],
+        )
+        for user, market_id, custodian_id in market_accounts
+    ]
+
+
+def _cache_market_event_handle_creation_numbers(
+    view: Union[EconiaViewer, AsyncEconiaViewer],
+    market_accounts: List[Tuple[AccountAddress, int, int]],
+    returns: List[List],
+):
+    for (user, market_id, custodian_id), value in zip(market_accounts, returns):
+        creation_numbers = _convert_market_event_handle_creation_numbers_value(value[0])
+        if creation_numbers is not None:
+            view.event_handles.put(user, market_id, custodian_id, creation_numbers)
+
+
+def get_market_event_handle_creation_numbers_batch(
+    view: EconiaViewer,
+    market_accounts: List[Tuple[AccountAddress, int, int]],
+) -> List[Optional[dict]]:
+    """
+    Bulk variant of `get_market_event_handle_creation_numbers()`.
+
+    Parameters:
+    * `market_accounts`: `(user, market_id, custodian_id)` tuples.
+
+    Returns the creation numbers for each market account, in order, or
+    `None` where the market account has no event handles. Market
+    accounts not yet in `view.event_handles` are resolved with one
+    batched request.
+    """
+    missing = _get_missing_market_accounts(view, market_accounts)
+    if len(missing) > 0:
+        returns = view.get_returns_batch(
+            _get_market_event_handle_creation_numbers_calls(missing)
+        )
+        _cache_market_event_handle_creation_numbers(view, missing, returns)
+    return [
+        view.event_handles.get(user, market_id, custodian_id)
+        for user, market_id, custodian_id in market_accounts
+    ]
+
+
+async def gen_get_market_event_handle_creation_numbers_batch(
+    view: AsyncEconiaViewer,
+    market_accounts: List[Tuple[AccountAddress, int, int]],
+) -> List[Optional[dict]]:
+    """
+    Async variant of `get_market_event_handle_creation_numbers_batch()`.
+    """
+    missing = _get_missing_market_accounts(view, market_accounts)
+    if len(missing) > 0:
+        returns = await view.get_returns_batch(
+            _get_market_event_handle_creation_numbers_calls(missing)
+        )
+        _cache_market_event_handle_creation_numbers(view, missing, returns)
+    return [
+        view.event_handles.get(user, market_id, custodian_id)
+        for user, market_id, custodian_id in market_accounts
+    ]
+
+
+def _convert_market_event_handle_creation_numbers_value(value) -> Optional[dict]:
+    opt_val = value["vec"]
     if len(opt_val) == 0:
         return None
     else:
@@ -119,6 +324,76 @@ def get_market_event_handle_creation_numbers(
         }
 
 
+def _iter_market_account_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    handle_field: str,
+    convert: Callable[[dict], Any],
+    start: int,
+    page_size: int,
+    prefetch: bool,
+) -> EventIterator:
+    def get_page(start: int, limit: int) -> List[dict]:
+        creation_numbers = get_market_event_handle_creation_numbers(
+            view, user, market_id, custodian_id
+        )
+        if creation_numbers is None:
+            return []
+        return view.get_events_by_creation_number(
+            user, creation_numbers[handle_field], limit, start
+        )
+
+    return EventIterator(get_page, convert, start, page_size, prefetch)
+
+
+def _gen_iter_market_account_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    handle_field: str,
+    convert: Callable[[dict], Any],
+    start: int,
+    page_size: int,
+    prefetch: bool,
+) -> AsyncEventIterator:
+    async def get_page(start: int, limit: int) -> List[dict]:
+        creation_numbers = await gen_get_market_event_handle_creation_numbers(
+            view, user, market_id, custodian_id
+        )
+        if creation_numbers is None:
+            return []
+        return await view.get_events_by_creation_number(
+            user, creation_numbers[handle_field], limit, start
+        )
+
+    return AsyncEventIterator(get_page, convert, start, page_size, prefetch)
+
+
+def _convert_change_order_size_event(event: dict) -> dict:
+    return {
+        "version": int(event["version"]),
+        "guid": {
+            "creation_number": int(event["guid"]["creation_number"]),
+            "account_address": AccountAddress.from_hex(
+                event["guid"]["account_address"]
+            ),
+        },
+        "sequence_number": int(event["sequence_number"]),
+        "type": event["type"],
+        "data": {
+            "custodian_id": int(event["data"]["custodian_id"]),
+            "market_id": int(event["data"]["market_id"]),
+            "new_size": int(event["data"]["new_size"]),
+            "order_id": int(event["data"]["order_id"]),
+            "side": Side.ASK if event["data"]["side"] else Side.BID,
+            "user": AccountAddress.from_hex(event["data"]["user"]),
+        },
+    }
+
+
 def get_change_order_size_events(
     view: EconiaViewer,
     user: AccountAddress,
@@ -126,7 +401,8 @@ def get_change_order_size_events(
     custodian_id: int,
     limit: Optional[int] = None,
     start: Optional[int] = None,
-) -> List[dict]:
+    records: bool = False,
+) -> list:
     """
     Get all (or some) of the order size change events by a given user, market_id,
     and custodian_id.
@@ -137,6 +413,7 @@ def get_change_order_size_events(
     * `custodian_id`: the custodian id associated with the event, usually 0.
     * `limit`: the maximum number of events to be returned.
     * `start`: the lowest sequence number of event to be returned
+    * `records`: return `econia_sdk.records.ChangeOrderSizeEvent` instances rather than dicts.
     """
     creation_numbers = get_market_event_handle_creation_numbers(
         view, user, market_id, custodian_id
@@ -148,34 +425,102 @@ def get_change_order_size_events(
             limit,
             start,
         )
-        returns = []
+        if records:
+            return [ChangeOrderSizeEvent(event) for event in events]
+        returns: List[dict] = []
         for event in events:
-            returns.append(
-                {
-                    "version": int(event["version"]),
-                    "guid": {
-                        "creation_number": int(event["guid"]["creation_number"]),
-                        "account_address": AccountAddress.from_hex(
-                            event["guid"]["account_address"]
-                        ),
-                    },
-                    "sequence_number": int(event["sequence_number"]),
-                    "type": event["type"],
-                    "data": {
-                        "custodian_id": int(event["data"]["custodian_id"]),
-                        "market_id": int(event["data"]["market_id"]),
-                        "new_size": int(event["data"]["new_size"]),
-                        "order_id": int(event["data"]["order_id"]),
-                        "side": Side.ASK if event["data"]["side"] else Side.BID,
-                        "user": AccountAddress.from_hex(event["data"]["user"]),
-                    },
-                }
-            )
+            returns.append(_convert_change_order_size_event(event))
         return returns
     else:
         return []
 
 
+async def gen_get_change_order_size_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Async variant of `get_change_order_size_events()`.
+    """
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = await view.get_events_by_creation_number(
+            user,
+            creation_numbers["change_order_size_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [ChangeOrderSizeEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_change_order_size_event(event))
+        return returns
+    else:
+        return []
+
+
+def iter_change_order_size_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> EventIterator:
+    """
+    Iterate over the `ChangeOrderSizeEvent`s of the market account of `user` for
+    `market_id` and `custodian_id`, from sequence number `start` onwards, as per
+    `econia_sdk.events.EventIterator`.
+    """
+    return _iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "change_order_size_events_handle_creation_num",
+        ChangeOrderSizeEvent if records else _convert_change_order_size_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def gen_iter_change_order_size_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> AsyncEventIterator:
+    """
+    Async variant of `iter_change_order_size_events()`.
+    """
+    return _gen_iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "change_order_size_events_handle_creation_num",
+        ChangeOrderSizeEvent if records else _convert_change_order_size_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
 def _convert_cancel_order_event(event: dict) -> dict:
     return {
         "version": int(event["version"]),
@@ -204,7 +549,8 @@ def get_cancel_order_events(
     custodian_id: int,
     limit: Optional[int] = None,
     start: Optional[int] = None,
-) -> List[dict]:
+    records: bool = False,
+) -> list:
     """
     Get all (or some) of the order cancel events by a given user, market_id,
     and custodian_id.
@@ -215,6 +561,368 @@ def get_cancel_order_events(
     * `custodian_id`: the custodian id associated with the event, usually 0.
     * `limit`: the maximum number of events to be returned.
     * `start`: the lowest sequence number of event to be returned
+    * `records`: return `econia_sdk.records.CancelOrderEvent` instances rather than dicts.
+    """
+    creation_numbers = get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = view.get_events_by_creation_number(
+            user,
+            creation_numbers["cancel_order_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [CancelOrderEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_cancel_order_event(event))
+        return returns
+    else:
+        return []
+
+
+async def gen_get_cancel_order_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Async variant of `get_cancel_order_events()`.
+    """
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = await view.get_events_by_creation_number(
+            user,
+            creation_numbers["cancel_order_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [CancelOrderEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_cancel_order_event(event))
+        return returns
+    else:
+        return []
+
+
+def iter_cancel_order_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> EventIterator:
+    """
+    Iterate over the `CancelOrderEvent`s of the market account of `user` for
+    `market_id` and `custodian_id`, from sequence number `start` onwards, as per
+    `econia_sdk.events.EventIterator`.
+    """
+    return _iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "cancel_order_events_handle_creation_num",
+        CancelOrderEvent if records else _convert_cancel_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def gen_iter_cancel_order_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> AsyncEventIterator:
+    """
+    Async variant of `iter_cancel_order_events()`.
+    """
+    return _gen_iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "cancel_order_events_handle_creation_num",
+        CancelOrderEvent if records else _convert_cancel_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def _convert_fill_order_event(event: dict) -> dict:
+    return {
+        "version": int(event["version"]),
+        "guid": {
+            "creation_number": int(event["guid"]["creation_number"]),
+            "account_address": AccountAddress.from_hex(
+                event["guid"]["account_address"]
+            ),
+        },
+        "sequence_number": int(event["sequence_number"]),
+        "type": event["type"],
+        "data": {
+            "maker": AccountAddress.from_hex(event["data"]["maker"]),
+            "maker_custodian_id": int(event["data"]["maker_custodian_id"]),
+            "maker_order_id": int(event["data"]["maker_order_id"]),
+            "maker_side": Side.ASK if event["data"]["maker_side"] else Side.BID,
+            "market_id": int(event["data"]["market_id"]),
+            "price": int(event["data"]["price"]),
+            "sequence_number_for_trade": int(
+                event["data"]["sequence_number_for_trade"]
+            ),
+            "size": int(event["data"]["size"]),
+            "taker": AccountAddress.from_hex(event["data"]["taker"]),
+            "taker_custodian_id": int(event["data"]["taker_custodian_id"]),
+            "taker_order_id": int(event["data"]["taker_order_id"]),
+            "taker_quote_fees_paid": int(event["data"]["taker_quote_fees_paid"]),
+        },
+    }
+
+
+def get_fill_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Get all (or some) of the order fill events by/for a given user, market_id,
+    and custodian_id.
+
+    Parameters:
+    * `user`: the account address to which the events will have been emitted;
+    * `market_id`: the market id to which the events pertain.
+    * `custodian_id`: the custodian id associated with the event, usually 0.
+    * `limit`: the maximum number of events to be returned.
+    * `start`: the lowest sequence number of event to be returned
+    * `records`: return `econia_sdk.records.FillEvent` instances rather than dicts.
+    """
+    creation_numbers = get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = view.get_events_by_creation_number(
+            user,
+            creation_numbers["fill_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [FillEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_fill_order_event(event))
+        return returns
+    else:
+        return []
+
+
+async def gen_get_fill_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Async variant of `get_fill_events()`.
+    """
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = await view.get_events_by_creation_number(
+            user,
+            creation_numbers["fill_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [FillEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_fill_order_event(event))
+        return returns
+    else:
+        return []
+
+
+def iter_fill_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> EventIterator:
+    """
+    Iterate over the `FillEvent`s of the market account of `user` for `market_id`
+    and `custodian_id`, as maker or taker, from sequence number `start` onwards, as
+    per `econia_sdk.events.EventIterator`.
+    """
+    return _iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "fill_events_handle_creation_num",
+        FillEvent if records else _convert_fill_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def gen_iter_fill_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> AsyncEventIterator:
+    """
+    Async variant of `iter_fill_events()`.
+    """
+    return _gen_iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "fill_events_handle_creation_num",
+        FillEvent if records else _convert_fill_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def get_fill_events_columnar(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+):
+    """
+    Like `get_fill_events()`, but decoded directly into a NumPy
+    structured array per `econia_sdk.columnar.FILL_EVENT_FIELDS`.
+    """
+    creation_numbers = get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    events = []
+    if creation_numbers is not None:
+        events = view.get_events_by_creation_number(
+            user,
+            creation_numbers["fill_events_handle_creation_num"],
+            limit,
+            start,
+        )
+    return columnar.fill_events_to_numpy(events)
+
+
+async def gen_get_fill_events_columnar(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+):
+    """
+    Async variant of `get_fill_events_columnar()`.
+    """
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    events = []
+    if creation_numbers is not None:
+        events = await view.get_events_by_creation_number(
+            user,
+            creation_numbers["fill_events_handle_creation_num"],
+            limit,
+            start,
+        )
+    return columnar.fill_events_to_numpy(events)
+
+
+def _convert_place_market_order_event(event: dict) -> dict:
+    return {
+        "version": int(event["version"]),
+        "guid": {
+            "creation_number": int(event["guid"]["creation_number"]),
+            "account_address": AccountAddress.from_hex(
+                event["guid"]["account_address"]
+            ),
+        },
+        "sequence_number": int(event["sequence_number"]),
+        "type": event["type"],
+        "data": {
+            "custodian_id": int(event["data"]["custodian_id"]),
+            "direction": Side.ASK if bool(event["data"]["direction"]) else Side.BID,
+            "integrator": AccountAddress.from_hex(event["data"]["integrator"]),
+            "market_id": int(event["data"]["market_id"]),
+            "order_id": int(event["data"]["order_id"]),
+            "self_match_behavior": SelfMatchBehavior(
+                int(event["data"]["self_match_behavior"])
+            ),
+            "size": int(event["data"]["size"]),
+            "user": AccountAddress.from_hex(event["data"]["user"]),
+        },
+    }
+
+
+def get_place_market_order_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Get all (or some) of the market order placement events by a given user,
+    market_id, and custodian_id.
+
+    Parameters:
+    * `user`: the account address to which the events will have been emitted;
+    * `market_id`: the market id to which the events pertain.
+    * `custodian_id`: the custodian id associated with the event, usually 0.
+    * `limit`: the maximum number of events to be returned.
+    * `start`: the lowest sequence number of event to be returned
+    * `records`: return `econia_sdk.records.PlaceMarketOrderEvent` instances rather than dicts.
     """
     creation_numbers = get_market_event_handle_creation_numbers(
         view, user, market_id, custodian_id
@@ -222,19 +930,107 @@ def get_cancel_order_events(
     if creation_numbers is not None:
         events = view.get_events_by_creation_number(
             user,
-            creation_numbers["cancel_order_events_handle_creation_num"],
+            creation_numbers["place_market_order_events_handle_creation_num"],
             limit,
             start,
         )
-        returns = []
+        if records:
+            return [PlaceMarketOrderEvent(event) for event in events]
+        returns: List[dict] = []
         for event in events:
-            returns.append(_convert_cancel_order_event(event))
+            returns.append(_convert_place_market_order_event(event))
         return returns
     else:
         return []
 
 
-def _convert_fill_order_event(event: dict) -> dict:
+async def gen_get_place_market_order_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    limit: Optional[int] = None,
+    start: Optional[int] = None,
+    records: bool = False,
+) -> list:
+    """
+    Async variant of `get_place_market_order_events()`.
+    """
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
+        view, user, market_id, custodian_id
+    )
+    if creation_numbers is not None:
+        events = await view.get_events_by_creation_number(
+            user,
+            creation_numbers["place_market_order_events_handle_creation_num"],
+            limit,
+            start,
+        )
+        if records:
+            return [PlaceMarketOrderEvent(event) for event in events]
+        returns: List[dict] = []
+        for event in events:
+            returns.append(_convert_place_market_order_event(event))
+        return returns
+    else:
+        return []
+
+
+def iter_place_market_order_events(
+    view: EconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> EventIterator:
+    """
+    Iterate over the `PlaceMarketOrderEvent`s of the market account of `user` for
+    `market_id` and `custodian_id`, from sequence number `start` onwards, as per
+    `econia_sdk.events.EventIterator`.
+    """
+    return _iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "place_market_order_events_handle_creation_num",
+        PlaceMarketOrderEvent if records else _convert_place_market_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def gen_iter_place_market_order_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> AsyncEventIterator:
+    """
+    Async variant of `iter_place_market_order_events()`.
+    """
+    return _gen_iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "place_market_order_events_handle_creation_num",
+        PlaceMarketOrderEvent if records else _convert_place_market_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
+
+
+def _convert_place_limit_order_event(event: dict) -> dict:
     return {
         "version": int(event["version"]),
         "guid": {
@@ -246,35 +1042,35 @@ def _convert_fill_order_event(event: dict) -> dict:
         "sequence_number": int(event["sequence_number"]),
         "type": event["type"],
         "data": {
-            "maker": AccountAddress.from_hex(event["data"]["maker"]),
-            "maker_custodian_id": int(event["data"]["maker_custodian_id"]),
-            "maker_order_id": int(event["data"]["maker_order_id"]),
-            "maker_side": Side.ASK if event["data"]["maker_side"] else Side.BID,
+            "custodian_id": int(event["data"]["custodian_id"]),
+            "integrator": AccountAddress.from_hex(event["data"]["integrator"]),
             "market_id": int(event["data"]["market_id"]),
+            "order_id": int(event["data"]["order_id"]),
             "price": int(event["data"]["price"]),
-            "sequence_number_for_trade": int(
-                event["data"]["sequence_number_for_trade"]
+            "remaining_size": int(event["data"]["remaining_size"]),
+            "restriction": Restriction(int(event["data"]["restriction"])),
+            "self_match_behavior": SelfMatchBehavior(
+                int(event["data"]["self_match_behavior"])
             ),
+            "side": Side.ASK if bool(event["data"]["side"]) else Side.BID,
             "size": int(event["data"]["size"]),
-            "taker": AccountAddress.from_hex(event["data"]["taker"]),
-            "taker_custodian_id": int(event["data"]["taker_custodian_id"]),
-            "taker_order_id": int(event["data"]["taker_order_id"]),
-            "taker_quote_fees_paid": int(event["data"]["taker_quote_fees_paid"]),
+            "user": AccountAddress.from_hex(event["data"]["user"]),
         },
     }
 
 
-def get_fill_events(
+def get_place_limit_order_events(
     view: EconiaViewer,
     user: AccountAddress,
     market_id: int,
     custodian_id: int,
     limit: Optional[int] = None,
     start: Optional[int] = None,
-) -> List[dict]:
+    records: bool = False,
+) -> list:
     """
-    Get all (or some) of the order fill events by/for a given user, market_id,
-    and custodian_id.
+    Get all (or some) of the limit order placement events by a given user,
+    market_id, and custodian_id.
 
     Parameters:
     * `user`: the account address to which the events will have been emitted;
@@ -282,6 +1078,7 @@ def get_fill_events(
     * `custodian_id`: the custodian id associated with the event, usually 0.
     * `limit`: the maximum number of events to be returned.
     * `start`: the lowest sequence number of event to be returned
+    * `records`: return `econia_sdk.records.PlaceLimitOrderEvent` instances rather than dicts.
     """
     creation_numbers = get_market_event_handle_creation_numbers(
         view, user, market_id, custodian_id
@@ -289,147 +1086,104 @@ def get_fill_events(
     if creation_numbers is not None:
         events = view.get_events_by_creation_number(
             user,
-            creation_numbers["fill_events_handle_creation_num"],
+            creation_numbers["place_limit_order_events_handle_creation_num"],
             limit,
             start,
         )
-        returns = []
+        if records:
+            return [PlaceLimitOrderEvent(event) for event in events]
+        returns: List[dict] = []
         for event in events:
-            returns.append(_convert_fill_order_event(event))
+            returns.append(_convert_place_limit_order_event(event))
         return returns
     else:
         return []
 
 
-def get_place_market_order_events(
-    view: EconiaViewer,
+async def gen_get_place_limit_order_events(
+    view: AsyncEconiaViewer,
     user: AccountAddress,
     market_id: int,
     custodian_id: int,
     limit: Optional[int] = None,
     start: Optional[int] = None,
-) -> List[dict]:
+    records: bool = False,
+) -> list:
     """
-    Get all (or some) of the market order placement events by a given user,
-    market_id, and custodian_id.
-
-    Parameters:
-    * `user`: the account address to which the events will have been emitted;
-    * `market_id`: the market id to which the events pertain.
-    * `custodian_id`: the custodian id associated with the event, usually 0.
-    * `limit`: the maximum number of events to be returned.
-    * `start`: the lowest sequence number of event to be returned
+    Async variant of `get_place_limit_order_events()`.
     """
-    creation_numbers = get_market_event_handle_creation_numbers(
+    creation_numbers = await gen_get_market_event_handle_creation_numbers(
         view, user, market_id, custodian_id
     )
     if creation_numbers is not None:
-        events = view.get_events_by_creation_number(
+        events = await view.get_events_by_creation_number(
             user,
-            creation_numbers["place_market_order_events_handle_creation_num"],
+            creation_numbers["place_limit_order_events_handle_creation_num"],
             limit,
             start,
         )
-        returns = []
+        if records:
+            return [PlaceLimitOrderEvent(event) for event in events]
+        returns: List[dict] = []
         for event in events:
-            returns.append(
-                {
-                    "version": int(event["version"]),
-                    "guid": {
-                        "creation_number": int(event["guid"]["creation_number"]),
-                        "account_address": AccountAddress.from_hex(
-                            event["guid"]["account_address"]
-                        ),
-                    },
-                    "sequence_number": int(event["sequence_number"]),
-                    "type": event["type"],
-                    "data": {
-                        "custodian_id": int(event["data"]["custodian_id"]),
-                        "direction": Side.ASK
-                        if bool(event["data"]["direction"])
-                        else Side.BID,
-                        "integrator": AccountAddress.from_hex(
-                            event["data"]["integrator"]
-                        ),
-                        "market_id": int(event["data"]["market_id"]),
-                        "order_id": int(event["data"]["order_id"]),
-                        "self_match_behavior": SelfMatchBehavior(
-                            int(event["data"]["self_match_behavior"])
-                        ),
-                        "size": int(event["data"]["size"]),
-                        "user": AccountAddress.from_hex(event["data"]["user"]),
-                    },
-                }
-            )
+            returns.append(_convert_place_limit_order_event(event))
         return returns
     else:
         return []
 
 
-def get_place_limit_order_events(
+def iter_place_limit_order_events(
     view: EconiaViewer,
     user: AccountAddress,
     market_id: int,
     custodian_id: int,
-    limit: Optional[int] = None,
-    start: Optional[int] = None,
-) -> List[dict]:
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> EventIterator:
     """
-    Get all (or some) of the limit order placement events by a given user,
-    market_id, and custodian_id.
+    Iterate over the `PlaceLimitOrderEvent`s of the market account of `user` for
+    `market_id` and `custodian_id`, from sequence number `start` onwards, as per
+    `econia_sdk.events.EventIterator`.
+    """
+    return _iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "place_limit_order_events_handle_creation_num",
+        PlaceLimitOrderEvent if records else _convert_place_limit_order_event,
+        start,
+        page_size,
+        prefetch,
+    )
 
-    Parameters:
-    * `user`: the account address to which the events will have been emitted;
-    * `market_id`: the market id to which the events pertain.
-    * `custodian_id`: the custodian id associated with the event, usually 0.
-    * `limit`: the maximum number of events to be returned.
-    * `start`: the lowest sequence number of event to be returned
+
+def gen_iter_place_limit_order_events(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+    start: int = 0,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    records: bool = False,
+) -> AsyncEventIterator:
     """
-    creation_numbers = get_market_event_handle_creation_numbers(
-        view, user, market_id, custodian_id
+    Async variant of `iter_place_limit_order_events()`.
+    """
+    return _gen_iter_market_account_events(
+        view,
+        user,
+        market_id,
+        custodian_id,
+        "place_limit_order_events_handle_creation_num",
+        PlaceLimitOrderEvent if records else _convert_place_limit_order_event,
+        start,
+        page_size,
+        prefetch,
     )
-    if creation_numbers is not None:
-        events = view.get_events_by_creation_number(
-            user,
-            creation_numbers["place_limit_order_events_handle_creation_num"],
-            limit,
-            start,
-        )
-        returns = []
-        for event in events:
-            returns.append(
-                {
-                    "version": int(event["version"]),
-                    "guid": {
-                        "creation_number": int(event["guid"]["creation_number"]),
-                        "account_address": AccountAddress.from_hex(
-                            event["guid"]["account_address"]
-                        ),
-                    },
-                    "sequence_number": int(event["sequence_number"]),
-                    "type": event["type"],
-                    "data": {
-                        "custodian_id": int(event["data"]["custodian_id"]),
-                        "integrator": AccountAddress.from_hex(
-                            event["data"]["integrator"]
-                        ),
-                        "market_id": int(event["data"]["market_id"]),
-                        "order_id": int(event["data"]["order_id"]),
-                        "price": int(event["data"]["price"]),
-                        "remaining_size": int(event["data"]["remaining_size"]),
-                        "restriction": Restriction(int(event["data"]["restriction"])),
-                        "self_match_behavior": SelfMatchBehavior(
-                            int(event["data"]["self_match_behavior"])
-                        ),
-                        "side": Side.ASK if bool(event["data"]["side"]) else Side.BID,
-                        "size": int(event["data"]["size"]),
-                        "user": AccountAddress.from_hex(event["data"]["user"]),
-                    },
-                }
-            )
-        return returns
-    else:
-        return []
 
 
 def serialize_address(addr: AccountAddress) -> str:
@@ -464,6 +1218,26 @@ def get_all_market_account_ids_for_market_id(
     return ids
 
 
+async def gen_get_all_market_account_ids_for_market_id(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+) -> list[int]:
+    """
+    Async variant of `get_all_market_account_ids_for_market_id()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "get_all_market_account_ids_for_market_id",
+        [],
+        [serialize_address(user), str(market_id)],
+    )
+    ids = []
+    for id in returns[0]:
+        ids.append(int(id))
+    return ids
+
+
 def get_all_market_account_ids_for_user(
     view: EconiaViewer,
     user: AccountAddress,
@@ -490,14 +1264,53 @@ def get_all_market_account_ids_for_user(
     return ids
 
 
-def get_custodian_id(view: EconiaViewer, market_account_id: int) -> int:
+async def gen_get_all_market_account_ids_for_user(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+) -> list[int]:
+    """
+    Async variant of `get_all_market_account_ids_for_user()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "get_all_market_account_ids_for_user",
+        [],
+        [serialize_address(user)],
+    )
+    ids = []
+    for id in returns[0]:
+        ids.append(int(id))
+    return ids
+
+
+def get_custodian_id(
+    view: EconiaViewer, market_account_id: int, remote: bool = False
+) -> int:
     """
     Return custodian ID encoded in market account ID.
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_custodian_id(market_account_id)
     returns = view.get_returns("user", "get_custodian_id", [], [str(market_account_id)])
     return int(returns[0])
 
 
+async def gen_get_custodian_id(
+    view: AsyncEconiaViewer, market_account_id: int, remote: bool = False
+) -> int:
+    """
+    Async variant of `get_custodian_id()`.
+    """
+    if not remote:
+        return ids.get_custodian_id(market_account_id)
+    returns = await view.get_returns(
+        "user", "get_custodian_id", [], [str(market_account_id)]
+    )
+    return int(returns[0])
+
+
 def get_market_account(
     view: EconiaViewer,
     user: AccountAddress,
@@ -517,6 +1330,24 @@ def get_market_account(
     return _convert_market_account_value(returns[0])
 
 
+async def gen_get_market_account(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+    custodian_id: int,
+) -> dict:
+    """
+    Async variant of `get_market_account()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "get_market_account",
+        [],
+        [serialize_address(user), str(market_id), str(custodian_id)],
+    )
+    return _convert_market_account_value(returns[0])
+
+
 def _convert_market_account_value(value) -> dict:
     asks = []
     for ask in value["asks"]:
@@ -552,10 +1383,15 @@ def get_market_account_id(
     view: EconiaViewer,
     market_id: int,
     custodian_id: int,
+    remote: bool = False,
 ) -> int:
     """
     Return market account ID with encoded market and custodian IDs.
+
+    Encoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_market_account_id(market_id, custodian_id)
     returns = view.get_returns(
         "user",
         "get_market_account_id",
@@ -568,6 +1404,29 @@ def get_market_account_id(
     return int(returns[0])
 
 
+async def gen_get_market_account_id(
+    view: AsyncEconiaViewer,
+    market_id: int,
+    custodian_id: int,
+    remote: bool = False,
+) -> int:
+    """
+    Async variant of `get_market_account_id()`.
+    """
+    if not remote:
+        return ids.get_market_account_id(market_id, custodian_id)
+    returns = await view.get_returns(
+        "user",
+        "get_market_account_id",
+        [],
+        [
+            str(market_id),
+            str(custodian_id),
+        ],
+    )
+    return int(returns[0])
+
+
 def get_market_accounts(view: EconiaViewer, user: AccountAddress) -> list[dict]:
     """
     Get user-friendly views of all of a `user`'s market accounts.
@@ -585,13 +1444,35 @@ def get_market_accounts(view: EconiaViewer, user: AccountAddress) -> list[dict]:
     return accounts
 
 
+async def gen_get_market_accounts(
+    view: AsyncEconiaViewer, user: AccountAddress
+) -> list[dict]:
+    """
+    Async variant of `get_market_accounts()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "get_market_accounts",
+        [],
+        [serialize_address(user)],
+    )
+    value = returns[0]
+    accounts = []
+    for account in value:
+        accounts.append(_convert_market_account_value(account))
+    return accounts
+
+
 def get_market_id(
-    view: EconiaViewer,
-    market_account_id: int,
+    view: EconiaViewer, market_account_id: int, remote: bool = False
 ) -> int:
     """
     Return market ID encoded in market account ID.
+
+    Decoded locally by `econia_sdk.utils.ids` unless `remote` is `True`.
     """
+    if not remote:
+        return ids.get_market_id(market_account_id)
     returns = view.get_returns(
         "user",
         "get_market_id",
@@ -601,6 +1482,23 @@ def get_market_id(
     return int(returns[0])
 
 
+async def gen_get_market_id(
+    view: AsyncEconiaViewer, market_account_id: int, remote: bool = False
+) -> int:
+    """
+    Async variant of `get_market_id()`.
+    """
+    if not remote:
+        return ids.get_market_id(market_account_id)
+    returns = await view.get_returns(
+        "user",
+        "get_market_id",
+        [],
+        [str(market_account_id)],
+    )
+    return int(returns[0])
+
+
 def has_market_account(
     view: EconiaViewer, user: AccountAddress, market_id: int, custodian_id: int
 ) -> bool:
@@ -617,6 +1515,21 @@ def has_market_account(
     return bool(returns[0])
 
 
+async def gen_has_market_account(
+    view: AsyncEconiaViewer, user: AccountAddress, market_id: int, custodian_id: int
+) -> bool:
+    """
+    Async variant of `has_market_account()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "has_market_account",
+        [],
+        [serialize_address(user), str(market_id), str(custodian_id)],
+    )
+    return bool(returns[0])
+
+
 def has_market_account_by_market_account_id(
     view: EconiaViewer,
     user: AccountAddress,
@@ -638,6 +1551,26 @@ def has_market_account_by_market_account_id(
     return bool(returns[0])
 
 
+async def gen_has_market_account_by_market_account_id(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_account_id: int,
+) -> bool:
+    """
+    Async variant of `has_market_account_by_market_account_id()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "has_market_account",
+        [],
+        [
+            serialize_address(user),
+            str(market_account_id),
+        ],
+    )
+    return bool(returns[0])
+
+
 def has_market_account_by_market_id(
     view: EconiaViewer,
     user: AccountAddress,
@@ -657,3 +1590,23 @@ def has_market_account_by_market_id(
         ],
     )
     return bool(returns[0])
+
+
+async def gen_has_market_account_by_market_id(
+    view: AsyncEconiaViewer,
+    user: AccountAddress,
+    market_id: int,
+) -> bool:
+    """
+    Async variant of `has_market_account_by_market_id()`.
+    """
+    returns = await view.get_returns(
+        "user",
+        "has_market_account_by_market_id",
+        [],
+        [
+            serialize_address(user),
+            str(market_id),
+        ],
+    )
+    return bool(returns[0])
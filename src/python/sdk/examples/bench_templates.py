@@ -0,0 +1,93 @@
+import timeit
+
+from aptos_sdk.account import Account
+from aptos_sdk.account_address import AccountAddress
+from aptos_sdk.bcs import Serializer
+from aptos_sdk.transactions import TransactionPayload
+from aptos_sdk.type_tag import StructTag, TypeTag
+
+from econia_sdk.entry.market import (
+    cancel_order_user,
+    change_order_size_user,
+    place_limit_order_user_entry,
+)
+from econia_sdk.entry.templates import OrderTemplates
+from econia_sdk.types import Restriction, SelfMatchBehavior, Side
+
+# Microbenchmark of building (and BCS serializing, as done when signing)
+# order entry functions with `econia_sdk.entry.market` versus
+# `econia_sdk.entry.templates.OrderTemplates`.
+
+ECONIA_ADDR = AccountAddress.from_hex("0xc0deb00c")
+BASE = TypeTag(StructTag.from_str(f"{ECONIA_ADDR}::test_eth::TestETHCoin"))
+QUOTE = TypeTag(StructTag.from_str(f"{ECONIA_ADDR}::test_usdc::TestUSDCCoin"))
+MARKET_ID = 1
+INTEGRATOR = Account.generate().address()
+ORDER_ID = (1234 << 64) | 5678
+N = 20000
+
+
+def serialize(entry) -> bytes:
+    serializer = Serializer()
+    TransactionPayload(entry).serialize(serializer)
+    return serializer.output()
+
+
+def start():
+    templates = OrderTemplates(
+        ECONIA_ADDR,
+        MARKET_ID,
+        BASE,
+        QUOTE,
+        INTEGRATOR,
+        Restriction.NoRestriction,
+        SelfMatchBehavior.CancelMaker,
+    )
+    cases = [
+        (
+            "place_limit_order_user_entry",
+            lambda: place_limit_order_user_entry(
+                ECONIA_ADDR,
+                BASE,
+                QUOTE,
+                MARKET_ID,
+                INTEGRATOR,
+                Side.ASK,
+                100,
+                2000,
+                Restriction.NoRestriction,
+                SelfMatchBehavior.CancelMaker,
+            ),
+            lambda: templates.place_limit_order(Side.ASK, 100, 2000),
+        ),
+        (
+            "cancel_order_user",
+            lambda: cancel_order_user(ECONIA_ADDR, MARKET_ID, Side.BID, ORDER_ID),
+            lambda: templates.cancel_order(Side.BID, ORDER_ID),
+        ),
+        (
+            "change_order_size_user",
+            lambda: change_order_size_user(
+                ECONIA_ADDR, MARKET_ID, Side.BID, ORDER_ID, 50
+            ),
+            lambda: templates.change_order_size(Side.BID, ORDER_ID, 50),
+        ),
+    ]
+    print(f"{'entry function':<30}{'build':>22}{'build + serialize':>30}")
+    for name, build, build_template in cases:
+        assert serialize(build()) == serialize(build_template())
+        row = f"{name:<30}"
+        for run in [
+            lambda f: f(),
+            lambda f: serialize(f()),
+        ]:
+            legacy = min(timeit.repeat(lambda: run(build), number=N, repeat=3))
+            template = min(
+                timeit.repeat(lambda: run(build_template), number=N, repeat=3)
+            )
+            row += f"{legacy / N * 1e6:>9.2f} -> {template / N * 1e6:.2f} us"
+        print(row)
+
+
+if __name__ == "__main__":
+    start()
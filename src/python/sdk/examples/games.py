@@ -12,6 +12,7 @@ from aptos_sdk.bcs import Serializer, encoder
 from aptos_sdk.transactions import EntryFunction, ModuleId
 from aptos_sdk.type_tag import StructTag, TypeTag
 
+from econia_sdk.confirmations import AsyncConfirmationTracker
 from econia_sdk.entry.market import (
     place_limit_order_user_entry,
     place_market_order_user_entry,
@@ -131,6 +132,8 @@ def start():
 
 async def gen_start():
     rest_client = RestClient(NODE_URL)
+    # One poller confirms the transactions of all clients.
+    confirmations = AsyncConfirmationTracker(rest_client)
     faucet_client = FaucetClient(FAUCET_URL, rest_client)
     viewer = EconiaViewer(NODE_URL, ECONIA_ADDR)
     market_id = get_market_id_base_coin(
@@ -152,10 +155,13 @@ async def gen_start():
                     Account.load_key(private_key),
                     None,
                     rest_client,
+                    confirmations=confirmations,
                 )
             )
     if market_id is None:
-        econia_client = await setup_client(faucet_client, rest_client, False)
+        econia_client = await setup_client(
+            faucet_client, rest_client, False, confirmations=confirmations
+        )
         await faucet_client.fund_account(
             econia_client.user_account.account_address.hex(), 1 * (10**8)
         )
@@ -193,13 +199,16 @@ async def gen_start():
 
     n = 2
     if private_keys is None:
-        econia_client = await setup_client(faucet_client, rest_client, False)
+        econia_client = await setup_client(
+            faucet_client, rest_client, False, confirmations=confirmations
+        )
         for i in range(n):  # type: ignore
             task = await setup_client(
                 faucet_client,
                 rest_client,
                 True,
                 econia_client,
+                confirmations,
             )
             clients.append(task)
             print(f"Client #{i} done!")
@@ -344,9 +353,12 @@ async def setup_client(
     rest: RestClient,
     add: bool,
     econia: Optional[EconiaClient] = None,
+    confirmations: Optional[AsyncConfirmationTracker] = None,
 ) -> EconiaClient:
     account = Account.generate()
-    client = EconiaClient(NODE_URL, ECONIA_ADDR, account, None, rest)
+    client = EconiaClient(
+        NODE_URL, ECONIA_ADDR, account, None, rest, confirmations=confirmations
+    )
     if econia is None:
         await faucet.fund_account(account.address().hex(), 1 * (10**8))
     else:
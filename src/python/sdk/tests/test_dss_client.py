@@ -0,0 +1,186 @@
+import unittest
+from typing import List, Tuple
+
+import httpx
+
+from econia_sdk.dss.client import EVENT_KEYSET, DssClient, Query
+
+BASE_URL = "http://dss.test"
+
+
+def make_fill(txn_version: int, event_idx: int) -> dict:
+    return {"txn_version": txn_version, "event_idx": event_idx, "price": 100}
+
+
+# Two events per transaction, in keyset order.
+FILLS = [
+    make_fill(txn_version, event_idx)
+    for txn_version in (10, 11, 12)
+    for event_idx in (0, 1)
+]
+
+
+class MockDss:
+    """
+    Serves `pages` in turn, recording the path and query parameters of
+    each request.
+    """
+
+    pages: List[list]
+    requests: List[Tuple[str, List[Tuple[str, str]]]]
+
+    def __init__(self, pages: List[list]):
+        self.pages = list(pages)
+        self.requests = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.url.path, request.url.params.multi_items()))
+        return httpx.Response(200, json=self.pages.pop(0))
+
+    def get_client(self, page_size: int) -> DssClient:
+        return DssClient(
+            BASE_URL,
+            client=httpx.Client(transport=httpx.MockTransport(self.handle)),
+            page_size=page_size,
+        )
+
+
+class TestQuery(unittest.TestCase):
+    def test_filters(self):
+        query = (
+            Query("fill_events")
+            .eq("market_id", 1)
+            .is_("maker_address", None)
+            .select("txn_version", "price")
+            .order("txn_version", descending=True)
+            .limit(10)
+        )
+        self.assertEqual(query.path, "/fill_events")
+        self.assertEqual(
+            query.get_params(),
+            (
+                ("market_id", "eq.1"),
+                ("maker_address", "is.null"),
+                ("select", "txn_version,price"),
+                ("order", "txn_version.desc"),
+                ("limit", "10"),
+            ),
+        )
+
+    def test_in_quotes_reserved_characters(self):
+        query = Query("/orders").in_(
+            "user", ["0xab", "a,b", 'say "hi"', "x\\y,z", None]
+        )
+        self.assertEqual(
+            query.get_params(),
+            (("user", 'in.(0xab,"a,b","say \\"hi\\"","x\\\\y,z",null)'),),
+        )
+
+    def test_after_single_column(self):
+        query = Query("/fill_events").after(["txn_version"], FILLS[0])
+        self.assertEqual(query.get_params(), (("txn_version", "gt.10"),))
+        query = query.after(["txn_version"], FILLS[2], descending=True)
+        self.assertEqual(query.get_params(), (("txn_version", "lt.11"),))
+
+    def test_after_keyset(self):
+        query = Query("/fill_events").after(EVENT_KEYSET, FILLS[1])
+        self.assertEqual(
+            query.get_params(),
+            (
+                ("txn_version", "gte.10"),
+                ("or", "(txn_version.gt.10,and(txn_version.eq.10,event_idx.gt.1))"),
+            ),
+        )
+        query = Query("/fill_events").after(EVENT_KEYSET, FILLS[1], descending=True)
+        self.assertEqual(
+            query.get_params(),
+            (
+                ("txn_version", "lte.10"),
+                ("or", "(txn_version.lt.10,and(txn_version.eq.10,event_idx.lt.1))"),
+            ),
+        )
+
+    def test_after_quotes_keyset_values(self):
+        row = {"start_time": "2023-01-01T00:00:00", "market_id": 1, "resolution": 60}
+        query = Query("/candlesticks").after(
+            ("start_time", "market_id", "resolution"), row
+        )
+        self.assertEqual(
+            query.get_params(),
+            (
+                ("start_time", "gte.2023-01-01T00:00:00"),
+                (
+                    "or",
+                    '(start_time.gt."2023-01-01T00:00:00",'
+                    'and(start_time.eq."2023-01-01T00:00:00",market_id.gt.1),'
+                    'and(start_time.eq."2023-01-01T00:00:00",market_id.eq.1,'
+                    "resolution.gt.60))",
+                ),
+            ),
+        )
+
+
+class TestDssClient(unittest.TestCase):
+    def test_iter_keyset_pages(self):
+        dss = MockDss([FILLS[:4], FILLS[4:]])
+        query = Query("/fill_events").eq("market_id", 1)
+        pages = list(dss.get_client(4).iter_keyset_pages(query, EVENT_KEYSET))
+        self.assertEqual(pages, [FILLS[:4], FILLS[4:]])
+        # The second page is short, so no third one is requested.
+        self.assertEqual(
+            dss.requests,
+            [
+                (
+                    "/fill_events",
+                    [
+                        ("market_id", "eq.1"),
+                        ("order", "txn_version.asc,event_idx.asc"),
+                        ("limit", "4"),
+                    ],
+                ),
+                (
+                    "/fill_events",
+                    [
+                        ("market_id", "eq.1"),
+                        ("txn_version", "gte.11"),
+                        (
+                            "or",
+                            "(txn_version.gt.11,and(txn_version.eq.11,event_idx.gt.1))",
+                        ),
+                        ("order", "txn_version.asc,event_idx.asc"),
+                        ("limit", "4"),
+                    ],
+                ),
+            ],
+        )
+
+    def test_iter_keyset_pages_descending(self):
+        fills = FILLS[::-1]
+        dss = MockDss([fills[:3], fills[3:], []])
+        pages = list(
+            dss.get_client(3).iter_keyset_pages(
+                Query("/fill_events"), EVENT_KEYSET, descending=True
+            )
+        )
+        # A full last page takes one more, empty, request to tell.
+        self.assertEqual(pages, [fills[:3], fills[3:]])
+        self.assertEqual(len(dss.requests), 3)
+        self.assertEqual(
+            dss.requests[2][1],
+            [
+                ("txn_version", "lte.10"),
+                ("or", "(txn_version.lt.10,and(txn_version.eq.10,event_idx.lt.0))"),
+                ("order", "txn_version.desc,event_idx.desc"),
+                ("limit", "3"),
+            ],
+        )
+
+    def test_iter_rows(self):
+        dss = MockDss([FILLS[:5], FILLS[5:]])
+        rows = list(dss.get_client(5).iter_rows(Query("/fill_events"), EVENT_KEYSET))
+        self.assertEqual(rows, FILLS)
+        self.assertEqual(len(dss.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
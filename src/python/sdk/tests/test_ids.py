@@ -0,0 +1,159 @@
+import os
+import re
+import unittest
+
+from econia_sdk.utils import ids
+
+try:
+    import numpy  # noqa: F401
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MOVE_SOURCES = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "move", "econia", "sources"
+)
+
+
+def get_move_constant(module: str, name: str) -> int:
+    with open(os.path.join(MOVE_SOURCES, f"{module}.move")) as f:
+        source = f.read()
+    match = re.search(rf"const {name}: \w+ = (\w+);", source)
+    assert match is not None, f"{name} not found in {module}.move"
+    value = match.group(1)
+    if value in ("true", "false"):
+        return int(value == "true")
+    return int(value, 0)
+
+
+@unittest.skipUnless(os.path.isdir(MOVE_SOURCES), "Move sources not found")
+class TestMoveConstants(unittest.TestCase):
+    def test_market_constants(self):
+        self.assertEqual(
+            ids.SHIFT_COUNTER, get_move_constant("market", "SHIFT_COUNTER")
+        )
+        self.assertEqual(ids.HI_PRICE, get_move_constant("market", "HI_PRICE"))
+        self.assertEqual(ids.HI_64, get_move_constant("market", "HI_64"))
+        self.assertEqual(ids.NIL, get_move_constant("market", "NIL"))
+        self.assertEqual(
+            ids.E_ORDER_DID_NOT_POST,
+            get_move_constant("market", "E_ORDER_DID_NOT_POST"),
+        )
+
+    def test_user_constants(self):
+        self.assertEqual(
+            ids.SHIFT_MARKET_ID, get_move_constant("user", "SHIFT_MARKET_ID")
+        )
+        self.assertEqual(ids.HI_PRICE, get_move_constant("user", "HI_PRICE"))
+        self.assertEqual(ids.HI_64, get_move_constant("user", "HI_64"))
+
+    def test_sort_order_bit(self):
+        self.assertEqual(
+            ids.SHIFT_ACCESS_SORT_ORDER,
+            get_move_constant("avl_queue", "SHIFT_ACCESS_SORT_ORDER"),
+        )
+        # Asks are in ascending AVL queues, flagged by a set sort order
+        # bit, and bids in descending ones.
+        self.assertEqual(get_move_constant("market", "ASK"), 1)
+        self.assertEqual(get_move_constant("market", "ASCENDING"), 1)
+        self.assertEqual(get_move_constant("avl_queue", "BIT_FLAG_ASCENDING"), 1)
+        self.assertEqual(get_move_constant("avl_queue", "HI_BIT"), 1)
+
+
+def make_order_id(counter: int, price: int, is_ask: bool) -> int:
+    # As `avl_queue::insert` builds the access key, with a zero list
+    # node ID above the sort order bit, and `market` prefixes the
+    # counter.
+    access_key = (int(is_ask) << ids.SHIFT_ACCESS_SORT_ORDER) | price
+    return (counter << ids.SHIFT_COUNTER) | access_key
+
+
+ORDER_IDS = [
+    (counter, price, is_ask)
+    for counter in (0, 1, ids.HI_64)
+    for price in (1, ids.HI_PRICE)
+    for is_ask in (True, False)
+]
+
+MARKET_ACCOUNTS = [
+    (market_id, custodian_id)
+    for market_id in (0, 1, ids.HI_64)
+    for custodian_id in (0, 1, ids.HI_64)
+]
+
+
+class TestCodec(unittest.TestCase):
+    def test_order_id_round_trip(self):
+        for counter, price, is_ask in ORDER_IDS:
+            order_id = make_order_id(counter, price, is_ask)
+            self.assertTrue(ids.did_order_post(order_id))
+            self.assertEqual(ids.get_market_order_id_counter(order_id), counter)
+            self.assertEqual(ids.get_market_order_id_price(order_id), price)
+            self.assertEqual(ids.get_posted_order_id_side(order_id), is_ask)
+
+    def test_order_did_not_post(self):
+        for order_id in (0, ids.HI_64 << ids.SHIFT_COUNTER):
+            self.assertFalse(ids.did_order_post(order_id))
+            with self.assertRaises(ValueError):
+                ids.get_market_order_id_price(order_id)
+            with self.assertRaises(ValueError):
+                ids.get_posted_order_id_side(order_id)
+        self.assertEqual(
+            ids.get_market_order_id_counter(ids.HI_64 << ids.SHIFT_COUNTER), ids.HI_64
+        )
+
+    def test_market_account_id_round_trip(self):
+        for market_id, custodian_id in MARKET_ACCOUNTS:
+            market_account_id = ids.get_market_account_id(market_id, custodian_id)
+            self.assertLess(market_account_id, 1 << 128)
+            self.assertEqual(ids.get_market_id(market_account_id), market_id)
+            self.assertEqual(ids.get_custodian_id(market_account_id), custodian_id)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestVectorizedCodec(unittest.TestCase):
+    def test_split_join_u128(self):
+        values = [make_order_id(*order_id) for order_id in ORDER_IDS] + [0]
+        hi, lo = ids.split_u128(values)
+        self.assertEqual(ids.join_u128(hi, lo), values)
+
+    def test_order_ids_match_codec(self):
+        order_ids = [make_order_id(*order_id) for order_id in ORDER_IDS]
+        hi, lo = ids.split_u128(order_ids)
+        self.assertEqual(
+            list(ids.did_orders_post(lo)), [ids.did_order_post(i) for i in order_ids]
+        )
+        self.assertEqual(
+            [int(c) for c in ids.get_market_order_id_counters(hi)],
+            [ids.get_market_order_id_counter(i) for i in order_ids],
+        )
+        self.assertEqual(
+            [int(p) for p in ids.get_market_order_id_prices(lo)],
+            [ids.get_market_order_id_price(i) for i in order_ids],
+        )
+        self.assertEqual(
+            [bool(s) for s in ids.get_posted_order_id_sides(lo)],
+            [ids.get_posted_order_id_side(i) for i in order_ids],
+        )
+
+    def test_orders_did_not_post(self):
+        hi, lo = ids.split_u128([make_order_id(1, 1, True), 1 << ids.SHIFT_COUNTER])
+        self.assertEqual(list(ids.did_orders_post(lo)), [True, False])
+        with self.assertRaises(ValueError):
+            ids.get_market_order_id_prices(lo)
+        with self.assertRaises(ValueError):
+            ids.get_posted_order_id_sides(lo)
+
+    def test_market_account_ids_match_codec(self):
+        market_ids = [market_id for market_id, _ in MARKET_ACCOUNTS]
+        custodian_ids = [custodian_id for _, custodian_id in MARKET_ACCOUNTS]
+        hi, lo = ids.get_market_account_ids(market_ids, custodian_ids)
+        self.assertEqual(
+            ids.join_u128(hi, lo),
+            [ids.get_market_account_id(m, c) for m, c in MARKET_ACCOUNTS],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()